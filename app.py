@@ -1,14 +1,16 @@
-from io import BytesIO
-from typing import Dict, Any, cast
+import time
 
-import pandas as pd
 import streamlit as st
 
-from constants import REQUIRED_COLS
-from styles import inject_styles
-from components.left_panel import render_left_panel
-from components.right_panel import render_right_panel
-from utils.download import build_download_df
+from constants import PRERENDER_AHEAD
+from styles import inject_styles, logo_bytes
+from components import fragments
+from components.profiling_panel import debug_panel_visible, render_profiling_panel
+from components.shared_panel import render_shared_panel
+from utils import profiling
+
+# pandas/numpy 를 쓰는 모듈은 실제로 필요한 구간에서 import (모듈 캐시로 두 번째부터는 비용 없음).
+# 업로드 전 첫 화면은 streamlit 만으로 그려 콜드 스타트를 줄임.
 
 # ---------------- App Config ----------------
 st.set_page_config(
@@ -16,121 +18,306 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded",
 )
+# 계측이 꺼져 있으면 아무것도 기록하지 않음 (EMR_EVAL_PROFILE=1 또는 디버그 패널에서 켜기)
+profiling.begin_run()
+# 이번 전체 실행에서 그려지는 조각(st.fragment)을 새로 모음 (invalidate 대상 판별용)
+fragments.begin_full_run()
 
 # ---------------- Session State ----------------
 if "df" not in st.session_state:
     st.session_state.df = None
 if "answers" not in st.session_state:
-    st.session_state.answers = cast(Dict[int, Dict[str, Any]], {})
+    st.session_state.answers = None
 if "current_idx" not in st.session_state:
     st.session_state.current_idx = 0
-if "ignore_radio_once" not in st.session_state:
-    st.session_state.ignore_radio_once = False
+if "nav_ids" not in st.session_state:
+    st.session_state.nav_ids = None
+    st.session_state.nav_id_index = {}
 if "upload_token" not in st.session_state:
     st.session_state.upload_token = None
+if "dataset_digest" not in st.session_state:
+    st.session_state.dataset_handle = None
+    st.session_state.dataset_digest = None
+    st.session_state.dataset_name = None
+if "journal" not in st.session_state:
+    st.session_state.journal = None
+if "sections" not in st.session_state:
+    st.session_state.sections = None
+if "ingest_stats" not in st.session_state:
+    st.session_state.ingest_stats = None
+if "export" not in st.session_state:
+    st.session_state.export = None
+if "scorer" not in st.session_state:
+    st.session_state.scorer = None
 
 # ---------------- Global Styles ----------------
 inject_styles()
 
-# ---------------- Sidebar: Upload ----------------
-from PIL import Image
-import streamlit as st
+# ---------------- Dataset Loading / Activation ----------------
+def load_upload_tables(file, digest):
+    """업로드 파일 → (df, 섹션 테이블, 처리 통계). 디스크 캐시가 있으면 파싱 생략."""
+    from utils.ingest import preprocess_sections
+    from utils.loader import read_upload
+    from utils.upload_cache import load_cached, store_cached
+
+    # 캐시 적중 시 처리 시간은 Arrow 파일 읽기 시간
+    t0 = time.perf_counter()
+    cached = load_cached(digest)
+    if cached is not None:
+        df, sections = cached
+        elapsed = time.perf_counter() - t0
+        stats = {
+            "rows": len(df),
+            "seconds": elapsed,
+            "rows_per_sec": len(df) / elapsed if elapsed > 0 else 0.0,
+            "workers": 1,
+            "cached": True,
+        }
+        return df, sections, stats
+    # 헤더 검증 후 필요한 컬럼만 스트리밍으로 읽음
+    df = read_upload(file)
+    # 업로드 시점에 전체 생성결과를 한 번에 섹션 파싱
+    sections, stats = preprocess_sections(df)
+    store_cached(digest, df, sections)
+    return df, sections, stats
+
+
+def load_shared_tables(digest):
+    from utils.ingest import preprocess_sections
+    from utils.shared_store import get_store
+
+    df = get_store().load_frame(digest)
+    sections, stats = preprocess_sections(df)
+    return df, sections, stats
+
+
+def replace_export(buffer):
+    """결과 버퍼 교체. 이전 버퍼의 내보내기 임시 파일은 바로 삭제."""
+    if st.session_state.export is not None and st.session_state.export is not buffer:
+        st.session_state.export.close()
+    st.session_state.export = buffer
+
+
+def activate_dataset(handle, name):
+    """공유 데이터셋 핸들을 현재 세션의 작업 대상으로 설정 (DataFrame 은 복사하지 않음)."""
+    from components.navigator import build_row_index
+    from utils.answer_store import AnswerStore
+    from utils.download import DownloadBuffer
+    from utils.journal import open_journal
+    from utils.search import ensure_index
+    from utils.similarity import RowScorer
+
+    # 같은 파일의 이전 작업이 있으면 스냅샷 + 저널에서 답변 복원 (공유 모드는 평가자별 저널)
+    if st.session_state.journal is not None:
+        st.session_state.journal.close()
+    owner = st.session_state.get("reviewer_id") if st.session_state.get("shared_mode") else None
+    journal = open_journal(handle.digest, owner)
+    restored = journal.load() if journal is not None else {}
+    stats = dict(handle.stats, restored=len(restored))
+
+    df = handle.df
+    st.session_state.dataset_handle = handle
+    st.session_state.df = df
+    st.session_state.dataset_digest = handle.digest
+    st.session_state.dataset_name = name
+    st.session_state.journal = journal
+    st.session_state.sections = handle.sections
+    st.session_state.ingest_stats = stats
+    st.session_state.current_idx = 0
+    answers = AnswerStore(len(df), restored)
+    st.session_state.answers = answers
+    replace_export(DownloadBuffer(df, answers, handle.sections))
+    st.session_state.scorer = RowScorer()
+    st.session_state.nav_ids, st.session_state.nav_id_index = build_row_index(df)
+    st.session_state.nav_last_idx = None
+    st.session_state.search_cache = None
+    # 새 답변 저장소에는 중앙 저장소의 답변이 없으므로 공유 모드 동기화를 처음부터 다시 재생
+    st.session_state.shared_seq = 0
+    # 본문 검색 색인은 백그라운드에서 만들어 업로드 직후 화면을 막지 않음
+    ensure_index(handle.digest, df, handle.sections)
+
+
+# ---------------- Fragments ----------------
+# 조각 안에서는 인자 대신 세션 상태를 읽음 (조각만 다시 실행될 때는 마지막 전체 실행의 인자가 재사용됨)
+def render_top_progress():
+    answers = st.session_state.answers
+    progress = answers.progress if answers is not None else None
+    total = progress.total if progress is not None else 0
+    done = progress.done if progress is not None else 0
+    remaining = max(total - done, 0)
+    with st.container():
+        st.markdown("<div class='fixed-progress'>", unsafe_allow_html=True)
+        c1, c2, c3 = st.columns([2, 1, 1])
+        with c1:
+            st.subheader("진행 현황")
+            if total > 0:
+                st.progress(done / total)
+        with c2:
+            st.metric("완료", f"{done} / {total}")
+        with c3:
+            st.metric("남은 문항", f"{remaining}")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+
+@fragments.fragment(fragments.PROGRESS)
+def render_progress(where: str):
+    """진행 현황 (상단/사이드바 두 곳이 같은 키로 함께 다시 그려짐)."""
+    if where == "top":
+        render_top_progress()
+        return
+    progress = st.session_state.answers.progress
+    st.progress(progress.ratio())
+    st.caption(f"완료 {progress.done} / 총 {progress.total} | 남은 {progress.remaining}")
+
+
+@fragments.fragment(fragments.NAV)
+def navigator_fragment():
+    from components.navigator import render_navigator
 
-logo = Image.open("assets/shl_logo.png")
+    render_navigator(st.container(), st.session_state.answers.progress)
 
+
+@fragments.fragment(fragments.SEARCH)
+def search_fragment():
+    from components.search_panel import render_search_panel
+    from utils.search import build_error, ensure_index
+
+    digest = st.session_state.dataset_digest
+    index = ensure_index(digest, st.session_state.df, st.session_state.sections)
+    render_search_panel(st.container(), index, st.session_state.answers.progress, build_error(digest))
+
+
+@fragments.fragment(fragments.EXPORT)
+def export_fragment():
+    from components.export_panel import render_export_panel
+    from utils.download import DownloadBuffer
+
+    # 답변 저장소의 컬럼을 그대로 쓰는 결과 버퍼 (저장소가 바뀌면 다시 연결)
+    export = st.session_state.export
+    if export is None or export.store is not st.session_state.answers:
+        export = DownloadBuffer(st.session_state.df, st.session_state.answers, st.session_state.sections)
+        replace_export(export)
+    if st.session_state.answers.progress.all_done:
+        # 결과 파일은 백그라운드 스레드에서 만들고, 답변이 바뀔 때까지 재사용
+        render_export_panel(st.container(), export)
+    else:
+        st.caption("모든 항목 저장 완료 후 다운로드가 활성화됩니다.")
+
+
+def current_row_sections(idx):
+    sections = st.session_state.sections
+    with profiling.span("app.row_sections"):
+        return row_sections(sections, idx) if sections is not None else None
+
+
+@fragments.fragment(fragments.LEFT)
+def left_fragment():
+    idx = st.session_state.current_idx
+    df = st.session_state.df
+    render_left_panel(st.container(), df.iloc[idx], idx, current_row_sections(idx))
+    # "다음 ▶" 이동이 즉시 그려지도록 이후 행을 백그라운드에서 미리 렌더링
+    prerender_rows(df, idx + 1, PRERENDER_AHEAD, st.session_state.sections)
+
+
+@fragments.fragment(fragments.FORM)
+def form_fragment():
+    idx = st.session_state.current_idx
+    prev = st.session_state.answers.get(idx)
+    render_right_panel(st.container(), idx, prev, st.session_state.df, current_row_sections(idx))
+
+
+# ---------------- Sidebar: Upload ----------------
 with st.sidebar:
-    st.image(logo, use_container_width=True)
+    # 로고 바이트는 프로세스당 한 번만 읽음 (PIL 디코딩 없이 그대로 전달)
+    st.image(logo_bytes(), use_container_width=True)
     st.markdown("")
 
 st.sidebar.header("1️⃣ 평가 데이터 업로드")
 file = st.sidebar.file_uploader("엑셀(.xlsx) 또는 CSV 업로드", type=["xlsx", "csv"])
 
 if file is not None:
-    token = (file.name, getattr(file, "size", None))
+    # file_id 는 업로드마다 새로 발급되므로 같은 이름/크기의 변경 파일도 구분됨
+    token = (getattr(file, "file_id", None), file.name, getattr(file, "size", None))
     if token != st.session_state.upload_token:
+        from utils.loader import MissingColumnsError
+        from utils.registry import get_registry
+        from utils.upload_cache import file_digest
+
         try:
-            if file.name.lower().endswith(".xlsx"):
-                df = pd.read_excel(file, engine="openpyxl")
-            else:
-                file.seek(0)
-                try:
-                    df = pd.read_csv(file)
-                except UnicodeDecodeError:
-                    file.seek(0)
-                    df = pd.read_csv(file, encoding="cp949")
-
-            # 컬럼 정리
-            df.columns = [str(c).strip() for c in df.columns]
-            missing = [c for c in REQUIRED_COLS if c not in df.columns]
-            if missing:
-                st.sidebar.error(f"필수 컬럼 누락: {', '.join(missing)}")
-                st.sidebar.write("현재 컬럼:", list(df.columns))
-            else:
-                st.session_state.df = df
-                st.session_state.current_idx = 0
-                st.session_state.answers = {}
-                st.session_state.ignore_radio_once = True
-                st.session_state.upload_token = token
-                st.rerun()
+            digest = file_digest(file)
+            # 같은 파일을 연 세션이 있으면 프로세스에 올라온 데이터셋을 그대로 공유
+            with profiling.span("app.load_upload"):
+                handle = get_registry().acquire(digest, lambda: load_upload_tables(file, digest))
+                activate_dataset(handle, file.name)
+            st.session_state.upload_token = token
+            st.rerun()
+        except MissingColumnsError as e:
+            st.sidebar.error(f"필수 컬럼 누락: {', '.join(e.missing)}")
+            st.sidebar.write("현재 컬럼:", e.columns)
         except Exception as e:
             st.sidebar.exception(e)
 
+if st.session_state.ingest_stats:
+    ingest = st.session_state.ingest_stats
+    st.sidebar.caption(
+        ("캐시 " if ingest.get("cached") else "전처리 ")
+        + f"{ingest['rows']:,}행 · {ingest['seconds']:.2f}초 · {ingest['rows_per_sec']:,.0f}행/초"
+        + (f" · 워커 {ingest['workers']}개" if ingest["workers"] > 1 else "")
+    )
+    if ingest.get("restored"):
+        st.sidebar.caption(f"이전 작업 {ingest['restored']:,}건을 복원했습니다.")
+
+# ---------------- Sidebar: Shared Mode ----------------
+shared_digest = render_shared_panel(st.sidebar)
+if shared_digest is not None:
+    from utils.registry import get_registry
+
+    try:
+        with profiling.span("app.load_shared"):
+            handle = get_registry().acquire(shared_digest, lambda: load_shared_tables(shared_digest))
+            activate_dataset(handle, None)
+        st.rerun()
+    except Exception as e:
+        st.sidebar.exception(e)
+
 # ---------------- Sidebar: Progress / Navigation ----------------
 st.sidebar.divider()
 st.sidebar.subheader("2️⃣ 진행 현황 / 항목 이동")
 
 if st.session_state.df is not None:
-    df = st.session_state.df
-    options = list(range(len(df)))
-
-    def label_for(i: int) -> str:
-        row_id = str(df.iloc[i]["구분자"])
-        done = st.session_state.answers.get(i, {}).get("saved", False)
-        return ("✅ " if done else "⬜ ") + row_id
-
-    chosen = st.sidebar.radio(
-        "항목 선택",
-        options=options,
-        format_func=label_for,
-        index=st.session_state.current_idx if options else 0,
-        label_visibility="collapsed",
-        key="nav_radio",
-    )
-    if st.session_state.ignore_radio_once:
-        st.session_state.ignore_radio_once = False
-    else:
-        if chosen is not None and chosen != st.session_state.current_idx:
-            st.session_state.current_idx = int(chosen)
+    from components.navigator import build_row_index
+    from utils.answer_store import AnswerStore
 
-    total = len(df)
-    done = sum(1 for v in st.session_state.answers.values() if v.get("saved"))
-    st.sidebar.progress(0 if total == 0 else done / total)
-    st.sidebar.caption(f"완료 {done} / 총 {total} | 남은 {max(total - done, 0)}")
+    df = st.session_state.df
+    if st.session_state.nav_ids is None or len(st.session_state.nav_ids) != len(df):
+        st.session_state.nav_ids, st.session_state.nav_id_index = build_row_index(df)
+    # 답변 저장소 (진행 현황 포함). 세션 복원 등으로 없으면 빈 저장소로 시작
+    answers = st.session_state.answers
+    if answers is None or len(answers) != len(df):
+        answers = AnswerStore(len(df))
+        st.session_state.answers = answers
+        replace_export(None)
+    with st.sidebar:
+        navigator_fragment()
+        if st.session_state.dataset_digest is not None:
+            search_fragment()
+        render_progress("sidebar")
 else:
     st.sidebar.info("엑셀 업로드 후 진행 현황이 표시됩니다.")
+st.sidebar.radio("화면", ["평가", "통계", "일치도"], horizontal=True, key="view_mode")
+st.sidebar.toggle("간결 입력 모드", key="compact_form", help="평가 기준을 접고 리커트 점수를 5자리 숫자로 입력합니다.")
 
 # ---------------- Sidebar: Download ----------------
 st.sidebar.divider()
 st.sidebar.subheader("3️⃣ 결과 다운로드")
 
 if st.session_state.df is not None:
-    out_df = build_download_df(st.session_state.df, st.session_state.answers)
-    all_done = (
-        len(st.session_state.df) > 0
-        and sum(1 for v in st.session_state.answers.values() if v.get("saved")) == len(st.session_state.df)
-    )
-    if all_done and not out_df.empty:
-        buffer = BytesIO()
-        with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-            out_df.to_excel(writer, index=False, sheet_name="results")
-        st.sidebar.download_button(
-            label="모두 완료됨: 결과 엑셀 다운로드",
-            data=buffer.getvalue(),
-            file_name="evaluation_results.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
-    else:
-        st.sidebar.caption("모든 항목 저장 완료 후 다운로드가 활성화됩니다.")
+    with st.sidebar:
+        export_fragment()
+
+# ---------------- Sidebar: Debug ----------------
+if debug_panel_visible():
+    render_profiling_panel(st.sidebar)
 
 # ---------------- Title & Top Progress ----------------
 st.markdown(
@@ -138,25 +325,14 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-def render_top_progress():
-    df = st.session_state.df
-    total = len(df) if df is not None else 0
-    done = sum(1 for v in st.session_state.answers.values() if v.get("saved"))
-    remaining = max(total - done, 0)
-    with st.container():
-        st.markdown("<div class='fixed-progress'>", unsafe_allow_html=True)
-        c1, c2, c3 = st.columns([2, 1, 1])
-        with c1:
-            st.subheader("진행 현황")
-            if total > 0:
-                st.progress(done / total)
-        with c2:
-            st.metric("완료", f"{done} / {total}")
-        with c3:
-            st.metric("남은 문항", f"{remaining}")
-        st.markdown("</div>", unsafe_allow_html=True)
+render_progress("top")
+
+# ---------------- Agreement View (업로드 데이터 없이도 사용) ----------------
+if st.session_state.get("view_mode") == "일치도":
+    from components.agreement_panel import render_agreement_panel
 
-render_top_progress()
+    render_agreement_panel(st.container())
+    st.stop()
 
 # ---------------- Stop if no data ----------------
 if st.session_state.df is None:
@@ -165,27 +341,31 @@ if st.session_state.df is None:
     )
     st.stop()
 
+# ---------------- Analytics View ----------------
+if st.session_state.get("view_mode") == "통계":
+    from components.analytics_panel import render_analytics_panel
+
+    render_analytics_panel(st.container(), st.session_state.answers.stats)
+    st.stop()
+
+from components.left_panel import render_left_panel, prerender_rows
+from components.navigator import step
+from components.right_panel import render_right_panel
+from utils.ingest import row_sections
+from utils.similarity import RowScorer
+
+if st.session_state.scorer is None:
+    st.session_state.scorer = RowScorer()
+
 # ---------------- Navigation Buttons ----------------
-n_rows = len(st.session_state.df)
+# 콜백에서 현재 행을 바꾸고 패널/항목 이동 조각만 다시 그림
 nav_left, nav_right = st.columns([1, 1])
-with nav_left:
-    if st.button("◀ 이전"):
-        st.session_state.current_idx = max(0, st.session_state.current_idx - 1)
-        st.session_state.ignore_radio_once = True
-        st.rerun()
-with nav_right:
-    if st.button("다음 ▶"):
-        st.session_state.current_idx = min(n_rows - 1, st.session_state.current_idx + 1)
-        st.session_state.ignore_radio_once = True
-        st.rerun()
-
-# ---------------- Current Row ----------------
-idx = st.session_state.current_idx
-row = st.session_state.df.iloc[idx]
-prev = st.session_state.answers.get(idx, {})
+nav_left.button("◀ 이전", key="nav_prev", on_click=step, args=(-1,))
+nav_right.button("다음 ▶", key="nav_next", on_click=step, args=(1,))
 
 # ---------------- Two-Panel Layout (좌:우 = 5:7) ----------------
 left, right = st.columns([5, 7])
-
-render_left_panel(left, row, idx)
-render_right_panel(right, idx, prev, st.session_state.df)
\ No newline at end of file
+with left:
+    left_fragment()
+with right:
+    form_fragment()
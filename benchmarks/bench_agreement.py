@@ -0,0 +1,33 @@
+# benchmarks/bench_agreement.py
+"""평가자 간 일치도(agreement_report) 벤치마크.
+
+실행: python -m benchmarks.bench_agreement [--raters 200] [--items 1000] [--coverage 0.6] [--reps 1000]
+"""
+import argparse
+import time
+
+from benchmarks.corpus import make_ratings
+from utils.agreement import SCORE_COLUMNS, agreement_report
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--raters", type=int, default=200)
+    ap.add_argument("--items", type=int, default=1000)
+    ap.add_argument("--coverage", type=float, default=0.6)
+    ap.add_argument("--reps", type=int, default=1000)
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args()
+
+    ratings = make_ratings(args.raters, args.items, args.coverage)
+    t0 = time.perf_counter()
+    report, stats = agreement_report(ratings, reps=args.reps, workers=args.workers)
+    elapsed = time.perf_counter() - t0
+
+    print(f"ratings : {len(ratings):,} ({args.raters} raters × {args.items:,} items)")
+    print(f"report  : {elapsed:.2f} s (bootstrap {args.reps} reps × {len(SCORE_COLUMNS)} criteria)")
+    print(report.round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/bench_export.py
+"""결과 내보내기 벤치마크: 기존 pd.ExcelWriter(openpyxl) vs utils.exporters 백엔드.
+
+측정 전에 특수 값(결측, ±inf, 제어 문자 등)이 든 작은 표로 xlsx 왕복(pd.read_excel) 검사.
+형식별 소요 시간, 파일 크기와 (--memory) tracemalloc 최대 메모리를 출력.
+(pyarrow 의 네이티브 할당은 tracemalloc 에 잡히지 않으므로 parquet 메모리는 참고용)
+실행: python -m benchmarks.bench_export [--rows 50000] [--text-len 400] [--memory]
+"""
+import argparse
+import math
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from benchmarks.corpus import make_results
+from constants import EMR_SECTIONS
+from utils.exporters import FORMATS, export_frame
+
+
+def _same(a, b) -> bool:
+    if isinstance(a, float) and math.isnan(a):
+        return isinstance(b, float) and math.isnan(b)
+    return a == b
+
+
+def check_roundtrip() -> List[str]:
+    """xlsx 백엔드로 쓴 특수 값이 pd.read_excel 로 다시 읽히는지 확인. 불일치 목록 반환."""
+    inf = float("inf")
+    df = pd.DataFrame(
+        {
+            "float": [1.5, float("nan"), inf, -inf],
+            "int": [1, -2, 0, 10**12],
+            "bool": [True, False, True, False],
+            "text": ["가 & <b>", "줄\n바꿈", "", "제어\x01문자"],
+            "mixed": [None, 3, -inf, "문자열"],
+        }
+    )
+    # 읽었을 때 기대값: ±inf 는 문자열 "inf"/"-inf", 빈 문자열·None 은 결측, 제어 문자는 제거
+    expected = {
+        "float": [1.5, float("nan"), "inf", "-inf"],
+        "int": [1, -2, 0, 10**12],
+        "bool": [True, False, True, False],
+        "text": ["가 & <b>", "줄\n바꿈", float("nan"), "제어문자"],
+        "mixed": [float("nan"), 3, "-inf", "문자열"],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "roundtrip.xlsx")
+        export_frame(df, "xlsx", path)
+        try:
+            back = pd.read_excel(path, dtype=object)
+        except Exception as e:
+            return [f"read_excel 실패: {e}"]
+    problems = []
+    if list(back.columns) != list(df.columns):
+        problems.append(f"columns: {list(back.columns)}")
+    for col, values in expected.items():
+        got = back[col].tolist() if col in back else []
+        if len(got) != len(values) or not all(_same(g, e) for g, e in zip(got, values)):
+            problems.append(f"{col}: {got!r} != {values!r}")
+    return problems
+
+
+def _legacy_xlsx(df: pd.DataFrame, path: str) -> None:
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        df.to_excel(writer, index=False, sheet_name="results")
+
+
+def _measure(write, memory: bool) -> Tuple[float, Optional[int], int]:
+    """(초, tracemalloc 최대 바이트 또는 None, 파일 크기). 결과는 임시 파일에 기록해 출력 버퍼를 메모리에서 제외."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out")
+        t0 = time.perf_counter()
+        write(path)
+        elapsed = time.perf_counter() - t0
+        peak = None
+        if memory:
+            # tracemalloc 은 할당마다 추적 비용이 커서 시간 측정과 분리해 한 번 더 실행
+            tracemalloc.start()
+            write(path)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return elapsed, peak, os.path.getsize(path)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=50000)
+    ap.add_argument("--text-len", type=int, default=400)
+    ap.add_argument("--memory", action="store_true", help="tracemalloc 최대 메모리도 측정 (느림)")
+    ap.add_argument("--skip-legacy", action="store_true", help="기존 to_excel 경로 생략 (느림)")
+    args = ap.parse_args()
+
+    problems = check_roundtrip()
+    print(f"xlsx 왕복 검사: {'OK' if not problems else f'{len(problems)}건 불일치'}")
+    for p in problems:
+        print(f"  {p}")
+
+    df = make_results(args.rows, args.text_len)
+    print(f"rows: {len(df):,} · 섹션 텍스트 ~{args.text_len}자 × {len(EMR_SECTIONS)}")
+    print(f"  {'backend':<16} {'sec':>7} {'peak MB':>9} {'file MB':>9}")
+    cases = [] if args.skip_legacy else [("xlsx (to_excel)", lambda path: _legacy_xlsx(df, path))]
+    cases += [(fmt, lambda path, fmt=fmt: export_frame(df, fmt, path)) for fmt in FORMATS]
+    for name, write in cases:
+        elapsed, peak, size = _measure(write, args.memory)
+        peak_mb = f"{peak / 2**20:9.1f}" if peak is not None else f"{'-':>9}"
+        print(f"  {name:<16} {elapsed:7.2f} {peak_mb} {size / 2**20:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
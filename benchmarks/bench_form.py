@@ -0,0 +1,68 @@
+# benchmarks/bench_form.py
+"""평가 입력 폼(right_panel) 렌더링 벤치마크: 기본 모드 vs 간결 모드.
+
+- rerun: 데이터를 올린 상태에서 재실행 중앙값 (streamlit.testing AppTest)
+- 메시지 크기: 한 번의 실행에서 프런트엔드로 보내는 요소(proto) 직렬화 바이트 합계와 요소 수
+
+실행: python -m benchmarks.bench_form [--rows 2000] [--reruns 20]
+"""
+import argparse
+import statistics
+import time
+from typing import Dict, List, Tuple
+
+from benchmarks.profile_startup import APP
+
+
+def _tree_size(node) -> Tuple[int, int]:
+    """(직렬화 바이트, 요소 수) — 블록 자신은 제외하고 하위 요소만 합산."""
+    children = getattr(node, "children", None)
+    if children is None:
+        return len(node.proto.SerializeToString()), 1
+    size = count = 0
+    for child in children.values():
+        s, c = _tree_size(child)
+        size += s
+        count += c
+    return size, count
+
+
+def measure(n_rows: int, reruns: int, compact: bool) -> Dict[str, float]:
+    from streamlit.testing.v1 import AppTest
+
+    from benchmarks.corpus import make_upload
+    from utils.ingest import preprocess_sections
+
+    df = make_upload(n_rows)
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.run()
+    at.session_state["df"] = df
+    at.session_state["sections"] = preprocess_sections(df, workers=1)[0]
+    at.session_state["compact_form"] = compact
+    at.run()
+    assert not at.exception, at.exception
+
+    times: List[float] = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+    size, count = _tree_size(at._tree)
+    return {"rerun_median_ms": statistics.median(times) * 1000, "bytes": size, "elements": count}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=2000)
+    ap.add_argument("--reruns", type=int, default=20)
+    args = ap.parse_args()
+
+    print(f"== 평가 폼 ({args.rows:,}행, 재실행 {args.reruns}회 중앙값)")
+    print(f"  {'모드':<6} {'rerun ms':>10} {'bytes':>10} {'elements':>9}")
+    for name, compact in (("기본", False), ("간결", True)):
+        r = measure(args.rows, args.reruns, compact)
+        print(f"  {name:<6} {r['rerun_median_ms']:10.1f} {r['bytes']:10,} {r['elements']:9,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# benchmarks/bench_fragments.py
+"""조작별 서버 CPU 시간: 조각(st.fragment) 부분 재실행 vs 매번 전체 실행.
+
+AppTest 로 이전/다음, 저장, 저장 후 다음을 반복하며 조작 1회의 프로세스 CPU 시간, 경과 시간,
+다시 그려진 요소 수를 잰다. 모드마다 새 프로세스에서 실행 (EMR_EVAL_FRAGMENTS 는 import 시 결정).
+--app 으로 다른 app.py (예: 이전 커밋의 worktree) 를 같은 시나리오로 잴 수 있음.
+
+실행: python -m benchmarks.bench_fragments [--rows 2000] [--reps 15]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.profile_startup import APP
+
+# (이름, 버튼 라벨)
+INTERACTIONS = [("다음", "다음 ▶"), ("이전", "◀ 이전"), ("저장", "저장"), ("저장 후 다음", "저장 후 다음")]
+
+
+def _tree_size(node) -> int:
+    children = getattr(node, "children", None) or {}
+    return 1 + sum(_tree_size(c) for c in children.values())
+
+
+def _click(at, label: str):
+    buttons = [b for b in at.button if b.label == label]
+    if not buttons:
+        raise RuntimeError(f"버튼을 찾을 수 없습니다: {label}")
+    return buttons[0].click()
+
+
+def child(app: str, n_rows: int, reps: int) -> Dict[str, Dict[str, float]]:
+    from streamlit.testing.v1 import AppTest
+
+    from benchmarks.corpus import make_upload
+    from utils.ingest import preprocess_sections
+
+    df = make_upload(n_rows)
+    at = AppTest.from_file(app, default_timeout=120)
+    at.run()
+    at.session_state["df"] = df
+    at.session_state["sections"] = preprocess_sections(df, workers=1)[0]
+    at.run()
+
+    out: Dict[str, Dict[str, float]] = {}
+    for name, label in INTERACTIONS:
+        cpu: List[float] = []
+        wall: List[float] = []
+        size: List[int] = []
+        for _ in range(reps):
+            # 조각만 다시 그려지면 AppTest 트리에는 그 조각만 남으므로 측정 전에 전체 트리를 갱신
+            at.run()
+            target = _click(at, label)
+            c0, w0 = time.process_time(), time.perf_counter()
+            target.run()
+            cpu.append(time.process_time() - c0)
+            wall.append(time.perf_counter() - w0)
+            if at.exception:
+                raise RuntimeError(at.exception)
+            size.append(_tree_size(at._tree))
+        out[name] = {
+            "cpu_ms": statistics.median(cpu) * 1000,
+            "wall_ms": statistics.median(wall) * 1000,
+            "elements": statistics.median(size),
+        }
+    return out
+
+
+def _run_mode(app: str, fragments_on: bool, rows: int, reps: int) -> Dict[str, Dict[str, float]]:
+    env = dict(os.environ, EMR_EVAL_FRAGMENTS="1" if fragments_on else "0")
+    cmd = [sys.executable, "-m", "benchmarks.bench_fragments", "--child", "--app", app, "--rows", str(rows), "--reps", str(reps)]
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=2000)
+    ap.add_argument("--reps", type=int, default=15)
+    ap.add_argument("--app", default=APP, help="측정할 app.py 경로")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        print(json.dumps(child(args.app, args.rows, args.reps)))
+        return
+
+    full = _run_mode(args.app, False, args.rows, args.reps)
+    frag = _run_mode(args.app, True, args.rows, args.reps)
+    print(f"== 조작 1회 (업로드 {args.rows:,}행, {args.reps}회 중앙값): 전체 실행 → 조각 재실행")
+    print(f"  {'조작':<10} {'CPU ms':>17} {'경과 ms':>17} {'요소 수':>13} {'CPU 감소':>8}")
+    for name, _ in INTERACTIONS:
+        a, b = full[name], frag[name]
+        print(
+            f"  {name:<10} {a['cpu_ms']:7.1f} → {b['cpu_ms']:7.1f} {a['wall_ms']:7.1f} → {b['wall_ms']:7.1f} "
+            f"{a['elements']:5.0f} → {b['elements']:5.0f} {1 - b['cpu_ms'] / a['cpu_ms']:8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
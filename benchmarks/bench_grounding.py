@@ -0,0 +1,59 @@
+# benchmarks/bench_grounding.py
+"""생성결과 문장 근거 정렬(utils.grounding) 벤치마크: 긴 진료 대화 한 건당 색인 + 정렬 시간.
+
+비교용으로 문장 × 발화 구간을 모두 비교하는 단순 구현(집합 교집합)도 측정.
+실행: python -m benchmarks.bench_grounding [--turns 800] [--sentences 60]
+"""
+import argparse
+import random
+import statistics
+import time
+from typing import List
+
+from benchmarks.corpus import PHRASES, make_dialogue
+from utils.grounding import GROUNDING_WINDOW, TranscriptIndex, _norm, split_turns
+
+
+def naive_support(dialogue: str, sentences: List[str], window: int = GROUNDING_WINDOW) -> List[float]:
+    """문장마다 모든 발화 구간과 2-gram 집합 교집합 (색인 없음)."""
+    turns = [_norm(t) for _, t in split_turns(dialogue)]
+    grams = [{t[i:i + 2] for i in range(len(t) - 1)} for t in turns]
+    w = min(window, len(turns))
+    windows = [set().union(*grams[s:s + w]) for s in range(len(turns) - w + 1)]
+    out = []
+    for sentence in sentences:
+        t = _norm(sentence)
+        g = {t[i:i + 2] for i in range(len(t) - 1)}
+        out.append(max(len(g & win) for win in windows) / len(g) if g else 0.0)
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--turns", type=int, default=800, help="발화 수 (800 ≈ 1시간 진료)")
+    ap.add_argument("--sentences", type=int, default=60)
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    dialogue = make_dialogue(rng, args.turns)
+    sentences = [rng.choice(PHRASES) for _ in range(args.sentences)]
+
+    times = []
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        result = TranscriptIndex(dialogue).align(sentences)
+        times.append(time.perf_counter() - t0)
+    low = sum(1 for g in result if g is not None and g.low)
+
+    t0 = time.perf_counter()
+    naive_support(dialogue, sentences)
+    naive = time.perf_counter() - t0
+
+    print(f"대화: {args.turns:,}발화 · {len(dialogue):,}자 · 문장 {args.sentences}")
+    print(f"색인 + 정렬 : {statistics.median(times) * 1000:8.2f} ms (중앙값, 근거 부족 {low}/{len(result)})")
+    print(f"단순 비교   : {naive * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# benchmarks/bench_parser.py
+"""parse_clova_sections 마이크로벤치마크.
+
+실행: python -m benchmarks.bench_parser [--rows 10000]
+"""
+import argparse
+import time
+
+from benchmarks.corpus import make_generated_texts
+from utils import parser
+
+def _rate(n: int, sec: float) -> str:
+    return f"{n / sec:,.0f} parses/sec ({sec * 1000:.1f} ms)"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=10_000)
+    args = ap.parse_args()
+
+    corpus = make_generated_texts(args.rows)
+
+    t0 = time.perf_counter()
+    for raw in corpus:
+        parser._parse_uncached(raw)
+    uncached = time.perf_counter() - t0
+
+    # 재실행(rerun) 상황: 같은 행을 다시 그릴 때의 비용
+    parser.clear_parse_cache()
+    hit_time = 0.0
+    for raw in corpus:
+        parser.parse_clova_sections(raw)
+        t1 = time.perf_counter()
+        parser.parse_clova_sections(raw)
+        hit_time += time.perf_counter() - t1
+
+    print(f"rows            : {args.rows:,}")
+    print(f"uncached parse  : {_rate(args.rows, uncached)}")
+    print(f"cache-hit parse : {_rate(args.rows, hit_time)}")
+    print(f"cache           : {parser.parse_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# benchmarks/bench_profiling.py
+"""계측(utils.profiling) 오버헤드: 꺼짐/켜짐 상태에서 호출당 비용.
+
+실행: python -m benchmarks.bench_profiling [--calls 200000]
+"""
+import argparse
+import time
+
+from utils import profiling
+
+
+def _noop() -> None:
+    pass
+
+
+_timed_noop = profiling.timed("bench.noop")(_noop)
+
+
+def _per_call_ns(fn, calls: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - t0) / calls * 1e9
+
+
+def _span() -> None:
+    with profiling.span("bench.span"):
+        pass
+
+
+def _count() -> None:
+    profiling.count("bench.count")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--calls", type=int, default=200000)
+    args = ap.parse_args()
+
+    base = _per_call_ns(_noop, args.calls)
+    print(f"기준 함수 호출: {base:8.1f} ns")
+    for on in (False, True):
+        profiling.enable(on)
+        profiling.reset()
+        profiling.begin_run("bench")
+        state = "켜짐" if on else "꺼짐"
+        for name, fn in (("span", _span), ("timed", _timed_noop), ("count", _count)):
+            print(f"{state} {name:<6}: {_per_call_ns(fn, args.calls) - base:8.1f} ns/호출 (기준 대비)")
+    profiling.enable(False)
+    profiling.reset()
+
+
+if __name__ == "__main__":
+    main()
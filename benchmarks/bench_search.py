@@ -0,0 +1,66 @@
+# benchmarks/bench_search.py
+"""전문 검색 색인(utils.search) 벤치마크: 색인 생성 시간/크기와 질의 지연.
+
+실행: python -m benchmarks.bench_search [--rows 100000] [--turns 20]
+"""
+import argparse
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.corpus import make_dialogues, make_generated_texts
+from utils.ingest import preprocess_sections
+from utils.search import SearchIndex
+
+QUERIES = [
+    ("두통", "전체", None),
+    ("혈압약", "대화 스크립트", None),
+    ("흡연 10갑년", "전체", None),
+    ("복부 압통", "신체검진", None),
+    ("기침", "전체", False),
+    ("열", "대화 스크립트", True),
+    ("없는검색어", "전체", None),
+]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--turns", type=int, default=20, help="대화 스크립트 한 건의 발화 수")
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    df = pd.DataFrame(
+        {
+            "구분자": [f"ID{i:06d}" for i in range(args.rows)],
+            "대화 스크립트": make_dialogues(args.rows, args.turns),
+            "생성결과": make_generated_texts(args.rows),
+        }
+    )
+    sections = preprocess_sections(df)[0]
+    saved = np.random.default_rng(0).random(args.rows) < 0.5
+
+    index = SearchIndex(df, sections)
+    info = index.info()
+    print(
+        f"색인: {info['rows']:,}행 · {info['seconds']:.2f}초 · 포스팅 {info['postings']:,} · "
+        f"{info['bytes'] / 2**20:.1f} MB · 2-gram {info['grams']}"
+    )
+    print(f"  {'질의':<14} {'범위':<10} {'필터':<6} {'후보':>8} {'결과':>5} {'중앙값 ms':>10}")
+    for query, scope, want in QUERIES:
+        times = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            res = index.search(query, scope, saved, want)
+            times.append(time.perf_counter() - t0)
+        label = {None: "-", True: "저장", False: "미저장"}[want]
+        print(
+            f"  {query:<14} {scope:<10} {label:<6} {res.candidates:>8,} {len(res.rows):>5} "
+            f"{statistics.median(times) * 1000:10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
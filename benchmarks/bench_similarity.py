@@ -0,0 +1,41 @@
+# benchmarks/bench_similarity.py
+"""EMR 정답 vs 생성결과 자동 유사도 벤치마크 (비트 병렬 LCS/편집거리 + 일괄 채점).
+
+실행: python -m benchmarks.bench_similarity [--rows 2000] [--workers N]
+"""
+import argparse
+import random
+import time
+
+from benchmarks.corpus import make_section_texts
+from constants import EMR_SECTIONS
+from utils import similarity
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=2000)
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    keys = [key for _, key in EMR_SECTIONS]
+    gold = make_section_texts(args.rows, rng)
+    refs = make_section_texts(args.rows, rng)
+    pairs = args.rows * len(keys)
+
+    similarity.clear_similarity_cache()
+    t0 = time.perf_counter()
+    similarity.similarity_frame(gold, refs, workers=args.workers)
+    cold = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    similarity.similarity_frame(gold, refs, workers=args.workers)
+    warm = time.perf_counter() - t0
+
+    print(f"pairs      : {pairs:,}")
+    print(f"cold score : {pairs / cold:,.0f} pairs/sec ({cold:.2f} s)")
+    print(f"cache hit  : {pairs / warm:,.0f} pairs/sec ({warm:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# benchmarks/bench_text_utils.py
+"""text_utils 정규화 파이프라인 골든 출력 검증 + 처리량 벤치마크.
+
+실행: python -m benchmarks.bench_text_utils [--kb 64] [--repeat 5]
+골든 출력(golden/text_utils.jsonl)과 1바이트라도 다르면 종료 코드 1.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import List
+
+from utils import text_utils
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "golden", "text_utils.jsonl")
+FUNCS = [
+    "fmt_dialogue",
+    "normalize_basic",
+    "apply_bullet_newline",
+    "normalize_dash_bullets",
+    "format_ros",
+    "bullets_to_html_list",
+]
+
+
+def check_golden() -> List[str]:
+    failures: List[str] = []
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            case = json.loads(line)
+            for fn in FUNCS:
+                got = getattr(text_utils, fn)(case["input"])
+                if got != case[fn]:
+                    failures.append(f"line {lineno} {fn}: {case['input']!r}")
+    return failures
+
+
+def make_long_text(kb: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    chunks = [
+        "참석자1: 어디가 불편해서 오셨어요?",
+        "참석자2 : 사흘 전부터 머리가 아프고 열이 나요.",
+        "- 두통 3일 전부터 지속됨. - 발열 동반",
+        "• 고혈압 약 복용 중 · 흡연 10갑년",
+        "기침: +, 가래: -; 발열: +",
+        "\\n",
+        "/n",
+        "\r\n",
+        "   \n\n\n\n",
+        "\u200b\u00a0",
+    ]
+    out: List[str] = []
+    size = 0
+    while size < kb * 1024:
+        c = rng.choice(chunks)
+        out.append(c)
+        size += len(c.encode("utf-8"))
+    return " ".join(out)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--kb", type=int, default=64)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    failures = check_golden()
+    if failures:
+        print(f"golden mismatch: {len(failures)}")
+        for f in failures[:20]:
+            print("  " + f)
+        sys.exit(1)
+    print("golden          : OK")
+
+    text = make_long_text(args.kb)
+    mb = len(text.encode("utf-8")) / (1024 * 1024)
+    for fn in FUNCS:
+        func = getattr(text_utils, fn)
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            func(text)
+        sec = (time.perf_counter() - t0) / args.repeat
+        print(f"{fn:<23}: {mb / sec:8.1f} MB/s ({sec * 1000:.1f} ms / {args.kb}KB)")
+
+
+if __name__ == "__main__":
+    main()
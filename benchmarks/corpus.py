@@ -0,0 +1,181 @@
+# benchmarks/corpus.py
+"""벤치마크용 합성 한국어 EMR 코퍼스 (seed 고정, 같은 인자면 항상 같은 결과).
+
+- make_upload: 업로드 파일 형태의 표 (REQUIRED_COLS + 진료일시)
+  · 대화 스크립트: 참석자1~5 발화 (콜론 유무/전각 콜론 섞음)
+  · 생성결과: LABEL_PATTERN_STR 의 모든 라벨 표기, 여러 불릿 기호, 계통문진 '항목: +/-' 줄,
+    이스케이프된 줄바꿈("\\n") 이 섞인 행
+- make_results / make_answers: 다운로드 표와 저장된 답변
+- make_ratings / make_section_texts: 일치도·유사도 벤치마크 입력
+"""
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from constants import DOWNLOAD_COLUMNS, EMR_SECTIONS, REQUIRED_COLS
+
+# LABEL_PATTERN_STR 이 받는 라벨 표기 (공백 변형 포함)
+LABEL_VARIANTS: List[str] = [
+    "주호소", "현병력", "과거력", "개인력 및 사회력", "개인력및사회력", "개인력  및  사회력",
+    "계통문진", "통문진", "신체검진", "진단명", "진단", "진료 계획", "진료계획", "계획",
+]
+_LABEL_SUFFIXES = ["", ":", " :", "：", ""]
+_BULLETS = ["- ", "-", "• ", "· ", "* ", "● ", "○ ", "– "]
+
+PHRASES: List[str] = [
+    "두통이 3일 전부터 지속됨", "발열 및 오한 동반", "고혈압 약 복용 중", "흡연 10갑년", "복부 압통 없음",
+    "특이사항 없음", "식후 명치 통증 악화", "당뇨 진단 5년 전", "음주 주 2회 소주 1병", "야간 기침으로 수면 방해",
+    "체중 2kg 감소", "항생제 알레르기 없음", "우측 하복부 압통 있음", "청진상 수포음 없음",
+]
+ROS_ITEMS: List[str] = ["발열", "오한", "기침", "가래", "두통", "어지러움", "오심", "구토", "복통", "설사", "흉통", "호흡곤란"]
+
+_DOCTOR = [
+    "어디가 불편해서 오셨어요?", "언제부터 그러셨어요?", "드시는 약 있으세요?", "담배는 피우세요?",
+    "열은 재 보셨어요?", "기침이나 가래는요?", "배는 안 아프세요?", "예전에 수술하신 적 있으세요?",
+]
+_PATIENT = [
+    "머리가 계속 아파요.", "사흘 전부터요.", "혈압약 먹고 있어요.", "하루 반 갑 정도요.", "38도 넘었어요.",
+    "기침이 조금 나요.", "배는 괜찮아요.", "맹장 수술 했어요.", "밥 먹고 나면 속이 쓰려요.", "잠을 잘 못 자요.",
+]
+_SPEAKER_SEPS = [": ", ":", " : ", "： ", " "]
+
+
+def make_dialogue(rng: random.Random, turns: int) -> str:
+    """참석자1(의사) 중심으로 참석자2~5 가 답하는 대화."""
+    parts: List[str] = []
+    for t in range(turns):
+        speaker = 1 if t % 2 == 0 else rng.choice([2, 2, 2, 3, 4, 5])
+        line = rng.choice(_DOCTOR if speaker == 1 else _PATIENT)
+        parts.append(f"참석자{speaker}{rng.choice(_SPEAKER_SEPS)}{line}")
+    return (" " if rng.random() < 0.5 else "\n").join(parts)
+
+
+def _ros_lines(rng: random.Random) -> List[str]:
+    items = rng.sample(ROS_ITEMS, k=rng.randint(2, 6))
+    marks = [f"{name}: {rng.choice('+-')}" for name in items]
+    if rng.random() < 0.5:
+        return [", ".join(marks)]
+    return [rng.choice(["- ", ""]) + "; ".join(marks[i:i + 2]) for i in range(0, len(marks), 2)]
+
+
+def make_generated(rng: random.Random, row: int = 0) -> str:
+    """CLOVA 생성결과 한 건: 라벨 3~8개 (순서 섞임), 섹션마다 불릿 1~5개."""
+    parts: List[str] = []
+    if rng.random() < 0.1:
+        # 첫 라벨 앞 머리말 (현병력에 합쳐짐)
+        parts.append(rng.choice(PHRASES))
+    for label in rng.sample(LABEL_VARIANTS, k=rng.randint(3, 8)):
+        parts.append(label + rng.choice(_LABEL_SUFFIXES))
+        if label in ("계통문진", "통문진"):
+            parts.extend(_ros_lines(rng))
+            continue
+        if rng.random() < 0.15:
+            # 한 줄에 이어 쓴 불릿
+            parts.append(" - ".join(rng.choice(PHRASES) for _ in range(rng.randint(2, 4))))
+            continue
+        bullet = rng.choice(_BULLETS)
+        for _ in range(rng.randint(1, 5)):
+            parts.append(f"{bullet}{rng.choice(PHRASES)} ({row})")
+    return ("\\n" if rng.random() < 0.2 else "\n").join(parts)
+
+
+def make_generated_texts(n_rows: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [make_generated(rng, i) for i in range(n_rows)]
+
+
+def make_dialogues(n_rows: int, turns: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [make_dialogue(rng, turns) for _ in range(n_rows)]
+
+
+def make_upload(
+    n_rows: int, seed: int = 0, turns: Tuple[int, int] = (6, 24), duplicate_ratio: float = 0.0
+) -> pd.DataFrame:
+    """업로드 파일과 같은 열(REQUIRED_COLS + 진료일시)의 표.
+
+    duplicate_ratio: 생성결과를 앞선 행에서 그대로 복사하는 비율 (같은 원문이 반복되는 업로드 재현)
+    """
+    rng = random.Random(seed)
+    generated: List[str] = []
+    for i in range(n_rows):
+        if generated and rng.random() < duplicate_ratio:
+            generated.append(rng.choice(generated))
+        else:
+            generated.append(make_generated(rng, i))
+    df = pd.DataFrame(
+        {
+            "구분자": [f"ID{i:06d}" for i in range(n_rows)],
+            "대화 스크립트": [make_dialogue(rng, rng.randint(*turns)) for _ in range(n_rows)],
+            "생성결과": generated,
+            "진료일시": pd.Timestamp("2024-01-01 09:00") + pd.to_timedelta(np.arange(n_rows) * 17, unit="min"),
+        }
+    )
+    return df[REQUIRED_COLS + ["진료일시"]]
+
+
+def _section_text(rng: random.Random, text_len: int) -> str:
+    parts, size = [], 0
+    while size < text_len:
+        p = f"- {rng.choice(PHRASES)}"
+        parts.append(p)
+        size += len(p) + 1
+    return "\n".join(parts)
+
+
+def make_answers(n_rows: int, text_len: int = 200, seed: int = 0, saved_ratio: float = 1.0) -> Dict[int, Dict[str, Any]]:
+    """세션에 저장되는 형식({suitable, likert, emr, saved})의 답변."""
+    rng = random.Random(seed)
+    answers: Dict[int, Dict[str, Any]] = {}
+    for idx in range(n_rows):
+        if rng.random() >= saved_ratio:
+            continue
+        answers[idx] = {
+            "saved": True,
+            "suitable": "Y" if rng.random() < 0.95 else "N",
+            "likert": {i: rng.randint(1, 5) for i in range(5)},
+            "emr": {key: _section_text(rng, rng.randint(0, text_len)) for _, key in EMR_SECTIONS},
+        }
+    return answers
+
+
+def make_results(n_rows: int, text_len: int, seed: int = 0) -> pd.DataFrame:
+    """DOWNLOAD_COLUMNS 형태의 평가 결과 표 (EMR 섹션은 text_len 자 안팎의 긴 텍스트)."""
+    rng = random.Random(seed)
+    data: Dict[str, Any] = {
+        "새_구분자": [f"E{i + 1:06d}" for i in range(n_rows)],
+        "원_구분자": [f"ID{i:06d}" for i in range(n_rows)],
+    }
+    for i in range(5):
+        data[f"리커트_{i + 1}_점수"] = [rng.randint(1, 5) for _ in range(n_rows)]
+    for label, _ in EMR_SECTIONS:
+        data[label] = [_section_text(rng, text_len) for _ in range(n_rows)]
+    return pd.DataFrame(data)[DOWNLOAD_COLUMNS]
+
+
+def make_section_texts(n_rows: int, rng: Optional[random.Random] = None, max_items: int = 6) -> Dict[str, List[str]]:
+    """EMR 섹션 키별 불릿 텍스트 목록 (similarity_frame 입력)."""
+    rng = rng or random.Random(0)
+    return {
+        key: ["\n".join(f"- {rng.choice(PHRASES)}" for _ in range(rng.randint(0, max_items))) for _ in range(n_rows)]
+        for _, key in EMR_SECTIONS
+    }
+
+
+def make_ratings(n_raters: int, n_items: int, coverage: float, seed: int = 0) -> pd.DataFrame:
+    """평가자마다 coverage 비율의 원_구분자를 (정답 ± 1) 점수로 평가한 긴 표."""
+    from utils.agreement import ID_COL, RATER_COL, SCORE_COLUMNS
+
+    rng = np.random.default_rng(seed)
+    truth = rng.integers(1, 6, size=(n_items, len(SCORE_COLUMNS)))
+    parts = []
+    for r in range(n_raters):
+        ids = np.flatnonzero(rng.random(n_items) < coverage)
+        scores = np.clip(truth[ids] + rng.integers(-1, 2, size=(len(ids), len(SCORE_COLUMNS))), 1, 5)
+        part = pd.DataFrame(scores, columns=SCORE_COLUMNS)
+        part.insert(0, ID_COL, [f"ID{i:06d}" for i in ids])
+        part.insert(0, RATER_COL, f"rater_{r:03d}")
+        parts.append(part)
+    return pd.concat(parts, ignore_index=True)
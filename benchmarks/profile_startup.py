@@ -0,0 +1,129 @@
+# benchmarks/profile_startup.py
+"""app.py 시작/재실행(rerun) 프로파일.
+
+- import: 새 프로세스에서 `streamlit` 이후 각 프로젝트 모듈의 누적 import 시간 (-X importtime)
+- cold start: 새 프로세스에서 업로드 전 첫 화면을 그리는 시간과 그때 로드된 무거운 모듈
+- rerun: 데이터를 올린 상태에서 재실행 / "다음 ▶" 클릭 지연 (streamlit.testing AppTest)
+
+실행: python -m benchmarks.profile_startup [--rows 2000] [--reruns 20]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+
+MODULES = [
+    "styles",
+    "components.shared_panel",
+    "components.navigator",
+    "components.left_panel",
+    "components.right_panel",
+    "components.analytics_panel",
+    "components.agreement_panel",
+    "utils.loader",
+    "utils.ingest",
+    "utils.download",
+    "utils.similarity",
+    "utils.shared_store",
+]
+HEAVY = ["pandas", "numpy", "pyarrow", "openpyxl", "PIL.Image", "sqlite3", "multiprocessing"]
+
+_COLD_SCRIPT = f"""
+import sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file({APP!r}, default_timeout=120)
+at.run()
+t2 = time.perf_counter()
+assert not at.exception, at.exception
+heavy = [m for m in {HEAVY!r} if m in sys.modules]
+print(f"{{(t1 - t0) * 1000:.0f}} {{(t2 - t1) * 1000:.0f}} {{','.join(heavy) or '-'}}")
+"""
+
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=ROOT)
+    )
+
+
+def import_times() -> Dict[str, float]:
+    """모듈별 누적 import 시간(ms). streamlit 은 미리 import 해 두고 그 이후 비용만 측정."""
+    out: Dict[str, float] = {}
+    for mod in MODULES:
+        proc = _run(["-X", "importtime", "-c", f"import streamlit; import {mod}"])
+        for line in proc.stderr.splitlines():
+            parts = [p.strip() for p in line.split("|")]
+            if len(parts) == 3 and parts[2] == mod:
+                out[mod] = int(parts[1]) / 1000
+    return out
+
+
+def cold_start() -> str:
+    proc = _run(["-c", _COLD_SCRIPT])
+    lines = [ln for ln in proc.stdout.splitlines() if ln.strip()]
+    if proc.returncode != 0 or not lines:
+        return f"실패: {proc.stderr.strip().splitlines()[-1:]}"
+    load_ms, first_ms, heavy = lines[-1].split(" ", 2)
+    return f"streamlit.testing import {load_ms} ms · 첫 화면 {first_ms} ms · 로드된 무거운 모듈: {heavy}"
+
+
+def rerun_times(n_rows: int, reruns: int) -> Dict[str, float]:
+    from streamlit.testing.v1 import AppTest
+
+    from benchmarks.corpus import make_upload
+    from utils.ingest import preprocess_sections
+
+    df = make_upload(n_rows)
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.run()
+    at.session_state["df"] = df
+    at.session_state["sections"] = preprocess_sections(df, workers=1)[0]
+    at.run()
+
+    rerun: List[float] = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        rerun.append(time.perf_counter() - t0)
+
+    click: List[float] = []
+    for _ in range(reruns):
+        # "다음 ▶" 는 조각만 다시 그리므로 클릭 전 전체 트리를 갱신 (측정 제외)
+        at.run()
+        button = at.button(key="nav_next")
+        t0 = time.perf_counter()
+        button.click().run()
+        click.append(time.perf_counter() - t0)
+    assert not at.exception, at.exception
+    return {
+        "rerun_median_ms": statistics.median(rerun) * 1000,
+        "next_click_median_ms": statistics.median(click) * 1000,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=2000)
+    ap.add_argument("--reruns", type=int, default=20)
+    args = ap.parse_args()
+
+    print("== import (streamlit 이후 누적 ms)")
+    for mod, ms in sorted(import_times().items(), key=lambda kv: -kv[1]):
+        print(f"  {mod:<28} {ms:8.1f}")
+    print("== cold start")
+    print("  " + cold_start())
+    print(f"== rerun ({args.rows:,}행, {args.reruns}회 중앙값)")
+    for name, ms in rerun_times(args.rows, args.reruns).items():
+        print(f"  {name:<22} {ms:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
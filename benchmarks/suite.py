@@ -0,0 +1,248 @@
+# benchmarks/suite.py
+"""업로드 → 렌더링 → 다운로드 경로 통합 벤치마크 + 성능 회귀 게이트.
+
+단계 (benchmarks.corpus 합성 업로드 기준)
+- parse          : preprocess_sections (생성결과 섹션 파싱, 단일 프로세스)
+- normalize      : 섹션 본문 정리 (normalize_dash_bullets / 계통문진 format_ros)
+- html           : fmt_dialogue + bullets_to_html_list
+- download_frame : AnswerStore → build_download_df
+- xlsx           : export_frame(xlsx) 임시 파일 기록
+
+크기별로 처리량(행/초, 반복 측정 중 최솟값 기준)과 tracemalloc 최대 메모리를 출력하고,
+기준값 파일(baseline.json)보다 처리량이 tolerance 이상 낮거나 메모리가 커지면 종료 코드 1.
+처리량 비교는 단계마다 함께 잰 고정 기준 작업 시간으로 보정 (공유 기기의 속도 변동 완화).
+text_utils 골든 출력이 달라져도 실패로 처리.
+
+실행: python -m benchmarks.suite [--sizes 1000,10000,100000] [--stages parse,xlsx] [--no-memory]
+기준값 갱신: python -m benchmarks.suite --update-baseline  (기준값은 측정한 기기 기준이므로 같은 기기에서 비교)
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from benchmarks.bench_text_utils import check_golden
+from benchmarks.corpus import make_answers, make_upload
+from constants import PRIMARY_LABELS
+from utils import parser
+from utils.answer_store import AnswerStore
+from utils.download import build_download_df
+from utils.exporters import export_frame
+from utils.ingest import preprocess_sections
+from utils.text_utils import bullets_to_html_list, fmt_dialogue, format_ros, normalize_dash_bullets
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+# 처리량이 기준값보다 이 비율 이상 낮으면 회귀
+THROUGHPUT_TOLERANCE = 0.30
+# 최대 메모리가 기준값보다 이 비율 + MEMORY_SLACK_MB 이상 크면 회귀
+MEMORY_TOLERANCE = 0.10
+MEMORY_SLACK_MB = 1.0
+# 작은 입력은 최소 이 시간만큼 반복해 최솟값을 씀 (짧은 측정의 잡음 완화)
+MIN_MEASURE_SECONDS = 1.0
+MAX_REPEAT = 50
+
+
+class Inputs(NamedTuple):
+    df: Any
+    sections: Any
+    cleaned: List[List[str]]  # 행별 PRIMARY_LABELS 순서의 정리된 본문
+    store: AnswerStore
+    frame: Any
+    tmpdir: str
+
+
+class Measurement(NamedTuple):
+    stage: str
+    rows: int
+    seconds: float
+    peak_mb: Optional[float]
+    ref_seconds: float  # 같은 시점의 기준 작업 시간 (기기 속도 변동 보정용)
+
+    @property
+    def key(self) -> str:
+        return f"{self.stage}@{self.rows}"
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+
+def _normalize(sections) -> List[List[str]]:
+    cols = [sections[lb].tolist() for lb in PRIMARY_LABELS]
+    out: List[List[str]] = []
+    for bodies in zip(*cols):
+        out.append(
+            [
+                (format_ros(b) if lb == "계통문진" else normalize_dash_bullets(b)) if b else ""
+                for lb, b in zip(PRIMARY_LABELS, bodies)
+            ]
+        )
+    return out
+
+
+def _html(inputs: Inputs) -> None:
+    for dialogue, bodies in zip(inputs.df["대화 스크립트"].tolist(), inputs.cleaned):
+        fmt_dialogue(dialogue)
+        for body in bodies:
+            if body:
+                bullets_to_html_list(body)
+
+
+def _parse(inputs: Inputs) -> None:
+    # 이전 반복의 파싱 캐시를 쓰지 않도록 매번 비움
+    parser.clear_parse_cache()
+    preprocess_sections(inputs.df, workers=1)
+
+
+STAGES: Dict[str, Callable[[Inputs], Any]] = {
+    "parse": _parse,
+    "normalize": lambda inp: _normalize(inp.sections),
+    "html": _html,
+    "download_frame": lambda inp: build_download_df(inp.df, inp.store),
+    "xlsx": lambda inp: export_frame(inp.frame, "xlsx", os.path.join(inp.tmpdir, "out.xlsx")),
+}
+
+
+def prepare(n_rows: int, tmpdir: str, seed: int = 0) -> Inputs:
+    df = make_upload(n_rows, seed=seed)
+    sections = preprocess_sections(df, workers=1)[0]
+    store = AnswerStore(n_rows, make_answers(n_rows, text_len=120, seed=seed))
+    return Inputs(df, sections, _normalize(sections), store, build_download_df(df, store), tmpdir)
+
+
+_REF_TEXT = "참석자1: 어디가 불편해서 오셨어요? 참석자2: 머리가 아프고 열이 나요. - 두통 3일 - 발열 38도\n" * 100
+_REF_RE = re.compile(r"참석자([1-5])\s*[:：]?")
+
+
+def _reference_work() -> None:
+    """코드 변경과 무관한 고정 작업 (정규식 + 문자열 + 정렬). 기기가 느려진 구간을 판별하는 기준."""
+    for _ in range(60):
+        words = _REF_RE.sub(r"\n\1 ", _REF_TEXT).split()
+        "".join(sorted(words)).encode("utf-8")
+
+
+def measure(stage: str, inputs: Inputs, repeat: int, memory: bool) -> Measurement:
+    func = STAGES[stage]
+    best = ref = float("inf")
+    runs, total = 0, 0.0
+    while runs < repeat or (total < MIN_MEASURE_SECONDS and runs < MAX_REPEAT):
+        # 단계 직전에 기준 작업을 재서 같은 시점의 기기 속도를 함께 기록
+        t0 = time.perf_counter()
+        _reference_work()
+        ref = min(ref, time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        func(inputs)
+        elapsed = time.perf_counter() - t0
+        best = min(best, elapsed)
+        runs += 1
+        total += elapsed
+    peak = None
+    if memory:
+        # tracemalloc 은 시간 측정을 왜곡하므로 별도 1회 실행
+        tracemalloc.start()
+        func(inputs)
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return Measurement(stage, len(inputs.df), best, peak, ref)
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("results", {})
+
+
+def save_baseline(path: str, results: List[Measurement]) -> None:
+    merged = load_baseline(path)
+    for m in results:
+        entry = {"rows_per_sec": round(m.rows_per_sec, 1), "ref_ms": round(m.ref_seconds * 1000, 3)}
+        if m.peak_mb is not None:
+            entry["peak_mb"] = round(m.peak_mb, 2)
+        merged[m.key] = entry
+    doc = {
+        "machine": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "results": dict(sorted(merged.items())),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def compare(m: Measurement, base: Optional[Dict[str, float]], tolerance: float) -> Tuple[str, List[str]]:
+    """(기준값 대비 표시, 회귀 사유 목록)."""
+    if not base:
+        return "(기준값 없음)", []
+    problems: List[str] = []
+    ratio = m.rows_per_sec / base["rows_per_sec"]
+    if "ref_ms" in base:
+        # 기준 작업이 느려진 만큼 보정 (측정 중 기기 전체가 느려진 경우 회귀로 보지 않음)
+        ratio *= m.ref_seconds * 1000 / base["ref_ms"]
+    if ratio < 1 - tolerance:
+        problems.append(f"처리량 {ratio:.0%}")
+    note = f"{ratio:6.0%}"
+    if m.peak_mb is not None and "peak_mb" in base:
+        limit = base["peak_mb"] * (1 + MEMORY_TOLERANCE) + MEMORY_SLACK_MB
+        if m.peak_mb > limit:
+            problems.append(f"메모리 {m.peak_mb:.1f} MB > {limit:.1f} MB")
+        note += f" · mem {m.peak_mb - base['peak_mb']:+.1f} MB"
+    return note, problems
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="행 수 목록 (쉼표 구분)")
+    ap.add_argument("--stages", default=",".join(STAGES), help="측정할 단계 (쉼표 구분)")
+    ap.add_argument("--repeat", type=int, default=3, help="단계별 최소 반복 횟수 (최솟값 사용, 10만 행 이상은 1회)")
+    ap.add_argument("--no-memory", action="store_true", help="tracemalloc 최대 메모리 측정 생략")
+    ap.add_argument("--baseline", default=BASELINE_PATH)
+    ap.add_argument("--tolerance", type=float, default=THROUGHPUT_TOLERANCE)
+    ap.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준값으로 저장 (골든 불일치 시 저장 안 함)")
+    args = ap.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    stages = [s for s in args.stages.split(",") if s]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        ap.error(f"알 수 없는 단계: {', '.join(unknown)} (가능: {', '.join(STAGES)})")
+
+    failures = [f"golden: {f}" for f in check_golden()]
+    print(f"golden            : {'OK' if not failures else f'{len(failures)}건 불일치'}")
+
+    baseline = {} if args.update_baseline else load_baseline(args.baseline)
+    results: List[Measurement] = []
+    print(f"  {'단계':<16} {'행':>8} {'초':>8} {'행/초':>11} {'최대 MB':>8}  기준 대비")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for n in sizes:
+            inputs = prepare(n, tmpdir)
+            for stage in stages:
+                m = measure(stage, inputs, args.repeat if n < 100_000 else 1, not args.no_memory)
+                results.append(m)
+                note, problems = compare(m, baseline.get(m.key), args.tolerance)
+                peak = f"{m.peak_mb:8.1f}" if m.peak_mb is not None else f"{'-':>8}"
+                flag = "  ← 회귀: " + ", ".join(problems) if problems else ""
+                print(f"  {stage:<16} {n:>8,} {m.seconds:8.3f} {m.rows_per_sec:11,.0f} {peak}  {note}{flag}")
+                failures += [f"{m.key}: {p}" for p in problems]
+            del inputs
+
+    if args.update_baseline and not failures:
+        save_baseline(args.baseline, results)
+        print(f"기준값 저장: {args.baseline}")
+        return
+    if failures:
+        print(f"실패 {len(failures)}건")
+        for f in failures[:20]:
+            print("  " + f)
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
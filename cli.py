@@ -0,0 +1,168 @@
+# cli.py
+"""Streamlit 없이 쓰는 일괄 처리 CLI.
+
+    python cli.py validate data/*.xlsx
+    python cli.py parse data/dump.csv -o out/ --format parquet --workers 8
+    python cli.py export data/dump.xlsx -o results.xlsx [--journal-dir .cache/journal] [--similarity]
+
+종료 코드: 0 성공, 1 처리 오류, 2 필수 컬럼 누락
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Optional
+
+import pandas as pd
+
+from constants import REQUIRED_COLS
+from utils.answer_store import AnswerStore
+from utils.download import DownloadBuffer
+from utils.exporters import FORMATS, export_frame
+from utils.ingest import OTHERS_COL, SECTION_COLUMNS, preprocess_sections
+from utils.journal import JOURNAL_DIR, read_answers
+from utils.loader import MissingColumnsError, read_upload
+from utils.upload_cache import file_digest
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_MISSING_COLUMNS = 2
+
+
+def _log(msg: str) -> None:
+    print(msg, file=sys.stderr, flush=True)
+
+
+def _read(path: str) -> pd.DataFrame:
+    with open(path, "rb") as f:
+        return read_upload(f, os.path.basename(path))
+
+
+def _output_path(src: str, out: Optional[str], fmt: str, n_inputs: int) -> str:
+    """-o 가 디렉터리(또는 입력이 여러 개)면 <입력 이름>.<형식>, 아니면 -o 경로 그대로."""
+    stem = os.path.splitext(os.path.basename(src))[0]
+    if out is None:
+        return os.path.join(os.path.dirname(src), f"{stem}.parsed.{fmt}")
+    if n_inputs > 1 or os.path.isdir(out) or out.endswith(os.sep):
+        os.makedirs(out, exist_ok=True)
+        return os.path.join(out, f"{stem}.{fmt}")
+    return out
+
+
+def parsed_frame(df: pd.DataFrame, sections: pd.DataFrame, fmt: str) -> pd.DataFrame:
+    """원본 컬럼 + 섹션 컬럼. jsonl 은 기타를 [{라벨, 내용}] 구조로, 그 외 형식은 JSON 문자열로."""
+    out = pd.concat([df.reset_index(drop=True), sections.reset_index(drop=True)], axis=1)
+    if fmt == "jsonl":
+        out[OTHERS_COL] = [
+            [{"label": k, "content": v} for k, v in json.loads(raw)] if raw else []
+            for raw in out[OTHERS_COL]
+        ]
+    return out
+
+
+# ---------------- 명령 ----------------
+def cmd_validate(args: argparse.Namespace) -> int:
+    status = EXIT_OK
+    for path in args.inputs:
+        try:
+            df = _read(path)
+        except MissingColumnsError as e:
+            print(f"{path}: 필수 컬럼 누락 {e.missing} (현재 컬럼: {e.columns})")
+            status = EXIT_MISSING_COLUMNS
+            continue
+        except Exception as e:  # 읽기 실패도 파일 단위로 보고하고 계속 진행
+            print(f"{path}: 읽기 실패 ({e})")
+            status = max(status, EXIT_ERROR)
+            continue
+        empty = {c: int(df[c].isna().sum()) for c in REQUIRED_COLS if df[c].isna().any()}
+        dup = int(df["구분자"].duplicated().sum())
+        note = []
+        if empty:
+            note.append(f"빈 값 {empty}")
+        if dup:
+            note.append(f"중복 구분자 {dup}건")
+        print(f"{path}: OK {len(df):,}행" + (f" ({', '.join(note)})" if note else ""))
+    return status
+
+
+def cmd_parse(args: argparse.Namespace) -> int:
+    status = EXIT_OK
+    for path in args.inputs:
+        try:
+            t0 = time.perf_counter()
+            df = _read(path)
+            sections, stats = preprocess_sections(df, workers=args.workers)
+            out_path = _output_path(path, args.output, args.format, len(args.inputs))
+            export_frame(parsed_frame(df, sections, args.format), args.format, out_path)
+            elapsed = time.perf_counter() - t0
+            _log(
+                f"{path} → {out_path}: {stats['rows']:,}행 (고유 {stats['unique']:,}) · "
+                f"파싱 {stats['rows_per_sec']:,.0f}행/초 · 워커 {stats['workers']} · 전체 {elapsed:.2f}초"
+            )
+        except MissingColumnsError as e:
+            _log(f"{path}: 필수 컬럼 누락 {e.missing}")
+            status = EXIT_MISSING_COLUMNS
+        except Exception as e:
+            _log(f"{path}: 처리 실패 ({e})")
+            status = max(status, EXIT_ERROR)
+    return status
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    """업로드 파일 + 앱 저널(같은 파일 내용의 digest 기준)로 결과 파일 생성. 저널은 읽기만 함."""
+    fmt = args.format or os.path.splitext(args.output)[1].lstrip(".").lower() or "xlsx"
+    if fmt not in FORMATS:
+        _log(f"지원하지 않는 형식: {fmt}")
+        return EXIT_ERROR
+    try:
+        with open(args.input, "rb") as f:
+            digest = file_digest(f)
+            df = read_upload(f, os.path.basename(args.input))
+        store = AnswerStore(len(df), read_answers(digest, directory=args.journal_dir))
+        sections = preprocess_sections(df, workers=args.workers)[0] if args.similarity else None
+        out = DownloadBuffer(df, store, sections).to_frame()
+        export_frame(out, fmt, args.output)
+    except MissingColumnsError as e:
+        _log(f"{args.input}: 필수 컬럼 누락 {e.missing}")
+        return EXIT_MISSING_COLUMNS
+    except Exception as e:
+        _log(f"{args.input}: 처리 실패 ({e})")
+        return EXIT_ERROR
+    _log(f"{args.input} → {args.output}: 저장 {store.progress.done:,} / {len(df):,}행")
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="cli.py", description="EMR 평가 데이터 일괄 처리 (Streamlit 없이 실행)")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("validate", help=f"필수 컬럼 {REQUIRED_COLS} 검사")
+    p.add_argument("inputs", nargs="+")
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser("parse", help=f"생성결과를 섹션({', '.join(SECTION_COLUMNS)})으로 파싱해 저장")
+    p.add_argument("inputs", nargs="+")
+    p.add_argument("-o", "--output", help="출력 파일 또는 디렉터리 (기본: 입력 옆 <이름>.parsed.<형식>)")
+    p.add_argument("-f", "--format", choices=FORMATS, default="parquet")
+    p.add_argument("-w", "--workers", type=int, default=None, help="파싱 프로세스 수 (기본: CPU 수)")
+    p.set_defaults(func=cmd_parse)
+
+    p = sub.add_parser("export", help="앱 저널에 저장된 답변으로 결과 파일 생성")
+    p.add_argument("input", help="평가에 사용한 업로드 파일")
+    p.add_argument("-o", "--output", required=True)
+    p.add_argument("-f", "--format", choices=FORMATS, default=None, help="기본: 출력 확장자")
+    p.add_argument("--journal-dir", default=JOURNAL_DIR)
+    p.add_argument("--similarity", action="store_true", help="섹션별 자동 유사도 컬럼 추가")
+    p.add_argument("-w", "--workers", type=int, default=None)
+    p.set_defaults(func=cmd_export)
+    return ap
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
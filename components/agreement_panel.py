@@ -0,0 +1,48 @@
+# components/agreement_panel.py
+import streamlit as st
+
+from utils import profiling
+from utils.agreement import BOOTSTRAP_REPS, agreement_report, load_exports
+from utils.loader import MissingColumnsError
+
+
+@profiling.timed("agreement_panel.render")
+def render_agreement_panel(container) -> None:
+    """여러 평가자의 결과 파일을 원_구분자로 묶어 리커트 항목별 일치도를 계산하는 화면."""
+    with container:
+        st.markdown("<div class='section-box'>평가자 간 일치도</div>", unsafe_allow_html=True)
+        st.markdown(
+            "<div class='muted'>평가자별 결과 파일(evaluation_results.xlsx/CSV)을 여러 개 올리면 "
+            "같은 원_구분자 행끼리 묶어 항목별 일치도를 계산합니다. 파일 1개를 평가자 1명으로 봅니다.</div>",
+            unsafe_allow_html=True,
+        )
+        files = st.file_uploader(
+            "결과 파일 업로드", type=["xlsx", "csv"], accept_multiple_files=True, key="agreement_files"
+        )
+        c1, c2 = st.columns(2)
+        with c1:
+            reps = st.number_input(
+                "부트스트랩 반복 수", min_value=0, max_value=20000, value=BOOTSTRAP_REPS, step=100
+            )
+        with c2:
+            metric = st.selectbox("Krippendorff α 척도", ["ordinal", "interval", "nominal"])
+        if not files or len(files) < 2:
+            st.info("결과 파일을 2개 이상 업로드하세요.")
+            return
+        if not st.button("일치도 계산", key="agreement_run"):
+            return
+
+        try:
+            with st.spinner("계산 중..."):
+                ratings = load_exports([(f.name, f.getvalue()) for f in files])
+                report, stats = agreement_report(ratings, reps=int(reps), metric=metric)
+        except MissingColumnsError as e:
+            st.error(f"필수 컬럼 누락: {', '.join(e.missing)}")
+            return
+
+        st.caption(
+            f"평가자 {stats['raters']}명 · 원_구분자 {stats['items']:,}개 · 평가 {stats['ratings']:,}건 · "
+            f"{stats['seconds']:.2f}초"
+        )
+        st.dataframe(report.style.format("{:.3f}", na_rep="-", subset=report.columns[2:]), use_container_width=True)
+        st.caption("Cohen κ 는 평가자 쌍별 이차 가중 kappa 의 평균, 신뢰구간은 원_구분자 단위 부트스트랩 95% 백분위 구간입니다.")
@@ -0,0 +1,39 @@
+# components/analytics_panel.py
+import streamlit as st
+
+from utils import profiling
+from utils.analytics import LikertStats
+
+
+@profiling.timed("analytics_panel.render")
+def render_analytics_panel(container, stats: LikertStats) -> None:
+    """리커트 점수 통계 화면. 저장 시 갱신된 집계값만 읽으므로 행 수와 무관하게 빠름."""
+    with container:
+        st.markdown("<div class='section-box'>평가 결과 통계</div>", unsafe_allow_html=True)
+        if stats.n_saved == 0:
+            st.info("저장된 평가가 없습니다. 평가를 저장하면 통계가 표시됩니다.")
+            return
+
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            st.metric("저장된 평가", f"{stats.n_saved:,}")
+        with c2:
+            st.metric("평가 적합(Y) 비율", f"{stats.suitable_ratio():.1%}")
+        with c3:
+            st.metric("5개 항목 모두 응답", f"{stats.n_complete:,}")
+
+        st.markdown("**항목별 요약**")
+        st.dataframe(
+            stats.summary().style.format(
+                {"평균": "{:.2f}", "중앙값": "{:.1f}", "표준편차": "{:.2f}"}
+                | {f"{s}점 비율": "{:.1%}" for s in range(1, 6)},
+                na_rep="-",
+            ),
+            use_container_width=True,
+        )
+
+        st.markdown("**점수 분포**")
+        st.bar_chart(stats.histogram(), stack=False)
+
+        st.markdown("**항목 간 상관계수 (Pearson)**")
+        st.dataframe(stats.correlation().style.format("{:.2f}", na_rep="-"), use_container_width=True)
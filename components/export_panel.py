@@ -0,0 +1,54 @@
+# components/export_panel.py
+import streamlit as st
+
+from utils import profiling
+from utils.download import DownloadBuffer
+from utils.exporters import EXPORT_FORMATS, FORMATS, ExportJob
+
+# 내보내기 진행 중 진행률 표시 갱신 주기(초)
+EXPORT_POLL_SECONDS = 0.5
+
+
+@st.fragment(run_every=EXPORT_POLL_SECONDS)
+def _poll_job(job: ExportJob) -> None:
+    """진행 중인 작업의 진행률만 주기적으로 다시 그림. 끝나면 전체를 한 번 다시 실행해 다운로드 버튼 표시.
+    (조각 본문에서는 다른 조각을 지정해 다시 실행할 수 없으므로 작업 완료 시 1회만 전체 실행)
+    """
+    if job.done:
+        st.rerun()
+    if job.total is None:
+        st.progress(0.0, text="결과 표 준비 중…")
+    else:
+        st.progress(job.ratio, text=f"{job.written:,} / {job.total:,}행 기록")
+
+
+@profiling.timed("export_panel.render")
+def render_export_panel(container, export: DownloadBuffer) -> None:
+    """형식 선택 → 백그라운드 내보내기 → 완료되면 다운로드 버튼 (답변이 바뀔 때까지 결과 재사용)."""
+    with container:
+        fmt = st.selectbox(
+            "파일 형식",
+            FORMATS,
+            format_func=lambda f: EXPORT_FORMATS[f].label,
+            key="export_format",
+        )
+        job = export.export_job(fmt)
+        if job is None:
+            if not st.button("결과 파일 만들기", key="export_start"):
+                return
+            job = export.start_export(fmt)
+
+        if not job.done:
+            _poll_job(job)
+            return
+        if job.error is not None:
+            st.error(f"내보내기 실패: {job.error}")
+            st.button("다시 시도", key="export_retry", on_click=export.start_export, args=(fmt,))
+            return
+        spec = EXPORT_FORMATS[fmt]
+        st.download_button(
+            label=f"결과 다운로드 ({spec.label}, {job.total:,}행)",
+            data=job.read_bytes,
+            file_name=f"evaluation_results.{spec.ext}",
+            mime=spec.mime,
+        )
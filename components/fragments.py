@@ -0,0 +1,80 @@
+# components/fragments.py
+"""화면 조각(st.fragment) 키와 명시적 무효화.
+
+- 각 조각은 fragment(키) 로 감싸 독립적으로 다시 실행됨 (조각 안 위젯 조작은 그 조각만 재실행)
+- 다른 조각에 영향을 주는 조작은 위젯 콜백 마지막에 invalidate(키...) 로 다시 그릴 조각을 지정
+  (예: 저장 → 폼 + 진행 현황, 이동 → 좌/우 패널 + 항목 이동)
+- 이번 전체 실행에서 그려지지 않은 조각(다른 화면 등)은 대상에서 제외
+- EMR_EVAL_FRAGMENTS=0 이거나 공유 작업 모드(다른 평가자 답변 동기화가 전체 실행에서 이뤄짐)에서는
+  조각 없이 매번 전체 실행
+"""
+import functools
+import os
+import threading
+from typing import Callable, Optional, TypeVar
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils import profiling
+
+ENABLED = os.environ.get("EMR_EVAL_FRAGMENTS", "1") != "0"
+
+NAV = "nav"  # 사이드바 항목 이동
+SEARCH = "search"  # 사이드바 본문 검색
+PROGRESS = "progress"  # 상단/사이드바 진행 현황 (두 곳이 함께 다시 그려짐)
+LEFT = "left"  # 좌측 패널 (대화/생성결과)
+FORM = "form"  # 우측 평가 폼
+EXPORT = "export"  # 결과 다운로드
+# 현재 행이 바뀌면 다시 그리는 조각
+NAVIGATION = (LEFT, FORM, NAV, SEARCH)
+
+F = TypeVar("F", bound=Callable[..., None])
+_local = threading.local()
+
+
+def begin_full_run() -> None:
+    """전체 실행 시작 시 호출: 이번 실행에서 그려지는 조각 목록을 새로 모음."""
+    st.session_state.fragments_rendered = set()
+
+
+def _in_fragment_rerun() -> Optional[list]:
+    ctx = get_script_run_ctx()
+    return getattr(ctx, "fragment_ids_this_run", None) or None
+
+
+def fragment(key: str) -> Callable[[F], F]:
+    """st.fragment(key=key) + 그려진 조각 기록. 조각만 다시 실행될 때는 계측 실행 번호를 새로 발급."""
+
+    def decorate(func: F) -> F:
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def body(*args, **kwargs) -> None:
+            st.session_state.setdefault("fragments_rendered", set()).add(key)
+            ids = _in_fragment_rerun()
+            # 한 번의 조각 재실행(여러 조각 가능)은 계측에서 하나의 실행으로 묶음
+            if ids is not None and getattr(_local, "ids", None) is not ids:
+                _local.ids = ids
+                profiling.begin_run("fragment")
+            with profiling.span(f"fragment.{key}"):
+                func(*args, **kwargs)
+
+        return st.fragment(body, key=key)
+
+    return decorate
+
+
+def invalidate(*keys: str) -> None:
+    """위젯 콜백의 마지막에 호출: keys 조각만 다시 실행 (전체 실행 대신).
+
+    조각을 쓰지 않는 경우에는 전체를 다시 실행. st.rerun 이 예외로 콜백을 끝내므로 반드시 마지막에 호출.
+    """
+    if not ENABLED or st.session_state.get("shared_mode"):
+        st.rerun()
+    rendered = st.session_state.get("fragments_rendered") or set()
+    targets = [k for k in dict.fromkeys(keys) if k in rendered]
+    if targets:
+        profiling.count("fragments.invalidate")
+        st.rerun(targets)
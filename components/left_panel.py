@@ -1,21 +1,142 @@
 # components/left_panel.py
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
 import streamlit as st
 
 from constants import PRIMARY_LABELS
-from utils.parser import parse_clova_sections
+from utils import profiling
+from utils.cache import LRUCache, content_key
+from utils.grounding import Grounding, TranscriptIndex
+from utils.ingest import row_sections
+from utils.parser import ParseResult, parse_clova_sections
 from utils.text_utils import (
     fmt_dialogue,
     normalize_dash_bullets,
     format_ros,
     bullets_to_html_list,
+    list_items,
 )
 
+# 행 내용 해시 → 완성된 HTML/마크다운 조각
+RENDER_CACHE_SIZE = 1024
+_render_cache = LRUCache(maxsize=RENDER_CACHE_SIZE)
+profiling.register_cache("left_panel", _render_cache)
+
+# 다음 행 미리 렌더링용 (UI 스레드를 막지 않도록 1개 워커)
+_prerender_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="left-prerender")
+
+
+def _grounding_note(g: Optional[Grounding]) -> Optional[str]:
+    """근거 부족 문장의 툴팁 문구 (충분하면 None)."""
+    if g is None or not g.low:
+        return None
+    note = f"근거 {g.support:.0%}"
+    if g.support > 0:
+        note += f" · 발화 #{g.turns[0] + 1}–{g.turns[1]}"
+    if g.missing_numbers:
+        note += f" · 대화에 없는 숫자: {', '.join(g.missing_numbers)}"
+    return note
+
+
+def build_row_fragments(
+    dialogue: str, generated: str, parsed: Optional[ParseResult] = None
+) -> Dict[str, object]:
+    """대화 스크립트/생성결과 → 렌더링에 바로 쓰는 조각들.
+    업로드 시 미리 파싱된 섹션(parsed)이 있으면 그대로 사용합니다.
+    """
+    primary, others = parsed if parsed is not None else parse_clova_sections(generated)
+
+    # 정리된 본문 (라벨, 본문). 기타 섹션은 제목 그대로
+    cleaned: List[Tuple[str, str]] = []
+    for lb in PRIMARY_LABELS:
+        body = primary.get(lb, "")
+        if not body:
+            cleaned.append((lb, ""))
+        elif lb == "계통문진":
+            cleaned.append((lb, format_ros(body)))
+        else:
+            cleaned.append((lb, normalize_dash_bullets(body)))
+    for title, content in others or []:
+        cleaned.append((title, normalize_dash_bullets(content)))
+
+    # 모든 섹션 항목을 한 번에 대화 스크립트와 정렬 (대화 스크립트가 비어 있으면 표시하지 않음)
+    item_lists = [list_items(body)[0] for _, body in cleaned]
+    items = [it for its in item_lists for it in its]
+    aligned: List[Optional[Grounding]] = [None] * len(items)
+    if dialogue and dialogue.strip().lower() != "nan":
+        with profiling.span("left_panel.grounding"):
+            index = TranscriptIndex(dialogue)
+            if index.turns:
+                aligned = index.align(items)
+    notes_iter = iter([_grounding_note(g) for g in aligned])
+    notes = [[next(notes_iter) for _ in its] for its in item_lists]
+
+    sections: List[Tuple[str, str]] = []
+    for (lb, body), item_notes in zip(cleaned[: len(PRIMARY_LABELS)], notes):
+        sections.append((lb, bullets_to_html_list(body, item_notes) if body else ""))
+
+    # 기타 섹션
+    others_html = ""
+    if others:
+        chunks = []
+        for (title, body), item_notes in zip(cleaned[len(PRIMARY_LABELS):], notes[len(PRIMARY_LABELS):]):
+            inner_html = bullets_to_html_list(body, item_notes)
+            chunks.append(f"<div><b>{title}</b></div>{inner_html}")
+        others_html = "<br>".join(chunks)
+
+    return {
+        "dialogue_md": fmt_dialogue(dialogue),
+        "sections": sections,
+        "others_html": others_html,
+        # (근거 부족 문장 수, 비교한 문장 수)
+        "grounding": (sum(1 for g in aligned if g is not None and g.low), sum(1 for g in aligned if g is not None)),
+    }
+
+
+def get_row_fragments(
+    dialogue: str, generated: str, parsed: Optional[ParseResult] = None
+) -> Dict[str, object]:
+    key = content_key(dialogue, generated)
+    return _render_cache.get_or_compute(
+        key, lambda: build_row_fragments(dialogue, generated, parsed)
+    )
+
+
+def prerender_rows(df, start: int, count: int, sections=None) -> None:
+    """start 부터 count 개 행을 백그라운드에서 미리 렌더링해 캐시에 적재."""
+    if df is None or count <= 0:
+        return
+    stop = min(len(df), start + count)
+    if start >= stop:
+        return
+    # DataFrame 접근은 현재 스레드에서 끝내고 문자열만 넘김
+    rows = [
+        (
+            str(df.iloc[i]["대화 스크립트"]),
+            str(df.iloc[i]["생성결과"]),
+            row_sections(sections, i) if sections is not None else None,
+        )
+        for i in range(start, stop)
+    ]
+
+    def _work() -> None:
+        for dialogue, generated, parsed in rows:
+            if content_key(dialogue, generated) not in _render_cache:
+                get_row_fragments(dialogue, generated, parsed)
 
-def render_left_panel(container, row, idx):
+    _prerender_pool.submit(_work)
+
+
+@profiling.timed("left_panel.render")
+def render_left_panel(container, row, idx, parsed: Optional[ParseResult] = None):
     """좌측 패널: 대상 데이터 + 대화 스크립트 + CLOVA 생성 결과
     idx 인자는 현재 사용하지 않지만, app.py 호출 형식과 맞추기 위해 받기만 합니다.
+    parsed: 업로드 시 미리 파싱된 (primary, others). 없으면 여기서 파싱합니다.
     """
 
+    frags = get_row_fragments(str(row["대화 스크립트"]), str(row["생성결과"]), parsed)
+
     with container:
 
         # --------------------------
@@ -61,7 +182,7 @@ def render_left_panel(container, row, idx):
         # --------------------------
         with st.expander("대화 스크립트", expanded=True):
             st.markdown(
-                fmt_dialogue(str(row["대화 스크립트"])),
+                frags["dialogue_md"],
                 unsafe_allow_html=True,
             )
 
@@ -69,22 +190,19 @@ def render_left_panel(container, row, idx):
         # CLOVA 생성 결과
         # --------------------------
         with st.expander("CLOVA Charty 생성 결과", expanded=True):
-            primary, others = parse_clova_sections(str(row["생성결과"]))
-
-            for lb in PRIMARY_LABELS:
+            flagged, total = frags["grounding"]
+            if flagged:
+                st.caption(
+                    f"근거 부족 {flagged}/{total}문장 · 노란 표시는 대화 스크립트에서 근거를 찾기 어려운 문장입니다 "
+                    "(마우스를 올리면 근거 비율과 가장 가까운 발화 구간 표시)"
+                )
+            for lb, html_body in frags["sections"]:
                 st.markdown(
                     f"<div class='gen-label'>{lb}</div>",
                     unsafe_allow_html=True,
                 )
 
-                body = primary.get(lb, "")
-                if body:
-                    if lb == "계통문진":
-                        clean_body = format_ros(body)
-                    else:
-                        clean_body = normalize_dash_bullets(body)
-
-                    html_body = bullets_to_html_list(clean_body)
+                if html_body:
                     st.markdown(
                         f"<div class='gen-box'>{html_body}</div>",
                         unsafe_allow_html=True,
@@ -93,21 +211,13 @@ def render_left_panel(container, row, idx):
                     st.markdown("<div class='gen-empty'></div>", unsafe_allow_html=True)
 
             # 기타 섹션
-            if others:
+            if frags["others_html"]:
                 st.markdown(
                     "<div class='gen-label'>기타</div>",
                     unsafe_allow_html=True,
                 )
 
-                chunks = []
-                for title, content in others:
-                    cleaned = normalize_dash_bullets(content)
-                    inner_html = bullets_to_html_list(cleaned)
-                    chunks.append(f"<div><b>{title}</b></div>{inner_html}")
-
-                merged = "<br>".join(chunks)
-
                 st.markdown(
-                    f"<div class='gen-box'>{merged}</div>",
+                    f"<div class='gen-box'>{frags['others_html']}</div>",
                     unsafe_allow_html=True,
-                )
\ No newline at end of file
+                )
@@ -0,0 +1,123 @@
+# components/navigator.py
+from typing import Dict, List, Tuple
+
+import streamlit as st
+
+from components import fragments
+from constants import NAV_PAGE_SIZE
+from utils import profiling
+from utils.progress import ProgressTracker
+
+
+def build_row_index(df) -> Tuple[List[str], Dict[str, int]]:
+    """구분자 목록과 구분자 → 행 번호 사전 (업로드 시 1회 생성)."""
+    ids = df["구분자"].map(str).tolist() if "구분자" in df.columns else [str(i) for i in range(len(df))]
+    index: Dict[str, int] = {}
+    for i, row_id in enumerate(ids):
+        index.setdefault(row_id, i)
+    return ids, index
+
+
+def _go_to(idx: int) -> None:
+    st.session_state.current_idx = idx
+    # 현재 행이 바뀌면 패널과 항목 목록만 다시 그림
+    fragments.invalidate(*fragments.NAVIGATION)
+
+
+def step(delta: int) -> None:
+    """이전/다음 버튼 콜백: 현재 행을 delta 만큼 이동 (처음/끝에서 멈춤)."""
+    n_rows = len(st.session_state.df)
+    _go_to(min(max(st.session_state.current_idx + delta, 0), n_rows - 1))
+
+
+def _on_pick(key: str) -> None:
+    chosen = st.session_state.get(key)
+    if chosen is not None:
+        _go_to(int(chosen))
+
+
+def _on_search() -> None:
+    query = st.session_state.get("nav_search", "").strip()
+    if not query:
+        st.session_state.nav_message = ""
+        return
+    idx = st.session_state.nav_id_index.get(query)
+    if idx is None:
+        st.session_state.nav_message = f"'{query}' 구분자를 찾을 수 없습니다."
+    else:
+        st.session_state.nav_message = ""
+        _go_to(idx)
+
+
+@profiling.timed("navigator.render")
+def render_navigator(container, progress: ProgressTracker) -> None:
+    """사이드바 항목 이동: 현재 페이지(NAV_PAGE_SIZE 행)만 그려 재실행 비용을 페이지 크기에 비례시킴."""
+    ids: List[str] = st.session_state.nav_ids
+    n_rows = progress.total
+    cur = st.session_state.current_idx
+    n_pages = max(1, (n_rows + NAV_PAGE_SIZE - 1) // NAV_PAGE_SIZE)
+
+    # 다른 곳(이전/다음 버튼, 저장 후 다음 등)에서 이동했으면 해당 페이지로 따라감
+    if st.session_state.get("nav_last_idx") != cur:
+        st.session_state.nav_page = cur // NAV_PAGE_SIZE + 1
+        st.session_state.nav_last_idx = cur
+
+    with container:
+        st.text_input(
+            "구분자로 이동",
+            key="nav_search",
+            on_change=_on_search,
+            placeholder="구분자 입력 후 Enter",
+        )
+        if st.session_state.get("nav_message"):
+            st.caption(st.session_state.nav_message)
+
+        c1, c2 = st.columns([1, 1])
+        with c1:
+            unsaved_only = st.checkbox("미저장만", key="nav_unsaved_only")
+        with c2:
+            target = progress.next_unsaved(cur)
+            st.button(
+                "다음 미저장 ▶",
+                disabled=target < 0,
+                on_click=_go_to,
+                args=(target,),
+                key="nav_next_unsaved",
+            )
+
+        page = st.number_input(
+            f"페이지 (총 {n_pages})",
+            min_value=1,
+            max_value=n_pages,
+            step=1,
+            key="nav_page",
+        )
+        start = (int(page) - 1) * NAV_PAGE_SIZE
+
+        if unsaved_only:
+            # 페이지 시작부터 미저장 행을 페이지 크기만큼 수집
+            saved = progress.saved
+            options: List[int] = []
+            i = saved.find(0, start)
+            while i >= 0 and len(options) < NAV_PAGE_SIZE:
+                options.append(i)
+                i = saved.find(0, i + 1)
+        else:
+            options = list(range(start, min(n_rows, start + NAV_PAGE_SIZE)))
+
+        if not options:
+            st.caption("표시할 항목이 없습니다.")
+            return
+
+        # 창(window)이 바뀌면 새 위젯으로 취급하고, 선택 상태는 current_idx 와 맞춤
+        key = f"nav_radio_{start}_{int(unsaved_only)}"
+        st.session_state[key] = cur if cur in options else None
+        st.radio(
+            "항목 선택",
+            options=options,
+            format_func=lambda i: ("✅ " if progress.saved[i] else "⬜ ") + ids[i],
+            key=key,
+            on_change=_on_pick,
+            args=(key,),
+            label_visibility="collapsed",
+        )
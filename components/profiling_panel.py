@@ -0,0 +1,74 @@
+# components/profiling_panel.py
+import os
+
+import streamlit as st
+
+from utils import profiling
+
+# 디버그 패널 표시: EMR_EVAL_DEBUG=1, 계측이 켜져 있을 때, 또는 URL 에 ?debug=1
+# 계측 켜기/초기화/트레이스 다운로드는 프로세스 전체(다른 세션 포함)에 영향을 주므로 EMR_EVAL_DEBUG=1 일 때만.
+# ?debug=1 은 누구나 열 수 있으므로 읽기 전용 패널만 보임
+DEBUG_PANEL = os.environ.get("EMR_EVAL_DEBUG", "") not in ("", "0")
+
+
+def debug_panel_visible() -> bool:
+    return DEBUG_PANEL or profiling.is_enabled() or st.query_params.get("debug") == "1"
+
+
+def _on_toggle() -> None:
+    if DEBUG_PANEL:
+        profiling.enable(st.session_state.get("profiling_enabled", False))
+
+
+def render_profiling_panel(container) -> None:
+    """직전 실행의 구간별 시간, 누적 카운터, 캐시 적중률 (EMR_EVAL_DEBUG 면 계측 켜기/초기화/트레이스 다운로드)."""
+    with container.expander("🛠 프로파일링", expanded=False):
+        if DEBUG_PANEL:
+            # 계측 플래그는 프로세스 단위라 다른 세션에서 바꿨을 수 있으므로 매 실행 동기화
+            st.session_state.profiling_enabled = profiling.is_enabled()
+            st.toggle(
+                "계측 켜기",
+                key="profiling_enabled",
+                on_change=_on_toggle,
+                help="프로세스 전체에 적용됩니다. 끄면 계측 코드는 플래그 확인만 하고 바로 반환합니다.",
+            )
+        else:
+            st.caption("읽기 전용 · 계측 켜기/초기화/트레이스 다운로드는 EMR_EVAL_DEBUG=1 로 실행한 서버에서만 가능합니다.")
+        if not profiling.is_enabled():
+            st.caption("계측이 꺼져 있습니다.")
+            return
+
+        # 현재 실행은 아직 끝나지 않았으므로 직전 실행을 보여 줌
+        run = profiling.previous_run(before=profiling.current_run())
+        summary = profiling.span_summary(run) if run is not None else []
+        if summary:
+            st.caption(f"직전 실행 #{run}")
+            st.dataframe(summary, hide_index=True)
+        else:
+            st.caption("기록된 실행이 없습니다. 화면을 한 번 더 조작하면 표시됩니다.")
+
+        counters = profiling.counters()
+        if counters:
+            st.caption("누적 카운터")
+            st.dataframe([{"이름": k, "값": v} for k, v in sorted(counters.items())], hide_index=True)
+
+        caches = [
+            {"캐시": name, "크기": f"{s['size']}/{s['maxsize']}", "적중": s["hits"], "미스": s["misses"],
+             "적중률": None if s["hit_ratio"] is None else round(s["hit_ratio"], 3)}
+            for name, s in profiling.cache_stats().items()
+        ]
+        if caches:
+            st.caption("캐시")
+            st.dataframe(caches, hide_index=True)
+
+        if not DEBUG_PANEL:
+            return
+        c1, c2 = st.columns(2)
+        c1.download_button(
+            "트레이스 JSONL",
+            data=profiling.export_jsonl,
+            file_name="trace.jsonl",
+            mime="application/x-ndjson",
+        )
+        if c2.button("초기화", key="profiling_reset"):
+            profiling.reset()
@@ -1,11 +1,200 @@
 # components/right_panel.py
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+import pandas as pd
 import streamlit as st
 
+from components import fragments
 from constants import LIKERT_ITEMS, LIKERT_FIXED_DESC, EMR_SECTIONS
+from utils import profiling
+from utils.answer_store import AnswerView
+from utils.parser import ParseResult
+from utils.shared_store import LeaseConflictError, get_store
+from utils.similarity import METRIC_SUFFIXES, reference_sections
+from utils.text_utils import escape_html
 
-def render_right_panel(container, idx: int, prev: Dict[str, Any], df):
+
+# 자동 유사도 계산 완료 확인 주기(초)
+SIMILARITY_POLL_SECONDS = 0.5
+
+
+def _likert_desc_html(desc_items) -> str:
+    first = escape_html(desc_items[0])
+    rest_html = "<br>".join(escape_html(x) for x in desc_items[1:])
+    return (
+        f"<div class='likert-desc'><b>{first}</b>"
+        + (f"<br>{rest_html}" if rest_html else "")
+        + "</div>"
+    )
+
+
+# 항목별 고정 설명 HTML (프로세스당 한 번만 이스케이프)
+LIKERT_DESC_HTML: Dict[int, str] = {
+    i: _likert_desc_html(items) for i, items in LIKERT_FIXED_DESC.items() if items
+}
+# 간결 모드: 접힌 expander 안에 한 번에 그리는 전체 평가 기준
+RUBRIC_HTML = "".join(
+    f"<div><b>{i+1}. {escape_html(label)}</b></div>" + LIKERT_DESC_HTML.get(i, "")
+    for i, label in enumerate(LIKERT_ITEMS)
+)
+LIKERT_ORDER_HINT = " · ".join(f"{i+1} {label.split('(')[0]}" for i, label in enumerate(LIKERT_ITEMS))
+
+
+def _parse_likert_code(code: str) -> Optional[Dict[int, int]]:
+    """간결 모드 점수 입력 (예: "45354", "4 5 3 5 4") → 항목별 점수. 형식이 틀리면 None."""
+    digits = [c for c in code if not c.isspace() and c != ","]
+    if len(digits) != len(LIKERT_ITEMS) or any(c not in "12345" for c in digits):
+        return None
+    return {i: int(c) for i, c in enumerate(digits)}
+
+
+def _likert_inputs(idx: int, prev_likert) -> Dict[int, int]:
+    """항목별 설명 + 1~5 라디오 (기본 모드)."""
+    likert_scores: Dict[int, int] = {}
+    for i, label in enumerate(LIKERT_ITEMS):
+        st.markdown(f"**{i+1}. {label}**")
+
+        # 고정 설명 (모듈 로드 시 만들어 둔 HTML)
+        if i in LIKERT_DESC_HTML:
+            st.markdown(LIKERT_DESC_HTML[i], unsafe_allow_html=True)
+
+        likert_scores[i] = st.radio(
+            "점수 선택",
+            options=[1, 2, 3, 4, 5],
+            index=(
+                prev_likert[i] - 1
+                if i < len(prev_likert) and prev_likert[i]
+                else 2
+            ),
+            horizontal=True,
+            key=f"likert_{idx}_{i}",
+        )
+        st.markdown("---")
+    return likert_scores
+
+
+def _likert_code_input(idx: int, prev_likert) -> str:
+    """간결 모드: 평가 기준은 접어 두고 점수 5자리를 키보드로 입력 (Enter 로 저장)."""
+    with st.expander("평가 기준 보기", expanded=False):
+        st.markdown(RUBRIC_HTML, unsafe_allow_html=True)
+    default = "".join(str(v) if v else "3" for v in prev_likert) if prev_likert else "33333"
+    return st.text_input(
+        f"점수 5자리 ({LIKERT_ORDER_HINT})",
+        value=default,
+        max_chars=9,
+        key=f"likert_code_{idx}",
+        help="항목 순서대로 1~5 점수를 입력하세요. 예: 45354. 입력 후 Enter 를 누르면 저장됩니다.",
+    )
+
+
+@profiling.timed("right_panel.apply_answer")
+def apply_answer(idx: int, answer: Dict[str, Any], journal: bool = True) -> None:
+    """저장된 답변 1건을 세션 상태(답변 저장소/저널)에 반영. 진행 현황/다운로드는 저장소를 따라감."""
+    store = st.session_state.answers
+    store.save(idx, answer)
+    # 새로고침/재시작에도 남도록 저널에 1줄 추가
+    log = st.session_state.get("journal") if journal else None
+    if log is not None:
+        log.append(idx, answer)
+        log.maybe_compact()
+
+
+@st.fragment(run_every=SIMILARITY_POLL_SECONDS)
+def _poll_similarity(idx: int) -> None:
+    """계산 중 안내만 주기적으로 다시 그림. 끝나면 전체를 한 번 다시 실행해 결과 표시 (이후 폴링 중단).
+    (export_panel._poll_job 과 같은 방식: 조각 본문에서는 다른 조각을 지정해 다시 실행할 수 없음)
+    """
+    scorer = st.session_state.get("scorer")
+    if scorer is None or not scorer.pending(idx):
+        st.rerun()
+    st.caption("자동 유사도 계산 중...")
+
+
+def _render_similarity(idx: int) -> None:
+    """저장 시 백그라운드에서 계산된 섹션별 자동 유사도 (정답 EMR vs CLOVA 생성결과)."""
+    scorer = st.session_state.get("scorer")
+    if scorer is None:
+        return
+    if scorer.pending(idx):
+        _poll_similarity(idx)
+        return
+    error = scorer.error(idx)
+    if error is not None:
+        st.caption(f"자동 유사도 계산 실패: {error} (다시 저장하면 재계산합니다)")
+        return
+    scores = scorer.get(idx)
+    if not scores:
+        return
+    rows = {
+        label: dict(zip(METRIC_SUFFIXES, scores[key])) if scores.get(key) is not None else {}
+        for label, key in EMR_SECTIONS
+    }
+    with st.expander("자동 유사도 (작성한 EMR vs CLOVA 생성결과)", expanded=False):
+        st.dataframe(pd.DataFrame.from_dict(rows, orient="index", columns=METRIC_SUFFIXES).round(3))
+
+
+def _form_answer(idx: int, compact: bool) -> Optional[Dict[str, Any]]:
+    """제출된 폼 값(세션 상태) → 답변 dict. 간결 모드 점수 형식이 틀리면 None."""
+    state = st.session_state
+    if compact:
+        likert_scores = _parse_likert_code(state.get(f"likert_code_{idx}", ""))
+        if likert_scores is None:
+            return None
+    else:
+        likert_scores = {i: state.get(f"likert_{idx}_{i}", 3) for i in range(len(LIKERT_ITEMS))}
+    return {
+        "suitable": state.get(f"suitable_{idx}", "Y"),
+        "likert": likert_scores,
+        "emr": {key: state.get(f"emr_{idx}_{key}", "") for _, key in EMR_SECTIONS},
+        "saved": True,
+    }
+
+
+def _on_submit(idx: int, go_next: bool, compact: bool, parsed: Optional[ParseResult]) -> None:
+    """저장/저장 후 다음 콜백. 저장은 폼과 진행 현황만, 이동까지 하면 패널도 다시 그림."""
+    answer = _form_answer(idx, compact)
+    if answer is None:
+        st.session_state.form_notice = (idx, "error", "점수는 1~5 사이 숫자 5개로 입력하세요 (예: 45354).")
+        fragments.invalidate(fragments.FORM)
+        return
+    if st.session_state.get("shared_mode") and st.session_state.get("dataset_digest"):
+        # 공유 모드: 중앙 저장소에 먼저 기록 (다른 평가자가 작업 중이면 거부)
+        try:
+            get_store().save_answer(st.session_state.dataset_digest, idx, answer, st.session_state.reviewer_id)
+        except LeaseConflictError as e:
+            st.session_state.form_notice = (idx, "error", str(e))
+            fragments.invalidate(fragments.FORM)
+            return
+    store = st.session_state.answers
+    first_save = idx not in store
+    apply_answer(idx, answer)
+    scorer = st.session_state.get("scorer")
+    if scorer is not None and parsed is not None:
+        # 채점은 백그라운드 프로세스에서 진행되고 화면은 기다리지 않음
+        scorer.submit(idx, answer["emr"], reference_sections(*parsed))
+
+    keys = [fragments.FORM, fragments.PROGRESS]
+    if first_save:
+        # 항목 목록의 저장 표시(✅)와 '다음 미저장' 대상이 바뀜
+        keys.append(fragments.NAV)
+    if store.progress.all_done:
+        # 다운로드 패널이 열리거나 결과 파일을 다시 만들어야 함
+        keys.append(fragments.EXPORT)
+    if go_next:
+        if st.session_state.get("shared_mode"):
+            st.session_state.shared_lease_request = True
+        else:
+            st.session_state.current_idx = min(idx + 1, len(st.session_state.df) - 1)
+            keys.extend(fragments.NAVIGATION)
+    else:
+        st.session_state.form_notice = (idx, "success", "저장되었습니다.")
+    fragments.invalidate(*keys)
+
+
+@profiling.timed("right_panel.render")
+def render_right_panel(container, idx: int, prev: Optional[AnswerView], df, parsed: Optional[ParseResult] = None):
+    # 간결 모드: 평가 기준을 접고 점수를 한 칸에 입력해 위젯/전송량을 줄임
+    compact = bool(st.session_state.get("compact_form"))
     with container:
         st.markdown(
             "<div class='section-box'>평가 및 데이터 작성</div>",
@@ -20,15 +209,12 @@ def render_right_panel(container, idx: int, prev: Dict[str, Any], df):
                     "<div class='muted'>대화 스크립트를 읽고 해당 평가를 진행할 수 있는 스크립트 인지 여부를 표시해주세요.</div>",
                     unsafe_allow_html=True,
                 )
-                suitable = st.radio(
+                st.radio(
                     "적합 여부",
                     options=["Y", "N"],
-                    index=(
-                        ["Y", "N"].index(prev.get("suitable", "Y"))
-                        if prev.get("suitable") in ["Y", "N"]
-                        else 0
-                    ),
+                    index=["Y", "N"].index(prev.suitable) if prev is not None else 0,
                     horizontal=True,
+                    key=f"suitable_{idx}",
                 )
 
             # 2) CLOVA Charty 결과 품질 평가
@@ -37,46 +223,12 @@ def render_right_panel(container, idx: int, prev: Dict[str, Any], df):
                     "<div class='muted'>좌측 패널의 <b>CLOVA Charty 생성 결과</b>를 참고하여, 각 항목을 1~5점으로 평가해주세요.</div>",
                     unsafe_allow_html=True,
                 )
-                st.markdown("---")
-
-                likert_scores: Dict[int, int] = {}
-                for i, label in enumerate(LIKERT_ITEMS):
-                    st.markdown(f"**{i+1}. {label}**")
-
-                    # 고정 설명
-                    def esc(s: str) -> str:
-                        return (
-                            s.replace("&", "&amp;")
-                            .replace("<", "&lt;")
-                            .replace(">", "&gt;")
-                            .replace('"', "&quot;")
-                            .replace("'", "&#39;")
-                        )
-
-                    desc_items = LIKERT_FIXED_DESC.get(i, [])
-                    if desc_items:
-                        first = esc(desc_items[0])
-                        rest = [esc(x) for x in desc_items[1:]]
-                        rest_html = "<br>".join(rest) if rest else ""
-                        st.markdown(
-                            f"<div class='likert-desc'><b>{first}</b>"
-                            + (f"<br>{rest_html}" if rest_html else "")
-                            + "</div>",
-                            unsafe_allow_html=True,
-                        )
-
-                    likert_scores[i] = st.radio(
-                        "점수 선택",
-                        options=[1, 2, 3, 4, 5],
-                        index=(
-                            int(prev.get("likert", {}).get(i, 3)) - 1
-                            if prev.get("likert")
-                            else 2
-                        ),
-                        horizontal=True,
-                        key=f"likert_{idx}_{i}",
-                    )
+                prev_likert = prev.likert if prev is not None else []
+                if compact:
+                    _likert_code_input(idx, prev_likert)
+                else:
                     st.markdown("---")
+                    _likert_inputs(idx, prev_likert)
 
             # 3) 대화 기반 의무기록 생성
             with st.expander("3) 대화 기반 의무기록 생성", expanded=True):
@@ -84,32 +236,24 @@ def render_right_panel(container, idx: int, prev: Dict[str, Any], df):
                     "<div class='muted'>대화 스크립트를 참고하여 초진기록 항목에 맞는 내용을 작성해주세요. 항목에 해당되는 내용이 없다면 쓰지 않아도 됩니다.</div>",
                     unsafe_allow_html=True,
                 )
-                emr_vals: Dict[str, str] = {}
+                prev_emr = prev.emr if prev is not None else {}
                 for label, key in EMR_SECTIONS:
-                    emr_vals[key] = st.text_area(
+                    st.text_area(
                         label,
-                        value=str(prev.get("emr", {}).get(key, "")),
+                        value=prev_emr.get(key, ""),
                         key=f"emr_{idx}_{key}",
                         height=120,
                     )
 
-            # 저장/다음 버튼
+            # 저장/다음 버튼 (저장 처리는 콜백에서 하고 필요한 조각만 다시 그림)
             csave, cnext = st.columns([1, 3])
             with csave:
-                submitted = st.form_submit_button("저장")
+                st.form_submit_button("저장", on_click=_on_submit, args=(idx, False, compact, parsed))
             with cnext:
-                submitted_next = st.form_submit_button("저장 후 다음")
-
-            if submitted or submitted_next:
-                st.session_state.answers[idx] = {
-                    "suitable": suitable,
-                    "likert": likert_scores,
-                    "emr": emr_vals,
-                    "saved": True,
-                }
-                if submitted_next:
-                    next_idx = min(idx + 1, len(df) - 1)
-                    st.session_state.current_idx = next_idx
-                    st.session_state.ignore_radio_once = True
-                st.success("저장되었습니다.")
-                st.rerun()
\ No newline at end of file
+                st.form_submit_button("저장 후 다음", on_click=_on_submit, args=(idx, True, compact, parsed))
+
+            notice = st.session_state.pop("form_notice", None)
+            if notice is not None and notice[0] == idx:
+                (st.error if notice[1] == "error" else st.success)(notice[2])
+
+        _render_similarity(idx)
@@ -0,0 +1,116 @@
+# components/search_panel.py
+from typing import Optional, Tuple
+
+import numpy as np
+import streamlit as st
+
+from components import fragments
+from utils import profiling
+from utils.progress import ProgressTracker
+from utils.search import SCOPE_ALL, SEARCH_SCOPES, SearchIndex, SearchResult
+
+# 한 번에 확인/표시하는 최대 결과 수
+SEARCH_RESULT_LIMIT = 200
+SAVED_FILTERS = {"전체": None, "저장": True, "미저장": False}
+
+
+def _run_search(index: SearchIndex, progress: ProgressTracker) -> Tuple[tuple, Optional[SearchResult]]:
+    """현재 입력값으로 검색. 같은 조건(저장 상태 포함)이면 세션에 보관한 결과 재사용."""
+    query = st.session_state.get("search_query", "").strip()
+    scope = st.session_state.get("search_scope", SCOPE_ALL)
+    want = SAVED_FILTERS[st.session_state.get("search_saved", "전체")]
+    # 저장 필터가 있으면 저장 현황이 바뀔 때 다시 검색
+    key = (id(index), query, scope, want, progress.done if want is not None else None)
+    cached = st.session_state.get("search_cache")
+    if cached is not None and cached[0] == key:
+        return key, cached[1]
+    result = None
+    if query:
+        saved = np.frombuffer(progress.saved, dtype=bool) if want is not None else None
+        result = index.search(query, scope, saved, want, limit=SEARCH_RESULT_LIMIT)
+    st.session_state.search_cache = (key, result)
+    return key, result
+
+
+def _jump(rows: np.ndarray, forward: bool = True) -> None:
+    """현재 행 다음(이전) 결과로 이동, 끝에 닿으면 처음(끝)으로."""
+    if not len(rows):
+        return
+    cur = st.session_state.current_idx
+    if forward:
+        pos = int(np.searchsorted(rows, cur, side="right"))
+        st.session_state.current_idx = int(rows[pos % len(rows)])
+    else:
+        pos = int(np.searchsorted(rows, cur, side="left")) - 1
+        st.session_state.current_idx = int(rows[pos])
+    fragments.invalidate(*fragments.NAVIGATION)
+
+
+def _on_query(index: SearchIndex, progress: ProgressTracker) -> None:
+    # Enter 로 검색하면 바로 첫 결과(현재 행 이후)로 이동
+    _, result = _run_search(index, progress)
+    if result is not None:
+        _jump(result.rows)
+
+
+def _on_pick(key: str) -> None:
+    chosen = st.session_state.get(key)
+    if chosen is not None:
+        st.session_state.current_idx = int(chosen)
+        fragments.invalidate(*fragments.NAVIGATION)
+
+
+@profiling.timed("search_panel.render")
+def render_search_panel(
+    container, index: Optional[SearchIndex], progress: ProgressTracker, error: Optional[BaseException] = None
+) -> None:
+    """대화 스크립트/생성결과/섹션 본문 검색. 결과를 고르면 해당 행으로 이동."""
+    with container.expander("🔎 본문 검색", expanded=bool(st.session_state.get("search_query"))):
+        if error is not None:
+            st.caption(f"검색 색인을 만들지 못했습니다: {error}")
+            return
+        if index is None:
+            st.caption("검색 색인 생성 중… 잠시 후 다시 시도하세요.")
+            return
+
+        st.text_input(
+            "검색어",
+            key="search_query",
+            on_change=_on_query,
+            args=(index, progress),
+            placeholder="공백으로 나눈 단어를 모두 포함 (Enter)",
+        )
+        c1, c2 = st.columns([3, 2])
+        with c1:
+            st.selectbox("범위", SEARCH_SCOPES, key="search_scope")
+        with c2:
+            st.selectbox("저장 상태", list(SAVED_FILTERS), key="search_saved")
+
+        key, result = _run_search(index, progress)
+        if result is None:
+            return
+        rows = result.rows
+        count = f"{len(rows):,}건" if result.complete else f"{len(rows):,}건 이상"
+        st.caption(f"{count} · {result.seconds * 1000:.1f} ms")
+        if not len(rows):
+            return
+
+        b1, b2 = st.columns(2)
+        b1.button("◀ 이전 결과", key="search_prev", on_click=_jump, args=(rows, False))
+        b2.button("다음 결과 ▶", key="search_next", on_click=_jump, args=(rows, True))
+
+        cur = st.session_state.current_idx
+        ids = st.session_state.nav_ids
+        options = rows.tolist()
+        # 검색 조건이 바뀌면 새 위젯으로 취급하고, 선택 상태는 current_idx 와 맞춤
+        radio_key = f"search_pick_{abs(hash(key))}"
+        st.session_state[radio_key] = cur if cur in options else None
+        st.radio(
+            "검색 결과",
+            options=options,
+            format_func=lambda i: ("✅ " if progress.saved[i] else "⬜ ") + ids[i],
+            key=radio_key,
+            on_change=_on_pick,
+            args=(radio_key,),
+            label_visibility="collapsed",
+        )
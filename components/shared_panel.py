@@ -0,0 +1,60 @@
+# components/shared_panel.py
+import uuid
+from typing import Optional
+
+import streamlit as st
+
+
+def render_shared_panel(container) -> Optional[str]:
+    """공유 작업 모드: 중앙 저장소 동기화 + 행 할당.
+    반환값: 사용자가 열기를 선택한 공유 데이터셋 digest (없으면 None)
+    """
+    with container:
+        enabled = st.toggle("공유 작업 모드 (여러 평가자)", key="shared_mode")
+        if not enabled:
+            return None
+        # 공유 모드를 켰을 때만 저장소(sqlite3)와 답변 처리 모듈을 로드
+        from components.right_panel import apply_answer
+        from utils.shared_store import get_store
+
+        if "reviewer_id" not in st.session_state:
+            st.session_state.reviewer_id = uuid.uuid4().hex[:8]
+        st.text_input("평가자 ID", key="reviewer_id")
+
+        store = get_store()
+        df = st.session_state.df
+        digest = st.session_state.dataset_digest
+
+        # 아직 데이터가 없으면 다른 평가자가 올린 데이터셋을 열 수 있음
+        if df is None or digest is None:
+            datasets = store.list_datasets()
+            if not datasets:
+                st.caption("공유된 데이터셋이 없습니다. 파일을 업로드하면 공유됩니다.")
+                return None
+            names = {d: f"{name} ({n:,}행)" for d, name, n in datasets}
+            choice = st.selectbox("공유 데이터셋", options=list(names), format_func=names.get)
+            if st.button("공유 데이터셋 열기"):
+                return choice
+            return None
+
+        if st.session_state.get("shared_registered") != digest:
+            store.register_dataset(digest, st.session_state.get("dataset_name") or digest[:12], df)
+            st.session_state.shared_registered = digest
+            st.session_state.shared_seq = 0
+
+        # 다른 평가자가 저장한 답변만 증분 반영 (로컬 저널에는 쓰지 않음)
+        changed, st.session_state.shared_seq = store.changes_since(digest, st.session_state.shared_seq)
+        for idx, answer in changed.items():
+            apply_answer(idx, answer, journal=False)
+
+        lease_clicked = st.button("다음 할당 받기")
+        if lease_clicked or st.session_state.pop("shared_lease_request", False):
+            idx = store.lease_next(digest, st.session_state.reviewer_id)
+            if idx is None:
+                st.info("할당할 남은 항목이 없습니다.")
+            else:
+                st.session_state.current_idx = idx
+
+        done, leased = store.counts(digest)
+        st.caption(f"공유 저장 {done:,} / {len(df):,} · 작업 중 {leased}")
+    return None
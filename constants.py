@@ -3,6 +3,8 @@ from typing import List, Tuple, Dict
 
 # 업로드 필수 컬럼
 REQUIRED_COLS = ["구분자", "대화 스크립트", "생성결과"]
+# 있으면 함께 읽는 컬럼 (그 외 컬럼은 메모리에 올리지 않음)
+OPTIONAL_COLS = ["진료일시"]
 
 
 LIKERT_ITEMS: List[str] = [
@@ -25,6 +27,12 @@ LIKERT_FIXED_DESC: Dict[int, List[str]] = {
 PRIMARY_LABELS: List[str] = ["주호소", "현병력", "과거력", "개인력 및 사회력", "계통문진", "신체검진"]
 EXCLUDE_LABELS: List[str] = ["진단명", "진단", "진료계획", "진료 계획", "계획"]
 
+# 좌측 패널: 현재 행 다음으로 미리 렌더링해 둘 행 수 (0 이면 사용 안 함)
+PRERENDER_AHEAD = 5
+
+# 사이드바 항목 목록: 한 페이지에 표시할 행 수
+NAV_PAGE_SIZE = 50
+
 # 사용자가 작성하는 EMR 정답 섹션
 EMR_SECTIONS: List[Tuple[str, str]] = [
     ("주호소", "chief_complaint"),
@@ -35,6 +43,18 @@ EMR_SECTIONS: List[Tuple[str, str]] = [
     ("기타", "other"),
 ]
 
+# 자동 유사도: EMR 정답 섹션 키 → 비교 대상 CLOVA 파싱 섹션
+# (기타는 개인력 및 사회력과 PRIMARY_LABELS 밖의 나머지 섹션을 합쳐 비교)
+EMR_TO_PRIMARY: Dict[str, List[str]] = {
+    "chief_complaint": ["주호소"],
+    "present_illness": ["현병력"],
+    "past_history": ["과거력"],
+    "review_of_systems": ["계통문진"],
+    "physical_exam": ["신체검진"],
+    "other": ["개인력 및 사회력"],
+}
+EMR_OTHERS_KEY = "other"
+
 # 다운로드 엑셀 컬럼 순서
 DOWNLOAD_COLUMNS: List[str] = (
     ["새_구분자", "원_구분자"]
@@ -1,9 +1,13 @@
 # styles.py
+import os
+from functools import lru_cache
+
 import streamlit as st
 
-def inject_styles() -> None:
-    st.markdown(
-        """
+LOGO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "shl_logo.png")
+
+# 전역 CSS (모듈 로드 시 1회 생성, 매 rerun 에는 같은 문자열을 그대로 전달)
+STYLES_HTML = """
     <style>
     .fixed-progress {
         position: sticky;
@@ -54,6 +58,12 @@ def inject_styles() -> None:
         background:#fafafa;
         margin:6px 0 12px 0;
     }
+    .ungrounded {
+        background:#fef3c7;
+        text-decoration: underline dotted #d97706;
+        text-underline-offset: 3px;
+        cursor: help;
+    }
     .muted {
         color:#6b7280;
         font-size:0.92rem;
@@ -89,6 +99,15 @@ def inject_styles() -> None:
         background: #9b9b9b;
     }
     </style>
-    """,
-        unsafe_allow_html=True,
-    )
\ No newline at end of file
+    """
+
+
+@lru_cache(maxsize=1)
+def logo_bytes() -> bytes:
+    """사이드바 로고 PNG 바이트 (프로세스당 한 번만 읽음)."""
+    with open(LOGO_PATH, "rb") as f:
+        return f.read()
+
+
+def inject_styles() -> None:
+    st.markdown(STYLES_HTML, unsafe_allow_html=True)
\ No newline at end of file
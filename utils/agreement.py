@@ -0,0 +1,322 @@
+# utils/agreement.py
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from constants import DOWNLOAD_COLUMNS, LIKERT_ITEMS
+from utils import profiling
+from utils.loader import read_upload
+
+ID_COL = "원_구분자"
+RATER_COL = "평가자"
+SCORE_COLUMNS: List[str] = [c for c in DOWNLOAD_COLUMNS if c.startswith("리커트_")]
+N_CATEGORIES = 5
+
+# 이 파일 수 이상이면 결과 파일 읽기를 프로세스 풀에서 병렬 처리
+PARALLEL_MIN_FILES = 8
+# 부트스트랩: 반복 횟수 기본값 / 한 작업 단위의 반복 수 / 풀을 쓰는 최소 (평가 단위 × 반복) 규모
+BOOTSTRAP_REPS = 1000
+BOOTSTRAP_CHUNK = 50
+PARALLEL_MIN_WORK = 2_000_000
+# 평가자 쌍 contingency 를 누적할 평가 단위 묶음 크기 (메모리 상한용)
+PAIR_CHUNK_ITEMS = 4096
+
+ExportSource = Union[str, Tuple[str, bytes]]
+
+
+# ---------------- 결과 파일 읽기 ----------------
+def _read_export(source: ExportSource) -> pd.DataFrame:
+    """결과 파일 1개(경로 또는 (이름, 바이트)) → 원_구분자 + 리커트 점수 (워커 프로세스용)."""
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            data = f.read()
+        name = source
+    else:
+        name, data = source
+    df = read_upload(BytesIO(data), name, required=[ID_COL] + SCORE_COLUMNS, optional=[])
+    df[ID_COL] = df[ID_COL].map(str)
+    for c in SCORE_COLUMNS:
+        df[c] = pd.to_numeric(df[c], errors="coerce")
+    return df
+
+
+def load_exports(sources: Sequence[ExportSource], workers: Optional[int] = None) -> pd.DataFrame:
+    """여러 결과 파일(DOWNLOAD_COLUMNS 형식)을 평가자별 긴 표로 합침.
+
+    - 파일 1개 = 평가자 1명 (이름이 겹치면 번호를 붙여 구분)
+    - 파일이 PARALLEL_MIN_FILES 개 이상이면 프로세스 풀에서 병렬로 읽기
+    반환 컬럼: 평가자, 원_구분자, 리커트_1_점수 ~ 리커트_5_점수
+    """
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for src in sources:
+        base = os.path.basename(src if isinstance(src, str) else src[0])
+        seen[base] = seen.get(base, 0) + 1
+        names.append(base if seen[base] == 1 else f"{base} ({seen[base]})")
+
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+    if n_workers > 1 and len(sources) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            frames = list(pool.map(_read_export, sources))
+    else:
+        frames = [_read_export(src) for src in sources]
+
+    parts = []
+    for name, df in zip(names, frames):
+        # 한 파일 안에 같은 원_구분자가 여러 번 있으면 마지막 평가를 사용
+        df = df.drop_duplicates(ID_COL, keep="last")
+        parts.append(df.assign(**{RATER_COL: name})[[RATER_COL, ID_COL] + SCORE_COLUMNS])
+    if not parts:
+        return pd.DataFrame(columns=[RATER_COL, ID_COL] + SCORE_COLUMNS)
+    return pd.concat(parts, ignore_index=True)
+
+
+def rating_matrix(ratings: pd.DataFrame, column: str) -> Tuple[np.ndarray, pd.Index, pd.Index]:
+    """긴 표 → (평가 단위 × 평가자) 점수 행렬 (0 = 평가 없음), 단위/평가자 목록."""
+    item_codes, items = pd.factorize(ratings[ID_COL], sort=True)
+    rater_codes, raters = pd.factorize(ratings[RATER_COL], sort=False)
+    scores = ratings[column].to_numpy(dtype=float)
+    valid = np.isfinite(scores) & (scores >= 1) & (scores <= N_CATEGORIES)
+    matrix = np.zeros((len(items), len(raters)), dtype=np.int8)
+    matrix[item_codes[valid], rater_codes[valid]] = np.rint(scores[valid]).astype(np.int8)
+    return matrix, pd.Index(items), pd.Index(raters)
+
+
+def category_counts(matrix: np.ndarray) -> np.ndarray:
+    """(평가 단위 × 평가자) 점수 행렬 → (평가 단위 × 5) 점수별 평가 수."""
+    n_items = matrix.shape[0]
+    flat = np.arange(n_items)[:, None] * (N_CATEGORIES + 1) + matrix
+    counts = np.bincount(flat.ravel(), minlength=n_items * (N_CATEGORIES + 1))
+    return counts.reshape(n_items, N_CATEGORIES + 1)[:, 1:]
+
+
+# ---------------- 일치도 지표 ----------------
+def _distance(metric: str) -> np.ndarray:
+    c = np.arange(N_CATEGORIES)
+    if metric == "nominal":
+        return (c[:, None] != c[None, :]).astype(float)
+    if metric == "interval":
+        return (c[:, None] - c[None, :]).astype(float) ** 2
+    raise ValueError(f"지원하지 않는 거리 척도: {metric}")
+
+
+def _unit_terms(counts: np.ndarray) -> Dict[str, np.ndarray]:
+    """평가 단위별 기여분. 부트스트랩은 이 값들의 가중합만으로 계산됨.
+
+    2명 이상이 평가한 단위만 사용 (1명뿐인 단위는 일치도 정보가 없음).
+    """
+    counts = counts[counts.sum(axis=1) >= 2].astype(float)
+    m = counts.sum(axis=1)
+    # Fleiss: 단위별 평가자 쌍 일치 비율
+    agree = ((counts ** 2).sum(axis=1) - m) / (m * (m - 1))
+    # Krippendorff: 단위별 일치 행렬(coincidence) 기여분, (단위 수 × 25)
+    pairs = counts[:, :, None] * counts[:, None, :]
+    idx = np.arange(N_CATEGORIES)
+    pairs[:, idx, idx] -= counts
+    coincidence = (pairs / (m - 1)[:, None, None]).reshape(len(counts), -1)
+    return {"counts": counts, "m": m, "agree": agree, "coincidence": coincidence}
+
+
+def _weighted_stats(terms: Dict[str, np.ndarray], weights: np.ndarray, metric: str) -> Tuple[np.ndarray, np.ndarray]:
+    """단위 가중치 (B × 단위 수) → 반복별 (Fleiss κ, Krippendorff α)."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Fleiss' kappa (평가자 수가 단위마다 달라도 되는 일반형)
+        p_bar = weights @ terms["agree"] / weights.sum(axis=1)
+        p_cat = (weights @ terms["counts"]) / (weights @ terms["m"])[:, None]
+        p_e = (p_cat ** 2).sum(axis=1)
+        fleiss = (p_bar - p_e) / (1 - p_e)
+
+        # Krippendorff's alpha
+        o = (weights @ terms["coincidence"]).reshape(-1, N_CATEGORIES, N_CATEGORIES)
+        n_c = o.sum(axis=1)
+        n = n_c.sum(axis=1)
+        if metric == "ordinal":
+            cum = np.cumsum(n_c, axis=1)
+            lo = np.minimum.outer(np.arange(N_CATEGORIES), np.arange(N_CATEGORIES))
+            hi = np.maximum.outer(np.arange(N_CATEGORIES), np.arange(N_CATEGORIES))
+            between = cum[:, hi] - cum[:, lo] + n_c[:, lo]
+            delta = (between - (n_c[:, :, None] + n_c[:, None, :]) / 2) ** 2
+        else:
+            delta = np.broadcast_to(_distance(metric), o.shape)
+        d_o = (o * delta).sum(axis=(1, 2))
+        d_e = (n_c[:, :, None] * n_c[:, None, :] * delta).sum(axis=(1, 2))
+        alpha = 1 - (n - 1) * d_o / d_e
+    return fleiss, alpha
+
+
+def fleiss_kappa(counts: np.ndarray) -> float:
+    """(평가 단위 × 5) 점수별 평가 수 → Fleiss' kappa."""
+    terms = _unit_terms(counts)
+    return float(_weighted_stats(terms, np.ones((1, len(terms["m"]))), "nominal")[0][0])
+
+
+def krippendorff_alpha(counts: np.ndarray, metric: str = "ordinal") -> float:
+    """(평가 단위 × 5) 점수별 평가 수 → Krippendorff's alpha (nominal/ordinal/interval)."""
+    terms = _unit_terms(counts)
+    return float(_weighted_stats(terms, np.ones((1, len(terms["m"]))), metric)[1][0])
+
+
+def pairwise_contingency(matrix: np.ndarray) -> np.ndarray:
+    """모든 평가자 쌍의 5×5 교차표 (R × R × 5 × 5).
+
+    평가자별 점수를 one-hot 으로 펼친 뒤 X.T @ X 한 번으로 모든 쌍을 계산.
+    """
+    n_items, n_raters = matrix.shape
+    width = n_raters * N_CATEGORIES
+    total = np.zeros((width, width), dtype=np.float64)
+    for start in range(0, n_items, PAIR_CHUNK_ITEMS):
+        block = matrix[start:start + PAIR_CHUNK_ITEMS].astype(np.int64)
+        onehot = np.zeros((block.shape[0], n_raters, N_CATEGORIES + 1), dtype=np.float32)
+        np.put_along_axis(onehot, block[:, :, None], 1.0, axis=2)
+        x = onehot[:, :, 1:].reshape(block.shape[0], width)
+        total += (x.T @ x).astype(np.float64)
+    return total.reshape(n_raters, N_CATEGORIES, n_raters, N_CATEGORIES).transpose(0, 2, 1, 3)
+
+
+def cohen_kappa_pairs(
+    matrix: np.ndarray, weights: Optional[str] = None, min_overlap: int = 2
+) -> np.ndarray:
+    """평가자 쌍별 Cohen's kappa (R × R, 공통 평가 단위가 min_overlap 미만이면 NaN).
+
+    weights: None(가중치 없음) / "linear" / "quadratic"
+    """
+    table = pairwise_contingency(matrix)
+    n = table.sum(axis=(2, 3))
+    c = np.arange(N_CATEGORIES)
+    if weights is None:
+        disagree = (c[:, None] != c[None, :]).astype(float)
+    elif weights == "linear":
+        disagree = np.abs(c[:, None] - c[None, :]) / (N_CATEGORIES - 1)
+    elif weights == "quadratic":
+        disagree = ((c[:, None] - c[None, :]) / (N_CATEGORIES - 1)) ** 2
+    else:
+        raise ValueError(f"지원하지 않는 가중치: {weights}")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        observed = (table * disagree).sum(axis=(2, 3)) / n
+        rows = table.sum(axis=3) / n[:, :, None]
+        cols = table.sum(axis=2) / n[:, :, None]
+        expected = np.einsum("abi,abj,ij->ab", rows, cols, disagree)
+        kappa = 1 - observed / expected
+    kappa[n < min_overlap] = np.nan
+    np.fill_diagonal(kappa, np.nan)
+    return kappa
+
+
+def mean_cohen_kappa(matrix: np.ndarray, weights: Optional[str] = None) -> float:
+    """평가자 쌍별 Cohen's kappa 의 평균 (Light's kappa)."""
+    kappa = cohen_kappa_pairs(matrix, weights)
+    upper = kappa[np.triu_indices_from(kappa, k=1)]
+    upper = upper[np.isfinite(upper)]
+    return float(upper.mean()) if len(upper) else float("nan")
+
+
+# ---------------- 부트스트랩 ----------------
+def _bootstrap_chunk(args: Tuple[Dict[str, np.ndarray], np.random.SeedSequence, int, str]) -> np.ndarray:
+    """평가 단위를 복원추출한 reps 회 반복의 (Fleiss κ, α) 배열 (워커 프로세스용)."""
+    terms, seed, reps, metric = args
+    rng = np.random.default_rng(seed)
+    n_units = len(terms["m"])
+    # 반복별 단위 추출 횟수 = 추출 인덱스의 bincount (multinomial 보다 빠름)
+    draws = rng.integers(0, n_units, size=(reps, n_units)) + np.arange(reps)[:, None] * n_units
+    weights = np.bincount(draws.ravel(), minlength=reps * n_units).reshape(reps, n_units).astype(float)
+    fleiss, alpha = _weighted_stats(terms, weights, metric)
+    return np.column_stack([fleiss, alpha])
+
+
+def bootstrap_ci(
+    counts: np.ndarray,
+    reps: int = BOOTSTRAP_REPS,
+    level: float = 0.95,
+    metric: str = "ordinal",
+    seed: int = 0,
+    workers: Optional[int] = None,
+) -> Dict[str, Tuple[float, float]]:
+    """평가 단위 부트스트랩으로 Fleiss κ / Krippendorff α 의 백분위 신뢰구간.
+
+    반복은 BOOTSTRAP_CHUNK 단위로 나눠 각자 고정된 시드를 쓰므로 워커 수와 무관하게 결과가 같음.
+    작업량이 PARALLEL_MIN_WORK 이상이면 프로세스 풀에서 병렬 처리.
+    """
+    terms = _unit_terms(counts)
+    n_units = len(terms["m"])
+    if n_units < 2 or reps <= 0:
+        nan = (float("nan"), float("nan"))
+        return {"fleiss": nan, "alpha": nan}
+    sizes = [min(BOOTSTRAP_CHUNK, reps - i) for i in range(0, reps, BOOTSTRAP_CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(terms, s, size, metric) for s, size in zip(seeds, sizes)]
+
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+    if n_workers > 1 and len(sizes) > 1 and n_units * reps >= PARALLEL_MIN_WORK:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(_bootstrap_chunk, tasks))
+    else:
+        results = [_bootstrap_chunk(t) for t in tasks]
+    samples = np.vstack(results)
+
+    tail = (1 - level) / 2 * 100
+    out: Dict[str, Tuple[float, float]] = {}
+    for name, col in (("fleiss", samples[:, 0]), ("alpha", samples[:, 1])):
+        col = col[np.isfinite(col)]
+        if len(col):
+            lo, hi = np.percentile(col, [tail, 100 - tail])
+            out[name] = (float(lo), float(hi))
+        else:
+            out[name] = (float("nan"), float("nan"))
+    return out
+
+
+# ---------------- 보고서 ----------------
+@profiling.timed("agreement.report")
+def agreement_report(
+    ratings: pd.DataFrame,
+    reps: int = BOOTSTRAP_REPS,
+    level: float = 0.95,
+    metric: str = "ordinal",
+    cohen_weights: Optional[str] = "quadratic",
+    seed: int = 0,
+    workers: Optional[int] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """리커트 항목별 일치도 표와 처리 통계.
+
+    컬럼: 평가 단위 수(2명 이상 평가), 평가 수, Cohen κ(쌍 평균), Fleiss κ, Krippendorff α 와
+    Fleiss/α 의 부트스트랩 신뢰구간.
+    """
+    t0 = time.perf_counter()
+    rows: List[Dict[str, Any]] = []
+    n_raters = 0
+    for label, column in zip(LIKERT_ITEMS, SCORE_COLUMNS):
+        matrix, _, raters = rating_matrix(ratings, column)
+        n_raters = len(raters)
+        counts = category_counts(matrix)
+        terms = _unit_terms(counts)
+        fleiss, alpha = _weighted_stats(terms, np.ones((1, len(terms["m"]))), metric)
+        ci = bootstrap_ci(counts, reps, level, metric, seed, workers)
+        rows.append(
+            {
+                "항목": label,
+                "평가 단위 수": len(terms["m"]),
+                "평가 수": int(np.count_nonzero(matrix)),
+                "Cohen κ(쌍 평균)": mean_cohen_kappa(matrix, cohen_weights),
+                "Fleiss κ": float(fleiss[0]),
+                "Fleiss κ 하한": ci["fleiss"][0],
+                "Fleiss κ 상한": ci["fleiss"][1],
+                "Krippendorff α": float(alpha[0]),
+                "α 하한": ci["alpha"][0],
+                "α 상한": ci["alpha"][1],
+            }
+        )
+    elapsed = time.perf_counter() - t0
+    stats: Dict[str, Any] = {
+        "ratings": len(ratings),
+        "raters": n_raters,
+        "items": int(ratings[ID_COL].nunique()) if len(ratings) else 0,
+        "reps": reps,
+        "metric": metric,
+        "seconds": elapsed,
+    }
+    return pd.DataFrame(rows).set_index("항목"), stats
@@ -0,0 +1,121 @@
+# utils/analytics.py
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from constants import LIKERT_ITEMS
+
+N_LIKERT = len(LIKERT_ITEMS)
+SCORES = np.arange(1, 6)
+
+
+class LikertStats:
+    """리커트 점수 집계용 충분통계량. 저장 1건마다 O(항목 수²) 로 갱신.
+
+    - hist: (5, 6) 항목별 점수 빈도 (열 0 은 값 없음, 1~5 는 점수)
+    - n_complete / sums / products: 5개 항목이 모두 있는 행의 합/곱의 합 (상관계수용)
+    - n_saved / n_suitable: 저장 행 수, 평가 적합(Y) 행 수
+    모든 누적값은 정수라 더하고 빼도 오차가 쌓이지 않음.
+    """
+
+    def __init__(self) -> None:
+        self.hist = np.zeros((N_LIKERT, 6), dtype=np.int64)
+        self.n_complete = 0
+        self.sums = np.zeros(N_LIKERT, dtype=np.int64)
+        self.products = np.zeros((N_LIKERT, N_LIKERT), dtype=np.int64)
+        self.n_saved = 0
+        self.n_suitable = 0
+
+    @classmethod
+    def from_arrays(cls, likert: np.ndarray, suitable: np.ndarray, saved: np.ndarray) -> "LikertStats":
+        """(n_rows, 5) 점수 행렬과 저장 여부에서 한 번에 집계 (행 단위 반복 없음)."""
+        stats = cls()
+        scores = likert[saved].astype(np.int64)
+        stats.n_saved = int(scores.shape[0])
+        stats.n_suitable = int(np.count_nonzero(suitable[saved]))
+        for i in range(N_LIKERT):
+            stats.hist[i] = np.bincount(scores[:, i], minlength=6)[:6]
+        complete = scores[(scores > 0).all(axis=1)]
+        stats.n_complete = int(complete.shape[0])
+        stats.sums = complete.sum(axis=0)
+        stats.products = complete.T @ complete
+        return stats
+
+    def _apply(self, scores: np.ndarray, suitable: bool, sign: int) -> None:
+        scores = scores.astype(np.int64)
+        self.n_saved += sign
+        self.n_suitable += sign * int(bool(suitable))
+        self.hist[np.arange(N_LIKERT), scores] += sign
+        if scores.all():
+            self.n_complete += sign
+            self.sums += sign * scores
+            self.products += sign * np.outer(scores, scores)
+
+    def add(self, scores: np.ndarray, suitable: bool) -> None:
+        self._apply(scores, suitable, 1)
+
+    def remove(self, scores: np.ndarray, suitable: bool) -> None:
+        self._apply(scores, suitable, -1)
+
+    # ---------------- 조회 ----------------
+    def suitable_ratio(self) -> Optional[float]:
+        return self.n_suitable / self.n_saved if self.n_saved else None
+
+    def histogram(self) -> pd.DataFrame:
+        """점수(1~5) × 항목 빈도표."""
+        return pd.DataFrame(self.hist[:, 1:].T, index=pd.Index(SCORES, name="점수"), columns=LIKERT_ITEMS)
+
+    def summary(self) -> pd.DataFrame:
+        """항목별 응답 수/평균/중앙값/표준편차와 점수 비율."""
+        counts = self.hist[:, 1:]
+        n = counts.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = counts @ SCORES / n
+            var = counts @ (SCORES ** 2) / n - mean ** 2
+            share = counts / n[:, None]
+        out = pd.DataFrame(
+            {
+                "응답 수": n,
+                "평균": mean,
+                "중앙값": [_hist_median(c) for c in counts],
+                "표준편차": np.sqrt(np.clip(var, 0, None)),
+            },
+            index=pd.Index(LIKERT_ITEMS, name="항목"),
+        )
+        for s in SCORES:
+            out[f"{s}점 비율"] = share[:, s - 1]
+        return out
+
+    def correlation(self) -> pd.DataFrame:
+        """항목 간 피어슨 상관계수 (점수가 모두 있는 행 기준, 분산 0 이면 NaN)."""
+        n = self.n_complete
+        corr = np.full((N_LIKERT, N_LIKERT), np.nan)
+        if n >= 2:
+            mean = self.sums / n
+            cov = self.products / n - np.outer(mean, mean)
+            std = np.sqrt(np.clip(np.diag(cov), 0, None))
+            with np.errstate(invalid="ignore", divide="ignore"):
+                corr = cov / np.outer(std, std)
+            corr[np.outer(std, std) == 0] = np.nan
+        return pd.DataFrame(corr, index=LIKERT_ITEMS, columns=LIKERT_ITEMS)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "n_saved": self.n_saved,
+            "n_suitable": self.n_suitable,
+            "summary": self.summary(),
+            "histogram": self.histogram(),
+            "correlation": self.correlation(),
+        }
+
+
+def _hist_median(counts: np.ndarray) -> float:
+    """점수 빈도(1~5)에서 중앙값 (짝수 개면 가운데 두 값의 평균)."""
+    n = int(counts.sum())
+    if n == 0:
+        return float("nan")
+    cum = np.cumsum(counts)
+    lo = SCORES[np.searchsorted(cum, (n + 1) // 2)]
+    hi = SCORES[np.searchsorted(cum, n // 2 + 1)]
+    return (lo + hi) / 2
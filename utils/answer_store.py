@@ -0,0 +1,129 @@
+# utils/answer_store.py
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from constants import DOWNLOAD_COLUMNS, EMR_SECTIONS, LIKERT_ITEMS
+from utils.analytics import LikertStats
+from utils.progress import ProgressTracker
+
+N_LIKERT = len(LIKERT_ITEMS)
+EMR_KEYS: List[str] = [key for _, key in EMR_SECTIONS]
+
+
+class AnswerView:
+    """저장된 답변 1건에 대한 가벼운 읽기 전용 뷰 (데이터는 AnswerStore 배열에 있음)."""
+
+    __slots__ = ("_store", "idx")
+
+    def __init__(self, store: "AnswerStore", idx: int):
+        self._store = store
+        self.idx = idx
+
+    @property
+    def saved(self) -> bool:
+        return self._store.progress.is_saved(self.idx)
+
+    @property
+    def suitable(self) -> str:
+        return "Y" if self._store.suitable[self.idx] else "N"
+
+    @property
+    def likert(self) -> List[int]:
+        """1~5 점수 목록 (값이 없으면 0)."""
+        return self._store.likert[self.idx].tolist()
+
+    @property
+    def emr(self) -> Dict[str, str]:
+        return {key: self._store.emr[key][self.idx] for key in EMR_KEYS}
+
+    @property
+    def new_id(self) -> str:
+        return self._store.progress.new_id(self.idx)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """저널/공유 저장소에 쓰는 기존 답변 dict 형식."""
+        return {
+            "suitable": self.suitable,
+            "likert": {i: int(v) for i, v in enumerate(self.likert) if v},
+            "emr": self.emr,
+            "saved": True,
+        }
+
+
+class AnswerStore:
+    """행 번호로 인덱싱하는 컬럼형 답변 저장소.
+
+    - likert: (n_rows, 5) int8 행렬 (0 = 값 없음)
+    - suitable: 평가 적합(Y) 여부 bool 배열
+    - saved: ProgressTracker 비트맵 (저장 수/순위/E### 번호 포함)
+    - emr: EMR 섹션별 문자열 배열
+    - stats: 저장할 때마다 갱신되는 리커트 집계 (LikertStats)
+    """
+
+    def __init__(self, n_rows: int, answers: Optional[Dict[int, Dict[str, Any]]] = None):
+        self.n_rows = n_rows
+        self.likert = np.zeros((n_rows, N_LIKERT), dtype=np.int8)
+        self.suitable = np.zeros(n_rows, dtype=bool)
+        self.emr: Dict[str, np.ndarray] = {key: np.full(n_rows, "", dtype=object) for key in EMR_KEYS}
+        self.progress = ProgressTracker(n_rows)
+        # progress.saved(bytearray) 를 복사 없이 bool 배열로 보는 뷰
+        self.saved = np.frombuffer(self.progress.saved, dtype=bool) if n_rows else np.zeros(0, dtype=bool)
+        self.version = 0
+        self.stats: Optional[LikertStats] = None
+        for idx, ans in (answers or {}).items():
+            if ans.get("saved"):
+                self.save(idx, ans)
+        # 복원한 답변은 배열에서 한 번에 집계하고, 이후 저장분만 증분 반영
+        self.stats = LikertStats.from_arrays(self.likert, self.suitable, self.saved)
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def __contains__(self, idx: int) -> bool:
+        return 0 <= idx < self.n_rows and self.progress.is_saved(idx)
+
+    def save(self, idx: int, answer: Dict[str, Any]) -> None:
+        """기존 dict 형식({suitable, likert, emr}) 답변 1건 반영."""
+        if self.stats is not None and self.progress.is_saved(idx):
+            # 다시 저장하는 행은 이전 점수를 집계에서 먼저 뺌
+            self.stats.remove(self.likert[idx], self.suitable[idx])
+        self.suitable[idx] = answer.get("suitable", "Y") == "Y"
+        likert = answer.get("likert", {})
+        self.likert[idx] = [int(likert.get(i) or 0) for i in range(N_LIKERT)]
+        emr = answer.get("emr", {})
+        for key in EMR_KEYS:
+            self.emr[key][idx] = str(emr.get(key, ""))
+        self.progress.mark_saved(idx)
+        if self.stats is not None:
+            self.stats.add(self.likert[idx], self.suitable[idx])
+        self.version += 1
+
+    def get(self, idx: int) -> Optional[AnswerView]:
+        return AnswerView(self, idx) if idx in self else None
+
+    def items(self) -> Iterator[Tuple[int, AnswerView]]:
+        for idx in np.flatnonzero(self.saved):
+            yield int(idx), AnswerView(self, int(idx))
+
+    def to_dicts(self) -> Dict[int, Dict[str, Any]]:
+        return {idx: view.to_dict() for idx, view in self.items()}
+
+    def to_frame(self, orig_ids: np.ndarray) -> pd.DataFrame:
+        """저장된 행만 DOWNLOAD_COLUMNS 순서로 (행 단위 반복 없이 컬럼 단위로 조립)."""
+        mask = self.saved
+        n_saved = self.progress.done
+        if n_saved == 0:
+            return pd.DataFrame(columns=DOWNLOAD_COLUMNS)
+        data: Dict[str, Any] = {
+            "새_구분자": [f"E{i:03d}" for i in range(1, n_saved + 1)],
+            "원_구분자": orig_ids[mask].tolist(),
+        }
+        scores = self.likert[mask].astype(np.int64)
+        for i in range(N_LIKERT):
+            col = scores[:, i]
+            data[f"리커트_{i+1}_점수"] = col if col.all() else [int(v) if v else None for v in col]
+        for label, key in EMR_SECTIONS:
+            data[label] = self.emr[key][mask].tolist()
+        return pd.DataFrame(data, columns=DOWNLOAD_COLUMNS)
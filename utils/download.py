@@ -1,11 +1,26 @@
 # utils/download.py
-from typing import Dict, Any, List
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from constants import DOWNLOAD_COLUMNS, EMR_SECTIONS
+from utils import profiling
+from utils.answer_store import AnswerStore
+from utils.exporters import ExportJob
+from utils.progress import ProgressTracker
+from utils.similarity import reference_columns, similarity_frame
 
-def compute_new_ids(df: pd.DataFrame, answers: Dict[int, Dict[str, Any]]) -> None:
+def compute_new_ids(
+    df: pd.DataFrame, answers: Dict[int, Dict[str, Any]], progress: Optional[ProgressTracker] = None
+) -> None:
+    if progress is not None:
+        # 전체 행을 훑지 않고 저장된 답변만 순위 조회
+        for idx, ans in answers.items():
+            if ans.get("saved"):
+                ans["new_id"] = progress.new_id(idx)
+        return
     counter = 1
     for idx in range(len(df)):
         ans = answers.get(idx)
@@ -13,12 +28,19 @@ def compute_new_ids(df: pd.DataFrame, answers: Dict[int, Dict[str, Any]]) -> Non
             ans["new_id"] = f"E{counter:03d}"
             counter += 1
 
-def build_download_df(df: pd.DataFrame, answers: Dict[int, Dict[str, Any]]) -> pd.DataFrame:
+@profiling.timed("download.build_download_df")
+def build_download_df(
+    df: pd.DataFrame,
+    answers: Union[AnswerStore, Dict[int, Dict[str, Any]]],
+    progress: Optional[ProgressTracker] = None,
+) -> pd.DataFrame:
     if df is None:
         return pd.DataFrame()
+    if isinstance(answers, AnswerStore):
+        return answers.to_frame(original_ids(df))
     records: List[Dict[str, Any]] = []
 
-    compute_new_ids(df, answers)
+    compute_new_ids(df, answers, progress)
 
     for idx in range(len(df)):
         ans = answers.get(idx)
@@ -41,4 +63,89 @@ def build_download_df(df: pd.DataFrame, answers: Dict[int, Dict[str, Any]]) -> p
     for c in DOWNLOAD_COLUMNS:
         if c not in out.columns:
             out[c] = ""
-    return out[DOWNLOAD_COLUMNS]
\ No newline at end of file
+    return out[DOWNLOAD_COLUMNS]
+
+def original_ids(df: pd.DataFrame) -> np.ndarray:
+    if "구분자" in df.columns:
+        return np.array(df["구분자"].map(str).tolist(), dtype=object)
+    return np.full(len(df), "", dtype=object)
+
+
+class DownloadBuffer:
+    """AnswerStore 의 컬럼을 그대로 모아 다운로드 결과를 만들고 캐시.
+
+    - to_frame(): 저장된 행만 DOWNLOAD_COLUMNS 순서의 DataFrame (답변이 바뀔 때만 재조립)
+      섹션 테이블이 있으면 섹션별 자동 유사도 컬럼(SIMILARITY_COLUMNS)을 뒤에 추가
+    - start_export(fmt): 형식별 백그라운드 내보내기 작업 (같은 답변 버전이면 기존 작업 재사용)
+      답변이 바뀌면 이전 버전 작업의 결과 파일은 모든 형식에서 삭제, close() 는 전부 삭제
+    """
+
+    def __init__(self, df: pd.DataFrame, store: AnswerStore, sections: Optional[pd.DataFrame] = None):
+        self.orig_ids = original_ids(df)
+        self.store = store
+        self.sections = sections
+        self._frame: Optional[pd.DataFrame] = None
+        self._frame_version = -1
+        self._jobs: Dict[str, Tuple[int, ExportJob]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.orig_ids)
+
+    @property
+    def version(self) -> int:
+        return self.store.version
+
+    def to_frame(self) -> pd.DataFrame:
+        version = self.version
+        if self._frame_version == version and self._frame is not None:
+            profiling.count("download.frame_cache_hits")
+            return self._frame
+        with profiling.span("download.to_frame"):
+            out = self.store.to_frame(self.orig_ids)
+            if self.sections is not None and len(out):
+                rows = np.flatnonzero(self.store.saved)
+                gold = {key: self.store.emr[key][rows] for _, key in EMR_SECTIONS}
+                # 저장 시 백그라운드에서 채점된 행은 내용 해시 캐시에서 바로 가져옴
+                sim = similarity_frame(gold, reference_columns(self.sections, rows))
+                out = pd.concat([out, sim], axis=1)
+        profiling.count("download.rows", len(out))
+        self._frame, self._frame_version = out, version
+        return out
+
+    def _locked_frame(self) -> pd.DataFrame:
+        # 내보내기 작업 스레드에서 호출되므로 UI 스레드의 to_frame 과 겹치지 않게 잠금
+        with self._lock:
+            return self.to_frame()
+
+    def _drop_stale_jobs(self, version: int) -> None:
+        """이전 답변 버전으로 만든 작업의 결과 파일 삭제 (다시 내려받을 일이 없음)."""
+        for fmt, (job_version, job) in list(self._jobs.items()):
+            if job_version != version:
+                job.discard()
+                del self._jobs[fmt]
+
+    def start_export(self, fmt: str) -> ExportJob:
+        """fmt 형식 내보내기를 백그라운드에서 시작하고 작업을 반환. 답변이 그대로면 기존 작업 재사용."""
+        version = self.version
+        self._drop_stale_jobs(version)
+        cached = self._jobs.get(fmt)
+        if cached is not None and cached[1].error is None:
+            return cached[1]
+        if cached is not None:
+            cached[1].discard()
+        job = ExportJob(self._locked_frame, fmt)
+        self._jobs[fmt] = (version, job)
+        return job
+
+    def export_job(self, fmt: str) -> Optional[ExportJob]:
+        """현재 답변 버전으로 시작한 fmt 작업 (없거나 답변이 바뀌었으면 None)."""
+        self._drop_stale_jobs(self.version)
+        cached = self._jobs.get(fmt)
+        return cached[1] if cached is not None else None
+
+    def close(self) -> None:
+        """다른 버퍼로 교체될 때 호출: 모든 내보내기 결과 파일 삭제."""
+        for _, job in self._jobs.values():
+            job.discard()
+        self._jobs.clear()
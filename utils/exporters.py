@@ -0,0 +1,337 @@
+# utils/exporters.py
+"""결과 표 내보내기: 형식별 백엔드 + 백그라운드 작업.
+
+- xlsx: 워크시트 XML 을 zip 스트림에 행 단위로 직접 기록 (셀 객체/XML 트리를 만들지 않음)
+- parquet: pyarrow ParquetWriter 로 EXPORT_CHUNK_ROWS 행씩 row group 기록
+- csv: UTF-8 BOM (엑셀에서 바로 열림), 청크 단위 기록
+- jsonl: 한 행에 한 레코드, 청크 단위 기록
+
+모든 백엔드는 이진 파일 객체에 쓰고 청크마다 progress(기록한 행 수) 를 호출함.
+"""
+import io
+import math
+import os
+import re
+import tempfile
+import threading
+import weakref
+import zipfile
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+
+import pandas as pd
+
+from utils import profiling
+
+EXPORT_CHUNK_ROWS = 1000
+
+ProgressFn = Optional[Callable[[int], None]]
+
+
+class ExportFormat(NamedTuple):
+    ext: str
+    label: str
+    mime: str
+    write: Callable[[pd.DataFrame, io.BufferedIOBase, int, ProgressFn], None]
+
+
+def _chunks(df: pd.DataFrame, chunk_rows: int):
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+# ---------------- 백엔드 ----------------
+# xlsx: 최소 SpreadsheetML 패키지를 zip 스트림으로 직접 기록 (셀 객체/XML 트리 없이 문자열로 행 단위 기록)
+_XLSX_STATIC = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="results" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        "</styleSheet>"
+    ),
+}
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = "</sheetData></worksheet>"
+# XML 1.0 에 넣을 수 없는 제어 문자 (탭/줄바꿈 제외)
+_ILLEGAL_XML_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+# 쓰기 속도를 위해 낮은 압축 수준 사용 (텍스트 위주라 크기 차이는 작음)
+XLSX_COMPRESSLEVEL = 1
+
+
+def _xlsx_number(v: float) -> str:
+    """숫자 셀. ±inf 는 <v> 에 쓸 수 없어 pandas to_excel(inf_rep) 처럼 문자열 "inf"/"-inf" 로."""
+    if math.isfinite(v):
+        return f"<c><v>{v!r}</v></c>"
+    return f'<c t="inlineStr"><is><t>{"inf" if v > 0 else "-inf"}</t></is></c>'
+
+
+def _xlsx_cells(col: pd.Series) -> List[str]:
+    """열 → 셀 XML 조각 목록. 숫자는 <v>, 문자열은 인라인 문자열, 결측은 빈 셀.
+
+    셀 주소(r)를 생략하므로 결측도 빈 <c/> 로 자리를 채워 다음 셀이 왼쪽으로 밀리지 않게 함.
+    """
+    if col.dtype.kind == "b":
+        return [f'<c t="b"><v>{int(v)}</v></c>' for v in col.tolist()]
+    if col.dtype.kind in "iu":
+        return [f"<c><v>{v}</v></c>" for v in col.tolist()]
+    if col.dtype.kind == "f":
+        return ["<c/>" if math.isnan(v) else _xlsx_number(v) for v in col.tolist()]
+    out: List[str] = []
+    for v in col.tolist():
+        if v is None or (isinstance(v, float) and math.isnan(v)):
+            out.append("<c/>")
+        elif isinstance(v, bool):
+            out.append(f'<c t="b"><v>{int(v)}</v></c>')
+        elif isinstance(v, int):
+            out.append(f"<c><v>{v}</v></c>")
+        elif isinstance(v, float):
+            out.append(_xlsx_number(v))
+        else:
+            # str.translate 는 한글 등 비 ASCII 문자열에서 느려 replace 로 이스케이프
+            text = _ILLEGAL_XML_RE.sub("", str(v)).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            out.append(f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return out
+
+
+def write_xlsx(df: pd.DataFrame, fh, chunk_rows: int = EXPORT_CHUNK_ROWS, progress: ProgressFn = None) -> None:
+    with zipfile.ZipFile(fh, "w", zipfile.ZIP_DEFLATED, compresslevel=XLSX_COMPRESSLEVEL) as zf:
+        for name, body in _XLSX_STATIC.items():
+            zf.writestr(name, body)
+        with zf.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as raw:
+            sheet = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+            sheet.write(_SHEET_HEAD)
+            sheet.write("<row>" + "".join(_xlsx_cells(pd.Series([str(c) for c in df.columns], dtype=object))) + "</row>")
+            written = 0
+            for chunk in _chunks(df, chunk_rows):
+                columns = [_xlsx_cells(chunk[c]) for c in chunk.columns]
+                for cells in zip(*columns):
+                    sheet.write("<row>" + "".join(cells) + "</row>")
+                written += len(chunk)
+                if progress:
+                    progress(written)
+            sheet.write(_SHEET_TAIL)
+            sheet.flush()
+            sheet.detach()
+
+
+def write_parquet(df: pd.DataFrame, fh, chunk_rows: int = EXPORT_CHUNK_ROWS, progress: ProgressFn = None) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # 첫 청크로 스키마를 정하면 이후 청크의 결측 패턴에 따라 타입이 달라질 수 있어 전체 기준으로 고정
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    written = 0
+    with pq.ParquetWriter(fh, schema) as writer:
+        for chunk in _chunks(df, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            written += len(chunk)
+            if progress:
+                progress(written)
+
+
+def write_csv(df: pd.DataFrame, fh, chunk_rows: int = EXPORT_CHUNK_ROWS, progress: ProgressFn = None) -> None:
+    # utf-8-sig: 맨 앞에 BOM 한 번만 기록
+    text = io.TextIOWrapper(fh, encoding="utf-8-sig", newline="")
+    try:
+        if len(df) == 0:
+            df.to_csv(text, index=False)
+        written = 0
+        for chunk in _chunks(df, chunk_rows):
+            chunk.to_csv(text, index=False, header=written == 0)
+            written += len(chunk)
+            if progress:
+                progress(written)
+        text.flush()
+    finally:
+        text.detach()
+
+
+def write_jsonl(df: pd.DataFrame, fh, chunk_rows: int = EXPORT_CHUNK_ROWS, progress: ProgressFn = None) -> None:
+    written = 0
+    for chunk in _chunks(df, chunk_rows):
+        body = chunk.to_json(orient="records", lines=True, force_ascii=False, date_format="iso")
+        if body and not body.endswith("\n"):
+            body += "\n"
+        fh.write(body.encode("utf-8"))
+        written += len(chunk)
+        if progress:
+            progress(written)
+
+
+EXPORT_FORMATS: Dict[str, ExportFormat] = {
+    "xlsx": ExportFormat(
+        "xlsx", "엑셀 (.xlsx)", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", write_xlsx
+    ),
+    "csv": ExportFormat("csv", "CSV (.csv, UTF-8 BOM)", "text/csv", write_csv),
+    "parquet": ExportFormat("parquet", "Parquet (.parquet)", "application/vnd.apache.parquet", write_parquet),
+    "jsonl": ExportFormat("jsonl", "JSON Lines (.jsonl)", "application/x-ndjson", write_jsonl),
+}
+FORMATS = list(EXPORT_FORMATS)
+
+
+def export_frame(
+    df: pd.DataFrame,
+    fmt: str,
+    target: Union[str, io.BufferedIOBase],
+    progress: ProgressFn = None,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> None:
+    """df 를 fmt 형식으로 target(경로 또는 이진 파일 객체)에 기록."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    write = EXPORT_FORMATS[fmt].write
+    with profiling.span("export.write", fmt=fmt, rows=len(df)):
+        if isinstance(target, str):
+            directory = os.path.dirname(target)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(target, "wb") as fh:
+                write(df, fh, chunk_rows, progress)
+        else:
+            write(df, target, chunk_rows, progress)
+    profiling.count(f"export.rows.{fmt}", len(df))
+
+
+def export_bytes(df: pd.DataFrame, fmt: str, chunk_rows: int = EXPORT_CHUNK_ROWS) -> bytes:
+    buffer = io.BytesIO()
+    export_frame(df, fmt, buffer, chunk_rows=chunk_rows)
+    return buffer.getvalue()
+
+
+_DISCARDED_MESSAGE = "내보내기 결과가 이미 삭제되었습니다. 결과 파일을 다시 만드세요."
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+class ExportJob:
+    """백그라운드 스레드에서 임시 파일로 내보내기. 진행률은 written/total 로 확인.
+
+    build 는 작업 스레드에서 호출되어 내보낼 DataFrame 을 만듦 (표 조립도 UI 를 막지 않도록).
+    결과는 디스크의 임시 파일에 있으므로 메모리에는 청크 하나 분량만 올라감.
+    임시 파일은 discard() 또는 작업 객체가 사라질 때(세션 종료, 프로세스 종료 포함) 삭제됨.
+    """
+
+    def __init__(self, build: Callable[[], pd.DataFrame], fmt: str, chunk_rows: int = EXPORT_CHUNK_ROWS):
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {fmt}")
+        self.fmt = fmt
+        self.total: Optional[int] = None
+        self.written = 0
+        self.error: Optional[BaseException] = None
+        self.path: Optional[str] = None
+        self._build = build
+        self._chunk_rows = chunk_rows
+        self._discarded = False
+        fd, self._tmp_path = tempfile.mkstemp(suffix=f".{EXPORT_FORMATS[fmt].ext}")
+        os.close(fd)
+        # 작업 스레드가 끝나면 self 를 참조하지 않으므로, 버려진 작업은 GC 시점에 파일이 지워짐
+        self._finalizer = weakref.finalize(self, _remove_file, self._tmp_path)
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"export-{fmt}", daemon=True)
+        self._thread.start()
+
+    def _progress(self, written: int) -> None:
+        self.written = written
+
+    def _run(self) -> None:
+        path = self._tmp_path
+        try:
+            df = self._build()
+            self.total = len(df)
+            export_frame(df, self.fmt, path, self._progress, self._chunk_rows)
+            if self._discarded:
+                _remove_file(path)
+            else:
+                self.path = path
+        except BaseException as e:  # 작업 스레드 예외는 UI 에서 보여 주도록 보관
+            self.error = e
+            _remove_file(path)
+        finally:
+            self._done.set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def ratio(self) -> float:
+        if self.done:
+            return 1.0
+        return self.written / self.total if self.total else 0.0
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def read_bytes(self) -> bytes:
+        """완료된 결과 파일 내용 (download_button 의 지연 생성 콜백용)."""
+        self.wait()
+        if self.error is not None:
+            raise self.error
+        path = self.path
+        # 답변이 바뀌어 결과가 삭제된 뒤 이전 화면의 다운로드 버튼이 눌린 경우
+        if path is None:
+            raise RuntimeError(_DISCARDED_MESSAGE)
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            raise RuntimeError(_DISCARDED_MESSAGE) from None
+
+    def discard(self) -> None:
+        """결과 파일 삭제 (실행 중이면 끝난 뒤 삭제)."""
+        self._discarded = True
+        self.path = None
+        if self.done:
+            self._finalizer()
@@ -0,0 +1,128 @@
+# utils/grounding.py
+"""생성결과 문장의 대화 스크립트 근거(grounding) 정렬.
+
+- 대화 스크립트를 참석자 발화(turn) 단위로 나누고, 행마다 문자 2-gram → 발화 번호 역색인을 만듦
+- 문장마다 2-gram 을 색인에서 찾아 연속 발화 GROUNDING_WINDOW 개 구간 중 가장 많이 덮는 구간을 근거로 선택
+  (모든 문장 × 모든 발화 비교 없이 문장의 2-gram 이 등장하는 발화만 모아 계산)
+- 근거 비율 = 근거 구간이 포함하는 문장 2-gram 비율. GROUNDING_MIN_SUPPORT 미만이거나
+  대화에 없는 숫자가 있으면 근거 부족으로 표시
+"""
+import re
+from typing import List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+# 근거 구간으로 묶는 연속 발화 수 (질문 + 답변 + 보충)
+GROUNDING_WINDOW = 3
+# 이 비율 미만이면 근거 부족
+GROUNDING_MIN_SUPPORT = 0.5
+
+_TURN_RE = re.compile(r"(참석자[1-5])\s*[:：]?")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+_CHAR_BITS = 21
+
+
+class Grounding(NamedTuple):
+    support: float  # 근거 구간이 덮는 문장 2-gram 비율 (0~1)
+    turns: Tuple[int, int]  # 근거 발화 구간 [시작, 끝)
+    missing_numbers: Tuple[str, ...]  # 대화에 없는 숫자
+
+    @property
+    def low(self) -> bool:
+        return self.support < GROUNDING_MIN_SUPPORT or bool(self.missing_numbers)
+
+
+def split_turns(dialogue: str) -> List[Tuple[str, str]]:
+    """대화 스크립트 → [(화자, 발화)] (화자 표시 앞부분은 화자 "" 로)."""
+    if not dialogue:
+        return []
+    parts = _TURN_RE.split(dialogue)
+    turns: List[Tuple[str, str]] = []
+    if parts[0].strip():
+        turns.append(("", parts[0].strip()))
+    for speaker, text in zip(parts[1::2], parts[2::2]):
+        turns.append((speaker, text.strip()))
+    return turns
+
+
+def _norm(text: str) -> str:
+    """비교용: 소문자 + 공백/문장부호 제거."""
+    return _NON_WORD_RE.sub("", text.lower())
+
+
+def _gram_codes(text: str) -> np.ndarray:
+    chars = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+    return np.unique((chars[:-1] << _CHAR_BITS) | chars[1:])
+
+
+class TranscriptIndex:
+    """대화 스크립트 한 건의 발화별 2-gram 역색인 (CSR: 정렬된 2-gram 코드 → 발화 번호 목록)."""
+
+    def __init__(self, dialogue: str):
+        self.turns = split_turns(dialogue)
+        texts = [_norm(t) for _, t in self.turns]
+        # 화자 표시(참석자1~5)의 숫자는 제외하고 발화 본문의 숫자만
+        self.numbers: Set[str] = {x for _, t in self.turns for x in _NUMBER_RE.findall(t)}
+        n = len(texts)
+        if n == 0:
+            self.codes = np.empty(0, dtype=np.int64)
+            self.offsets = np.zeros(1, dtype=np.int64)
+            self.turn_ids = np.empty(0, dtype=np.int64)
+            return
+        # "\x00" 으로 발화를 구분하고 경계를 넘는 2-gram 은 버림
+        joined = "\x00".join(texts)
+        chars = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+        turn_of = np.repeat(np.arange(n, dtype=np.int64), [len(t) + 1 for t in texts])[: len(chars)]
+        valid = (chars[:-1] != 0) & (chars[1:] != 0)
+        codes = ((chars[:-1] << _CHAR_BITS) | chars[1:])[valid]
+        turn_bits = max(1, (n - 1).bit_length())
+        keys = np.unique((codes << turn_bits) | turn_of[:-1][valid])
+        self.turn_ids = keys & ((1 << turn_bits) - 1)
+        self.codes, starts = np.unique(keys >> turn_bits, return_index=True)
+        self.offsets = np.append(starts, len(keys))
+
+    def align(self, sentences: Sequence[str], window: int = GROUNDING_WINDOW) -> List[Optional[Grounding]]:
+        """문장별 근거 (비교할 글자가 2자 미만이면 None). 모든 문장을 한 번에 벡터 연산으로 처리."""
+        normed = [_norm(s) for s in sentences]
+        gram_sets = [_gram_codes(t) if len(t) >= 2 else np.empty(0, dtype=np.int64) for t in normed]
+        n_sent, n_turns = len(sentences), len(self.turns)
+        sizes = np.array([len(g) for g in gram_sets], dtype=np.int64)
+        best = np.zeros(n_sent, dtype=np.int64)
+        best_start = np.zeros(n_sent, dtype=np.int64)
+
+        if n_turns and sizes.sum():
+            grams = np.concatenate(gram_sets)
+            sent_of = np.repeat(np.arange(n_sent, dtype=np.int64), sizes)
+            pos = np.searchsorted(self.codes, grams)
+            pos_c = np.minimum(pos, len(self.codes) - 1)
+            found = (pos < len(self.codes)) & (self.codes[pos_c] == grams) if len(self.codes) else np.zeros(len(grams), bool)
+            gram_idx = np.flatnonzero(found)
+            starts = self.offsets[pos[found]]
+            counts = self.offsets[pos[found] + 1] - starts
+            if counts.sum():
+                # (문장 2-gram, 그 2-gram 이 나오는 발화) 쌍으로 펼침
+                pair_gram = np.repeat(gram_idx, counts)
+                flat = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+                pair_turn = self.turn_ids[flat]
+                # 발화 t 는 시작이 t-window+1 .. t 인 구간에 포함됨 (구간 시작은 0 이상)
+                w = min(window, n_turns)
+                win_start = np.clip(pair_turn[:, None] - np.arange(w), 0, n_turns - w).ravel()
+                win_gram = np.repeat(pair_gram, w)
+                # 같은 구간에서 같은 2-gram 은 한 번만 셈
+                key = np.unique(win_gram * n_turns + win_start)
+                cover = np.bincount(sent_of[key // n_turns] * n_turns + key % n_turns, minlength=n_sent * n_turns)
+                cover = cover.reshape(n_sent, n_turns)
+                best_start = cover.argmax(axis=1)
+                best = cover[np.arange(n_sent), best_start]
+
+        w = min(window, n_turns)
+        out: List[Optional[Grounding]] = []
+        for i, sentence in enumerate(sentences):
+            if sizes[i] == 0:
+                out.append(None)
+                continue
+            missing = tuple(x for x in _NUMBER_RE.findall(sentence) if x not in self.numbers)
+            start = int(best_start[i])
+            out.append(Grounding(float(best[i] / sizes[i]), (start, start + w), missing))
+        return out
@@ -0,0 +1,85 @@
+# utils/ingest.py
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from constants import PRIMARY_LABELS
+from utils import profiling
+from utils.parser import ParseResult, parse_clova_sections
+
+OTHERS_COL = "기타"
+SECTION_COLUMNS: List[str] = PRIMARY_LABELS + [OTHERS_COL]
+
+# 이 행 수(고유 생성결과 기준) 이상이면 프로세스 풀 사용
+PARALLEL_MIN_ROWS = 5000
+CHUNK_SIZE = 2000
+
+
+def _parse_chunk(texts: List[str]) -> List[List[str]]:
+    """생성결과 묶음 → [주호소, 현병력, ..., 기타(JSON)] 행 목록 (워커 프로세스용)."""
+    out: List[List[str]] = []
+    for raw in texts:
+        primary, others = parse_clova_sections(raw)
+        out.append(
+            [primary.get(lb, "") for lb in PRIMARY_LABELS]
+            + [json.dumps(others, ensure_ascii=False) if others else ""]
+        )
+    return out
+
+
+@profiling.timed("ingest.preprocess_sections")
+def preprocess_sections(
+    df: pd.DataFrame, workers: Optional[int] = None
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """업로드 전체의 생성결과를 한 번에 섹션 파싱.
+
+    - 동일한 생성결과는 한 번만 파싱 (factorize 후 코드로 펼침)
+    - 고유 값이 PARALLEL_MIN_ROWS 이상이면 프로세스 풀에서 병렬 처리
+    반환: (섹션 컬럼 테이블, 처리 통계)
+    """
+    t0 = time.perf_counter()
+    # 좌측 패널의 str(row["생성결과"]) 와 같은 문자열 기준
+    texts = df["생성결과"].map(str)
+    codes, uniques = pd.factorize(texts, sort=False)
+    uniq: List[str] = list(uniques)
+
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+    use_pool = n_workers > 1 and len(uniq) >= PARALLEL_MIN_ROWS
+    if use_pool:
+        chunks = [uniq[i:i + CHUNK_SIZE] for i in range(0, len(uniq), CHUNK_SIZE)]
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            parsed_rows = [r for part in pool.map(_parse_chunk, chunks) for r in part]
+    else:
+        parsed_rows = _parse_chunk(uniq)
+
+    table = np.empty((len(uniq), len(SECTION_COLUMNS)), dtype=object)
+    for i, r in enumerate(parsed_rows):
+        table[i] = r
+    expanded = table[codes] if len(codes) else table
+    sections = pd.DataFrame(expanded, columns=SECTION_COLUMNS, index=df.index)
+
+    profiling.count("ingest.rows", len(df))
+    profiling.count("ingest.parsed", len(uniq))
+    elapsed = time.perf_counter() - t0
+    stats: Dict[str, Any] = {
+        "rows": len(df),
+        "unique": len(uniq),
+        "workers": n_workers if use_pool else 1,
+        "seconds": elapsed,
+        "rows_per_sec": (len(df) / elapsed) if elapsed > 0 else 0.0,
+    }
+    return sections, stats
+
+
+def row_sections(sections: pd.DataFrame, idx: int) -> ParseResult:
+    """섹션 테이블의 idx 번째 행 → parse_clova_sections 와 같은 (primary, others)."""
+    rec = sections.iloc[idx]
+    primary: Dict[str, str] = {lb: rec[lb] for lb in PRIMARY_LABELS}
+    others_raw = rec[OTHERS_COL]
+    others = [(k, v) for k, v in json.loads(others_raw)] if others_raw else []
+    return primary, others
@@ -0,0 +1,180 @@
+# utils/journal.py
+import contextlib
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+
+from utils.upload_cache import CACHE_ROOT
+
+JOURNAL_DIR = os.path.join(CACHE_ROOT, "journal")
+# 저널이 이 건수만큼 쌓이면 스냅샷으로 압축
+COMPACT_EVERY = 500
+
+
+def decode_answer(answer: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON 왕복으로 문자열이 된 likert 키를 int 로 복원."""
+    out = dict(answer)
+    if isinstance(out.get("likert"), dict):
+        out["likert"] = {int(k): v for k, v in out["likert"].items()}
+    return out
+
+
+def _replay(snapshot_path: str, journal_path: str) -> Tuple[Dict[int, Dict[str, Any]], int]:
+    """스냅샷 + 저널 재생 → (답변, 저널 건수). 없는 파일은 건너뜀, 잘린 마지막 줄은 무시."""
+    answers: Dict[int, Dict[str, Any]] = {}
+    if os.path.exists(snapshot_path):
+        with open(snapshot_path, encoding="utf-8") as f:
+            for k, v in json.load(f).items():
+                answers[int(k)] = decode_answer(v)
+    count = 0
+    if os.path.exists(journal_path):
+        with open(journal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 중단된 마지막 줄
+                    continue
+                answers[int(rec["i"])] = decode_answer(rec["a"])
+                count += 1
+    return answers, count
+
+
+def journal_stem(digest: str, owner: Optional[str] = None) -> str:
+    """저널 파일 이름: digest (+ 평가자 ID). ID 는 파일 이름에 쓸 수 있는 문자만 남김."""
+    owner = re.sub(r"[^0-9A-Za-z_-]", "", owner or "")
+    return f"{digest}.{owner}" if owner else digest
+
+
+class AnswerJournal:
+    """데이터셋(digest)별 답변 저장 로그.
+
+    - append(): 저장 1건을 JSONL 한 줄로 추가 (파일 전체를 다시 쓰지 않음)
+    - compact(): 디스크의 스냅샷 + 저널 전체를 스냅샷으로 원자적 교체 후 저널 비움
+    - load(): 스냅샷 + 저널 재생으로 답변 복원 (마지막 줄이 잘려 있으면 무시)
+
+    같은 파일을 여는 세션(새로고침 전후, 같은 평가자의 여러 탭)은 한 저널을 공유하므로
+    기록/압축은 파일 잠금 아래에서 하고, 압축은 메모리의 답변이 아니라 디스크 내용을 합침.
+    """
+
+    def __init__(
+        self,
+        digest: str,
+        directory: str = JOURNAL_DIR,
+        compact_every: int = COMPACT_EVERY,
+        fsync: bool = False,
+        owner: Optional[str] = None,
+    ):
+        os.makedirs(directory, exist_ok=True)
+        stem = journal_stem(digest, owner)
+        self.snapshot_path = os.path.join(directory, f"{stem}.snapshot.json")
+        self.journal_path = os.path.join(directory, f"{stem}.jsonl")
+        self.lock_path = os.path.join(directory, f"{stem}.lock")
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.pending = 0
+        self._lock = threading.Lock()
+        self._lock_fh = open(self.lock_path, "a")
+        self._fh = open(self.journal_path, "a", encoding="utf-8")
+        with self._locked():
+            self._terminate_torn_line()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """스레드 잠금 + 다른 세션/프로세스와의 파일 잠금."""
+        with self._lock:
+            if fcntl is not None:
+                fcntl.flock(self._lock_fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_fh.fileno(), fcntl.LOCK_UN)
+
+    def _terminate_torn_line(self) -> None:
+        """중단으로 잘린 마지막 줄 뒤에 새 기록이 이어 붙지 않도록 줄바꿈 보정."""
+        with open(self.journal_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                self._fh.write("\n")
+                self._fh.flush()
+
+    def _read_disk(self) -> Dict[int, Dict[str, Any]]:
+        """스냅샷 + 저널 재생 (잠금 안에서 호출). pending 은 저널 건수로 갱신."""
+        answers, self.pending = _replay(self.snapshot_path, self.journal_path)
+        return answers
+
+    def load(self) -> Dict[int, Dict[str, Any]]:
+        with self._locked():
+            return self._read_disk()
+
+    def append(self, idx: int, answer: Dict[str, Any]) -> None:
+        line = json.dumps({"i": idx, "a": answer}, ensure_ascii=False, separators=(",", ":"))
+        with self._locked():
+            self._fh.write(line + "\n")
+            self._fh.flush()
+            if self.fsync:
+                os.fsync(self._fh.fileno())
+            self.pending += 1
+
+    @property
+    def compact_due(self) -> bool:
+        return self.pending >= self.compact_every
+
+    def maybe_compact(self) -> bool:
+        if not self.compact_due:
+            return False
+        self.compact()
+        return True
+
+    def compact(self) -> None:
+        """디스크의 스냅샷 + 저널을 합친 결과를 새 스냅샷으로.
+
+        모든 저장은 이미 저널에 기록돼 있으므로 메모리의 답변 대신 디스크 내용을 합침
+        (같은 저널을 쓰는 다른 세션의 기록도 스냅샷에 포함되고, 잠금 중에는 새 기록이 끼어들지 않음).
+        """
+        tmp = self.snapshot_path + ".tmp"
+        with self._locked():
+            answers = self._read_disk()
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({str(k): v for k, v in answers.items()}, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.snapshot_path)
+            # 스냅샷 교체 후에 저널을 비움 (그 사이 중단돼도 재생 결과는 동일)
+            self._fh.close()
+            self._fh = open(self.journal_path, "w", encoding="utf-8")
+            self.pending = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+            if not self._lock_fh.closed:
+                self._lock_fh.close()
+
+
+def read_answers(digest: str, directory: str = JOURNAL_DIR, owner: Optional[str] = None) -> Dict[int, Dict[str, Any]]:
+    """읽기 전용 복원: 디렉터리/파일을 만들지 않고 있는 스냅샷 + 저널만 읽음 (없으면 빈 dict)."""
+    stem = journal_stem(digest, owner)
+    return _replay(os.path.join(directory, f"{stem}.snapshot.json"), os.path.join(directory, f"{stem}.jsonl"))[0]
+
+
+def open_journal(digest: Optional[str], owner: Optional[str] = None) -> Optional[AnswerJournal]:
+    """digest(+ 평가자 ID) 별 저널. digest 가 없거나 디스크에 쓸 수 없으면 None (저널 없이 동작)."""
+    if not digest:
+        return None
+    try:
+        return AnswerJournal(digest, owner=owner)
+    except OSError:
+        return None
@@ -0,0 +1,129 @@
+# utils/loader.py
+import codecs
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from constants import REQUIRED_COLS, OPTIONAL_COLS
+from utils import profiling
+
+# 인코딩 판별용 선두 샘플 크기 / CSV 청크 행 수
+ENCODING_SAMPLE_BYTES = 64 * 1024
+CSV_CHUNK_ROWS = 20_000
+
+
+class MissingColumnsError(ValueError):
+    """업로드 헤더에 필수 컬럼이 없을 때."""
+
+    def __init__(self, missing: List[str], columns: List[str]):
+        super().__init__(f"필수 컬럼 누락: {', '.join(missing)}")
+        self.missing = missing
+        self.columns = columns
+
+
+def detect_encoding(sample: bytes) -> str:
+    """선두 샘플만으로 utf-8 / cp949 판별 (샘플 끝의 잘린 멀티바이트는 허용)."""
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def _check_header(
+    columns: List[str], required: Sequence[str], optional: Sequence[str]
+) -> List[str]:
+    """헤더 검증 후 실제로 읽을 컬럼 목록 반환."""
+    missing = [c for c in required if c not in columns]
+    if missing:
+        raise MissingColumnsError(missing, columns)
+    return [c for c in columns if c in required or c in optional]
+
+
+@profiling.timed("loader.read_upload")
+def read_upload(
+    file,
+    name: Optional[str] = None,
+    required: Sequence[str] = REQUIRED_COLS,
+    optional: Sequence[str] = OPTIONAL_COLS,
+) -> pd.DataFrame:
+    """업로드 파일(.xlsx/.csv)을 필요한 컬럼만 스트리밍으로 읽음.
+
+    - 데이터를 읽기 전에 헤더에서 required 검증 (없으면 MissingColumnsError)
+    - CSV: 선두 샘플로 인코딩 판별 후 청크 단위로 읽기
+    - xlsx: openpyxl read-only 행 이터레이터로 읽기
+    """
+    name = name or getattr(file, "name", "")
+    file.seek(0)
+    if name.lower().endswith(".xlsx"):
+        return _read_xlsx(file, required, optional)
+    return _read_csv(file, required, optional)
+
+
+def _read_csv(file, required: Sequence[str], optional: Sequence[str]) -> pd.DataFrame:
+    sample = file.read(ENCODING_SAMPLE_BYTES)
+    encoding = detect_encoding(sample)
+    try:
+        return _read_csv_with(file, encoding, required, optional)
+    except UnicodeDecodeError:
+        # 샘플 이후 구간에서 utf-8 이 깨지는 경우에만 전체 재시도
+        if encoding == "cp949":
+            raise
+        return _read_csv_with(file, "cp949", required, optional)
+
+
+def _read_csv_with(
+    file, encoding: str, required: Sequence[str], optional: Sequence[str]
+) -> pd.DataFrame:
+    file.seek(0)
+    header = pd.read_csv(file, nrows=0, encoding=encoding)
+    columns = [str(c).strip() for c in header.columns]
+    keep = set(_check_header(columns, required, optional))
+
+    file.seek(0)
+    reader = pd.read_csv(
+        file,
+        encoding=encoding,
+        usecols=lambda c: str(c).strip() in keep,
+        chunksize=CSV_CHUNK_ROWS,
+    )
+    chunks = list(reader)
+    df = pd.concat(chunks, ignore_index=True) if chunks else header
+    df.columns = [str(c).strip() for c in df.columns]
+    return df
+
+
+def _read_xlsx(file, required: Sequence[str], optional: Sequence[str]) -> pd.DataFrame:
+    # openpyxl 은 xlsx 를 실제로 읽을 때만 로드
+    from openpyxl import load_workbook
+
+    wb = load_workbook(file, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, ())
+        columns = [
+            (str(c).strip() if c is not None else f"Unnamed: {i}")
+            for i, c in enumerate(header)
+        ]
+        keep = _check_header(columns, required, optional)
+        positions = [columns.index(c) for c in keep]
+
+        data: Dict[str, List[Any]] = {c: [] for c in keep}
+        n_rows = 0
+        last_non_empty = 0
+        for r in rows:
+            n_rows += 1
+            if any(v is not None for v in r):
+                last_non_empty = n_rows
+            for c, pos in zip(keep, positions):
+                data[c].append(r[pos] if pos < len(r) else None)
+    finally:
+        wb.close()
+
+    # read-only 모드에서 남는 끝쪽 빈 행 제거
+    for c in keep:
+        del data[c][last_non_empty:]
+    return pd.DataFrame(data, columns=keep)
@@ -3,37 +3,77 @@ import re
 from typing import Dict, List, Tuple
 
 from constants import PRIMARY_LABELS, EXCLUDE_LABELS, LABEL_PATTERN_STR
+from utils import profiling
+from utils.cache import LRUCache, content_key
 from utils.text_utils import normalize_basic
 
-def parse_clova_sections(raw: str) -> Tuple[Dict[str, str], List[Tuple[str, str]]]:
+# 파싱 결과가 달라지는 수정을 하면 올림 (디스크의 업로드 캐시를 무효화)
+PARSER_VERSION = 1
+
+# 모듈 로드 시 1회만 컴파일
+LABEL_RE = re.compile(LABEL_PATTERN_STR)
+
+# 공백 제거 후 라벨 → 표준 라벨
+_LABEL_CANON: Dict[str, str] = {
+    "개인력및사회력": "개인력 및 사회력",
+    "통문진": "계통문진",
+    "진료계획": "진료 계획",
+}
+
+# 생성결과 내용 해시 → (primary, others)
+PARSE_CACHE_SIZE = 4096
+_parse_cache = LRUCache(maxsize=PARSE_CACHE_SIZE)
+profiling.register_cache("parser", _parse_cache)
+
+ParseResult = Tuple[Dict[str, str], List[Tuple[str, str]]]
+
+
+def norm_label(lab: str) -> str:
+    return _LABEL_CANON.get("".join(lab.split()), lab)
+
+
+def parse_clova_sections(raw: str) -> ParseResult:
     """
     CLOVA 생성결과를 섹션별로 파싱.
     - 줄 단위 라벨(주호소/현병력/과거력/...) 인식
     - 동일 라벨 반복 시 내용 이어붙임
     - 라벨이 하나도 없으면 전체를 '현병력'으로 간주
+    - 동일 내용은 LRU 캐시에서 바로 반환
     """
-    text = normalize_basic(raw or "")
+    raw = raw or ""
+    primary, others = _parse_cache.get_or_compute(
+        content_key(raw), lambda: _parse_uncached(raw)
+    )
+    # 캐시된 객체가 호출부에서 변경되지 않도록 얕은 복사본 반환
+    return dict(primary), list(others)
+
+
+def clear_parse_cache() -> None:
+    _parse_cache.clear()
+
+
+def parse_cache_info() -> Dict[str, int]:
+    return {
+        "size": len(_parse_cache),
+        "maxsize": _parse_cache.maxsize,
+        "hits": _parse_cache.hits,
+        "misses": _parse_cache.misses,
+    }
+
+
+def _parse_uncached(raw: str) -> ParseResult:
+    text = normalize_basic(raw)
     if not text:
         return ({lb: "" for lb in PRIMARY_LABELS}, [])
 
     lines = text.split("\n")
-    label_re = re.compile(LABEL_PATTERN_STR)
 
     mapping_all: Dict[str, List[str]] = {}
     current_label: str = ""
     seen_any_label = False
 
-    def norm_label(lab: str) -> str:
-        if re.fullmatch(r"개인력\s*및\s*사회력", lab):
-            return "개인력 및 사회력"
-        if re.fullmatch(r"(?:계통문진|통문진)", lab):
-            return "계통문진"
-        if re.fullmatch(r"진료\s*계획", lab):
-            return "진료 계획"
-        return lab
-
     for ln in lines:
-        m = label_re.match(ln.strip())
+        m = LABEL_RE.match(ln.strip())
         if m:
             seen_any_label = True
             lab = norm_label(m.group(1))
@@ -72,4 +112,4 @@ def parse_clova_sections(raw: str) -> Tuple[Dict[str, str], List[Tuple[str, str]
         if v:
             others.append((k, v))
 
-    return primary, others
\ No newline at end of file
+    return primary, others
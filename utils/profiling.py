@@ -0,0 +1,197 @@
+# utils/profiling.py
+"""옵트인 계측: 구간 시간(span), 카운터, 캐시 적중률, JSONL 트레이스.
+
+꺼져 있으면 span()/timed()/count() 는 모듈 전역 플래그를 한 번 확인하고 바로 반환하므로
+운영 환경에서도 계측 코드를 그대로 둘 수 있음. 켜기: 환경 변수 EMR_EVAL_PROFILE=1 또는 enable(True).
+
+    with profiling.span("download.to_frame", rows=n): ...
+    @profiling.timed("left_panel.render")
+    profiling.count("ingest.rows", len(df))
+
+플래그는 프로세스 단위이며, 실행(run) 번호는 begin_run() 을 호출한 스레드에 붙음
+(Streamlit 은 세션별 스크립트 실행을 별도 스레드에서 하므로 세션 간 구간이 섞이지 않음).
+"""
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+ENABLED = os.environ.get("EMR_EVAL_PROFILE", "") not in ("", "0")
+# 메모리에 보관하는 최근 이벤트 수 (넘으면 오래된 것부터 버림)
+TRACE_MAX_EVENTS = 50000
+
+_lock = threading.Lock()
+_events: Deque[Dict[str, Any]] = deque(maxlen=TRACE_MAX_EVENTS)
+_counters: Dict[str, float] = defaultdict(float)
+_caches: Dict[str, Any] = {}
+_run_seq = 0
+_local = threading.local()
+_NULL_SPAN = contextlib.nullcontext()
+
+
+def enable(on: bool = True) -> None:
+    global ENABLED
+    ENABLED = bool(on)
+
+
+def is_enabled() -> bool:
+    return ENABLED
+
+
+def _record(event: Dict[str, Any]) -> None:
+    event["run"] = getattr(_local, "run", None)
+    event["thread"] = threading.current_thread().name
+    with _lock:
+        _events.append(event)
+
+
+class _Span:
+    __slots__ = ("name", "meta", "t0", "depth")
+
+    def __init__(self, name: str, meta: Optional[Dict[str, Any]]):
+        self.name = name
+        self.meta = meta
+
+    def __enter__(self) -> "_Span":
+        self.depth = getattr(_local, "depth", 0)
+        _local.depth = self.depth + 1
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        elapsed = time.perf_counter() - self.t0
+        _local.depth = self.depth
+        event = {"type": "span", "name": self.name, "ts": self.t0, "ms": elapsed * 1000, "depth": self.depth}
+        if self.meta:
+            event["meta"] = self.meta
+        if exc_type is not None:
+            # st.stop()/st.rerun() 도 예외로 빠져나오므로 오류로 단정하지 않고 이름만 남김
+            event["exit"] = exc_type.__name__
+        _record(event)
+
+
+def span(name: str, **meta: Any):
+    """구간 시간 측정 컨텍스트. 꺼져 있으면 공유 nullcontext 반환."""
+    if not ENABLED:
+        return _NULL_SPAN
+    return _Span(name, meta or None)
+
+
+def timed(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """함수 전체를 span 으로 감싸는 데코레이터 (이름 기본값: 모듈.함수)."""
+
+    def deco(fn: Callable) -> Callable:
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            with _Span(label, None):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return deco
+
+
+def count(name: str, n: float = 1) -> None:
+    """누적 카운터 증가 (처리 행 수 등). 트레이스에도 실행 번호와 함께 남김."""
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] += n
+    _record({"type": "counter", "name": name, "ts": time.perf_counter(), "value": n})
+
+
+def register_cache(name: str, cache: Any) -> None:
+    """hits/misses/maxsize 를 가진 캐시(LRUCache)를 적중률 보고 대상으로 등록."""
+    _caches[name] = cache
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    for name, cache in _caches.items():
+        hits, misses = cache.hits, cache.misses
+        total = hits + misses
+        out[name] = {
+            "size": len(cache),
+            "maxsize": cache.maxsize,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else None,
+        }
+    return out
+
+
+def begin_run(label: str = "script") -> Optional[int]:
+    """현재 스레드의 새 실행 번호를 발급하고 시작 시점의 캐시 상태를 기록. 꺼져 있으면 None."""
+    global _run_seq
+    if not ENABLED:
+        _local.run = None
+        return None
+    with _lock:
+        _run_seq += 1
+        run = _run_seq
+    _local.run = run
+    _local.depth = 0
+    _record({"type": "run", "name": label, "ts": time.perf_counter(), "caches": cache_stats()})
+    return run
+
+
+def current_run() -> Optional[int]:
+    return getattr(_local, "run", None)
+
+
+def events(run: Optional[int] = None) -> List[Dict[str, Any]]:
+    with _lock:
+        snapshot = list(_events)
+    if run is None:
+        return snapshot
+    return [e for e in snapshot if e["run"] == run]
+
+
+def previous_run(before: Optional[int] = None) -> Optional[int]:
+    """before 보다 앞선 가장 최근 실행 번호 (현재 스레드가 시작한 실행과 무관하게 전체 기준)."""
+    runs = [e["run"] for e in events() if e["type"] == "run" and (before is None or e["run"] < before)]
+    return max(runs) if runs else None
+
+
+def span_summary(run: Optional[int] = None) -> List[Dict[str, Any]]:
+    """span 이름별 호출 수/합계/평균/최대(ms), 합계 내림차순."""
+    agg: Dict[str, List[float]] = {}
+    for e in events(run):
+        if e["type"] == "span":
+            agg.setdefault(e["name"], []).append(e["ms"])
+    rows = [
+        {"구간": name, "호출": len(ms), "합계_ms": sum(ms), "평균_ms": sum(ms) / len(ms), "최대_ms": max(ms)}
+        for name, ms in agg.items()
+    ]
+    return sorted(rows, key=lambda r: -r["합계_ms"])
+
+
+def counters() -> Dict[str, float]:
+    with _lock:
+        return dict(_counters)
+
+
+def export_jsonl() -> bytes:
+    """보관 중인 이벤트 전체 + 현재 카운터/캐시 요약을 JSONL 바이트로."""
+    lines = [json.dumps(e, ensure_ascii=False, default=str) for e in events()]
+    lines.append(
+        json.dumps(
+            {"type": "summary", "ts": time.perf_counter(), "counters": counters(), "caches": cache_stats()},
+            ensure_ascii=False,
+        )
+    )
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def reset() -> None:
+    with _lock:
+        _events.clear()
+        _counters.clear()
@@ -0,0 +1,69 @@
+# utils/progress.py
+from typing import Any, Dict, Optional
+
+
+class ProgressTracker:
+    """저장 진행 현황. 저장 시점에만 갱신되고 조회는 O(1)/O(log n).
+
+    - saved: 행별 저장 여부 비트맵 (bytearray, 0/1)
+    - done: 저장된 행 수
+    - rank(idx): idx 까지 저장된 행 수 (Fenwick 트리) → 새_구분자 E### 번호
+    """
+
+    def __init__(self, n_rows: int, answers: Optional[Dict[int, Dict[str, Any]]] = None):
+        self.total = n_rows
+        self.saved = bytearray(n_rows)
+        self.done = 0
+        self._tree = [0] * (n_rows + 1)
+        for idx, ans in (answers or {}).items():
+            if ans.get("saved"):
+                self.mark_saved(idx)
+
+    def __len__(self) -> int:
+        return self.total
+
+    @property
+    def remaining(self) -> int:
+        return max(self.total - self.done, 0)
+
+    @property
+    def all_done(self) -> bool:
+        return self.total > 0 and self.done == self.total
+
+    def ratio(self) -> float:
+        return 0 if self.total == 0 else self.done / self.total
+
+    def is_saved(self, idx: int) -> bool:
+        return bool(self.saved[idx])
+
+    def mark_saved(self, idx: int) -> None:
+        if self.saved[idx]:
+            return
+        self.saved[idx] = 1
+        self.done += 1
+        i = idx + 1
+        while i <= self.total:
+            self._tree[i] += 1
+            i += i & -i
+
+    def rank(self, idx: int) -> int:
+        """0..idx 중 저장된 행 수."""
+        total = 0
+        i = idx + 1
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def new_id(self, idx: int) -> str:
+        """저장된 행의 새_구분자 (원본 순서 기준 E001, E002, ...). 미저장이면 ''."""
+        return f"E{self.rank(idx):03d}" if self.saved[idx] else ""
+
+    def next_unsaved(self, start: int) -> int:
+        """start 다음부터 (끝에서 처음으로 돌아가며) 첫 미저장 행. 없으면 -1."""
+        if self.done >= self.total:
+            return -1
+        i = self.saved.find(0, start + 1)
+        if i < 0:
+            i = self.saved.find(0, 0, start + 1)
+        return i
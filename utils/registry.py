@@ -0,0 +1,125 @@
+# utils/registry.py
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+# 프로세스 전체 데이터셋 캐시 상한 (참조 중인 데이터셋은 상한을 넘어도 유지)
+DATASET_CACHE_MAX_BYTES = int(os.environ.get("EMR_EVAL_DATASET_CACHE_MB", "2048")) * 1024 * 1024
+
+Loader = Callable[[], Tuple[pd.DataFrame, pd.DataFrame, Dict[str, Any]]]
+
+
+class DatasetHandle:
+    """세션이 들고 있는 공유 데이터셋 참조. 핸들이 사라지면 참조 수가 자동으로 줄어듦."""
+
+    __slots__ = ("digest", "df", "sections", "stats", "__weakref__")
+
+    def __init__(self, digest: str, df: pd.DataFrame, sections: pd.DataFrame, stats: Dict[str, Any]):
+        self.digest = digest
+        self.df = df
+        self.sections = sections
+        self.stats = stats
+
+
+class _Entry:
+    __slots__ = ("df", "sections", "stats", "nbytes", "refs", "last_used")
+
+    def __init__(self, df: pd.DataFrame, sections: pd.DataFrame, stats: Dict[str, Any]):
+        self.df = df
+        self.sections = sections
+        self.stats = stats
+        self.nbytes = int(df.memory_usage(deep=True).sum() + sections.memory_usage(deep=True).sum())
+        self.refs = 0
+        self.last_used = time.monotonic()
+
+
+class DatasetRegistry:
+    """내용 해시(digest) 기준으로 읽기 전용 데이터셋을 프로세스에서 한 번만 보관.
+
+    - acquire(): 없으면 loader 로 한 번만 읽고, 있으면 같은 객체를 공유
+    - 참조 수가 0 인 데이터셋만 LRU 순서로 내보내 max_bytes 이하로 유지
+    """
+
+    def __init__(self, max_bytes: int = DATASET_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: Dict[str, _Entry] = {}
+        # 핸들 정리(finalize)가 GC 중 임의 시점에 호출될 수 있어 재진입 가능 잠금 사용
+        self._lock = threading.RLock()
+        self._loading: Dict[str, threading.Lock] = {}
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._entries
+
+    def acquire(self, digest: str, loader: Loader) -> DatasetHandle:
+        with self._lock:
+            load_lock = self._loading.setdefault(digest, threading.Lock())
+        # 같은 파일을 여러 세션이 동시에 올려도 읽기/파싱은 한 번만
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(digest)
+            if entry is None:
+                try:
+                    df, sections, stats = loader()
+                except BaseException:
+                    # 읽기 실패(필수 컬럼 누락 등)한 digest 의 잠금이 계속 남지 않도록 정리
+                    with self._lock:
+                        if self._loading.get(digest) is load_lock:
+                            del self._loading[digest]
+                    raise
+                entry = _Entry(df, sections, stats)
+                with self._lock:
+                    self._entries[digest] = entry
+            with self._lock:
+                entry.refs += 1
+                entry.last_used = time.monotonic()
+                self._evict()
+        handle = DatasetHandle(digest, entry.df, entry.sections, entry.stats)
+        weakref.finalize(handle, self._release, digest)
+        return handle
+
+    def _release(self, digest: str) -> None:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and entry.refs > 0:
+                entry.refs -= 1
+                entry.last_used = time.monotonic()
+            self._evict()
+
+    def _evict(self) -> None:
+        total = sum(e.nbytes for e in self._entries.values())
+        if total <= self.max_bytes:
+            return
+        idle = sorted(
+            (e.last_used, d) for d, e in self._entries.items() if e.refs == 0
+        )
+        for _, digest in idle:
+            if total <= self.max_bytes:
+                break
+            total -= self._entries.pop(digest).nbytes
+            self._loading.pop(digest, None)
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "datasets": len(self._entries),
+                "bytes": sum(e.nbytes for e in self._entries.values()),
+                "max_bytes": self.max_bytes,
+                "refs": {d[:12]: e.refs for d, e in self._entries.items()},
+            }
+
+
+_registry: Optional[DatasetRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> DatasetRegistry:
+    """프로세스 전체에서 공유하는 DatasetRegistry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = DatasetRegistry()
+        return _registry
@@ -0,0 +1,258 @@
+# utils/search.py
+"""대화 스크립트 / 생성결과 / 파싱된 섹션 전문 검색용 문자 2-gram 역색인.
+
+- 정규화: 소문자 + 공백 제거 (한국어 띄어쓰기 차이와 무관하게 검색)
+- 색인 키: (문자1, 문자2) 2-gram. 문서 끝 문자는 (문자, 경계) 로 넣어 한 글자 검색도 색인으로 처리
+- 저장: 필드별로 정렬된 2-gram 코드 배열 + 오프셋 + 행 번호(uint32) 배열 (numpy, 행당 파이썬 객체 없음)
+- 질의: 공백으로 나눈 키워드를 모두 포함(AND). 키워드별 2-gram 목록을 짧은 것부터 교집합한 뒤
+  후보 행만 원문에서 부분 문자열로 확인 (결과 개수 제한까지만 확인하므로 흔한 단어도 빠름)
+"""
+import json
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from constants import PRIMARY_LABELS
+from utils import profiling
+from utils.cache import LRUCache
+from utils.ingest import OTHERS_COL, SECTION_COLUMNS
+
+DIALOGUE_COL = "대화 스크립트"
+GENERATED_COL = "생성결과"
+SCOPE_ALL = "전체"
+SEARCH_SCOPES: List[str] = [SCOPE_ALL, DIALOGUE_COL, GENERATED_COL] + SECTION_COLUMNS
+
+# 색인 생성 시 한 번에 처리하는 행 수 (임시 배열 크기 제한)
+BUILD_BATCH_ROWS = 5000
+# 프로세스에 보관하는 데이터셋별 색인 수
+INDEX_CACHE_SIZE = 4
+
+_CHAR_BITS = 21  # 유니코드 코드 포인트 최대 0x10FFFF
+_SECTIONS_FIELD = "섹션"
+_EMPTY = np.empty(0, dtype=np.uint32)
+
+
+def normalize_query_text(text: str) -> str:
+    return "".join(str(text).split()).lower()
+
+
+def _others_text(raw: str) -> str:
+    """섹션 테이블의 기타(JSON) → "라벨 내용" 이어 붙인 텍스트."""
+    if not raw:
+        return ""
+    return "\n".join(f"{label} {content}" for label, content in json.loads(raw))
+
+
+def _sorted_unique(keys: np.ndarray) -> np.ndarray:
+    """정렬 후 인접 중복 제거 (uint64 에서는 np.unique 의 해시 방식보다 빠름)."""
+    keys = np.sort(keys)
+    if len(keys) < 2:
+        return keys
+    return keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+
+
+class _FieldIndex:
+    """한 필드의 2-gram → 행 번호 목록 (CSR 형태)."""
+
+    __slots__ = ("codes", "offsets", "rows")
+
+    def __init__(self, texts: Sequence[str], n_rows: int):
+        doc_bits = max(1, (n_rows - 1).bit_length())
+        if 2 * _CHAR_BITS + doc_bits > 64:
+            raise ValueError(f"행 수가 너무 많습니다: {n_rows:,}")
+        mask = np.uint64((1 << doc_bits) - 1)
+        parts: List[np.ndarray] = []
+        for start in range(0, len(texts), BUILD_BATCH_ROWS):
+            batch = texts[start:start + BUILD_BATCH_ROWS]
+            # "\x00" 으로 문서를 구분: (문자, 경계) 는 유효, (경계, 문자) 는 버림
+            joined = "\x00".join(batch) + "\x00"
+            chars = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+            lengths = np.fromiter((len(t) + 1 for t in batch), dtype=np.int64, count=len(batch))
+            rows = np.repeat(np.arange(start, start + len(batch), dtype=np.uint64), lengths)
+            first, second = chars[:-1], chars[1:]
+            valid = first != 0
+            keys = (((first[valid] << np.uint64(_CHAR_BITS)) | second[valid]) << np.uint64(doc_bits)) | rows[:-1][valid]
+            parts.append(_sorted_unique(keys))
+        keys = np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.uint64)
+        codes_all = keys >> np.uint64(doc_bits)
+        self.rows = (keys & mask).astype(np.uint32)
+        self.codes, starts = np.unique(codes_all, return_index=True)
+        self.offsets = np.append(starts, len(self.rows)).astype(np.int64)
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.offsets.nbytes + self.rows.nbytes
+
+    def postings(self, code: int) -> np.ndarray:
+        i = int(np.searchsorted(self.codes, code))
+        if i < len(self.codes) and self.codes[i] == code:
+            return self.rows[self.offsets[i]:self.offsets[i + 1]]
+        return _EMPTY
+
+    def candidates(self, keyword: str, n_rows: int) -> np.ndarray:
+        """keyword(정규화됨)의 모든 2-gram 을 가진 행의 bool 마스크 (실제 포함 여부는 확인 전).
+
+        정렬 기반 교집합(np.intersect1d) 대신 행 수 크기의 마스크에 표시해 목록 길이에 선형으로 처리.
+        """
+        mask = np.zeros(n_rows, dtype=bool)
+        if len(keyword) == 1:
+            c = ord(keyword)
+            lo = int(np.searchsorted(self.codes, c << _CHAR_BITS))
+            hi = int(np.searchsorted(self.codes, (c + 1) << _CHAR_BITS))
+            mask[self.rows[self.offsets[lo]:self.offsets[hi]]] = True
+            return mask
+        grams = {(ord(a) << _CHAR_BITS) | ord(b) for a, b in zip(keyword, keyword[1:])}
+        lists = sorted((self.postings(g) for g in grams), key=len)
+        mask[lists[0]] = True
+        for p in lists[1:]:
+            if not len(p):
+                mask[:] = False
+                break
+            # 짧은 목록부터: 현재 후보 중 p 에 있는 것만 남김
+            keep = np.zeros(n_rows, dtype=bool)
+            keep[p] = True
+            mask &= keep
+        return mask
+
+
+class SearchResult(NamedTuple):
+    rows: np.ndarray  # 확인된 일치 행 (오름차순, 최대 limit 개)
+    candidates: int  # 2-gram 후보 수 (필터 적용 후)
+    complete: bool  # 후보를 모두 확인했으면 True (rows 가 전체 결과)
+    seconds: float
+
+
+class SearchIndex:
+    """데이터셋 하나의 전문 검색 색인. 원문은 복사하지 않고 df/sections 를 참조해 후보 확인에 사용."""
+
+    def __init__(self, df: pd.DataFrame, sections: Optional[pd.DataFrame] = None):
+        t0 = time.perf_counter()
+        self.n_rows = len(df)
+        self._df = df
+        self._sections = sections
+        self._fields: Dict[str, _FieldIndex] = {}
+        for col in (DIALOGUE_COL, GENERATED_COL):
+            texts = [normalize_query_text(v) for v in df[col].map(str)] if col in df.columns else [""] * len(df)
+            self._fields[col] = _FieldIndex(texts, self.n_rows)
+        if sections is not None:
+            # 섹션 사이도 경계 문자로 나눠 섹션을 넘는 2-gram 이 생기지 않게 함
+            cols = [sections[lb].tolist() for lb in PRIMARY_LABELS] + [[_others_text(r) for r in sections[OTHERS_COL]]]
+            texts = ["\x00".join(normalize_query_text(s) for s in parts) for parts in zip(*cols)]
+            self._fields[_SECTIONS_FIELD] = _FieldIndex(texts, self.n_rows)
+        self.build_seconds = time.perf_counter() - t0
+        profiling.count("search.indexed_rows", self.n_rows)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(f.nbytes for f in self._fields.values())
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "rows": self.n_rows,
+            "grams": {name: len(f.codes) for name, f in self._fields.items()},
+            "postings": sum(len(f.rows) for f in self._fields.values()),
+            "bytes": self.nbytes,
+            "seconds": self.build_seconds,
+        }
+
+    def _text(self, scope: str, row: int) -> str:
+        if scope in (DIALOGUE_COL, GENERATED_COL):
+            return normalize_query_text(self._df[scope].iat[row]) if scope in self._df.columns else ""
+        raw = self._sections[scope].iat[row]
+        return normalize_query_text(_others_text(raw) if scope == OTHERS_COL else raw)
+
+    def _scope_fields(self, scope: str) -> List[str]:
+        if scope == SCOPE_ALL:
+            return [DIALOGUE_COL, GENERATED_COL]
+        if scope in (DIALOGUE_COL, GENERATED_COL):
+            return [scope]
+        if scope in SECTION_COLUMNS and _SECTIONS_FIELD in self._fields:
+            return [scope]
+        raise ValueError(f"검색 범위를 지원하지 않습니다: {scope}")
+
+    def search(
+        self,
+        query: str,
+        scope: str = SCOPE_ALL,
+        saved: Optional[np.ndarray] = None,
+        want_saved: Optional[bool] = None,
+        limit: int = 50,
+    ) -> SearchResult:
+        """query 의 키워드를 모두 포함하는 행.
+
+        scope: SEARCH_SCOPES 중 하나 (섹션 이름이면 해당 섹션 안에서만)
+        saved/want_saved: 저장 여부 배열과 원하는 값 (None 이면 필터 없음)
+        """
+        t0 = time.perf_counter()
+        keywords = [normalize_query_text(k) for k in str(query).split()]
+        keywords = sorted({k for k in keywords if k}, key=len, reverse=True)
+        fields = self._scope_fields(scope)
+        if not keywords:
+            return SearchResult(_EMPTY, 0, True, time.perf_counter() - t0)
+
+        mask = np.ones(self.n_rows, dtype=bool)
+        index_names = [_SECTIONS_FIELD] if scope in SECTION_COLUMNS else fields
+        for kw in keywords:
+            found = self._fields[index_names[0]].candidates(kw, self.n_rows)
+            for name in index_names[1:]:
+                found |= self._fields[name].candidates(kw, self.n_rows)
+            mask &= found
+        if saved is not None and want_saved is not None:
+            mask &= np.asarray(saved, dtype=bool) == want_saved
+        cands = np.flatnonzero(mask)
+
+        # 후보를 원문에서 확인 (2-gram 이 떨어져 있거나 다른 필드에 나뉜 경우 제외)
+        hits: List[int] = []
+        checked = 0
+        for row in cands.tolist():
+            checked += 1
+            texts = [self._text(f, row) for f in fields]
+            if all(any(kw in t for t in texts) for kw in keywords):
+                hits.append(row)
+                if len(hits) >= limit:
+                    break
+        profiling.count("search.queries")
+        return SearchResult(
+            np.array(hits, dtype=np.int64), len(cands), checked == len(cands), time.perf_counter() - t0
+        )
+
+
+# ---------------- 데이터셋별 색인 (백그라운드 생성) ----------------
+_indexes = LRUCache(maxsize=INDEX_CACHE_SIZE)
+profiling.register_cache("search_index", _indexes)
+_building: Dict[str, threading.Thread] = {}
+_build_errors: Dict[str, BaseException] = {}
+_build_lock = threading.Lock()
+
+
+def _build(digest: str, df: pd.DataFrame, sections: Optional[pd.DataFrame]) -> None:
+    try:
+        with profiling.span("search.build", rows=len(df)):
+            _indexes.put(digest, SearchIndex(df, sections))
+    except BaseException as e:  # 색인 실패는 검색만 끄고 UI 에 표시
+        _build_errors[digest] = e
+    finally:
+        with _build_lock:
+            _building.pop(digest, None)
+
+
+def ensure_index(digest: str, df: pd.DataFrame, sections: Optional[pd.DataFrame] = None) -> Optional[SearchIndex]:
+    """digest 데이터셋의 색인. 준비 전이면 백그라운드 생성을 시작(이미 진행 중이면 그대로)하고 None."""
+    index = _indexes.get(digest)
+    if index is not None:
+        return index
+    with _build_lock:
+        if digest in _indexes:  # 확인 직후 생성이 끝난 경우
+            return _indexes.get(digest)
+        if digest not in _building and digest not in _build_errors:
+            thread = threading.Thread(target=_build, args=(digest, df, sections), name="search-index", daemon=True)
+            _building[digest] = thread
+            thread.start()
+    return None
+
+
+def build_error(digest: str) -> Optional[BaseException]:
+    return _build_errors.get(digest)
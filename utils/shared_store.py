@@ -0,0 +1,243 @@
+# utils/shared_store.py
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from constants import REQUIRED_COLS, OPTIONAL_COLS
+from utils.journal import decode_answer
+from utils.upload_cache import CACHE_ROOT
+
+SHARED_DB_PATH = os.environ.get("EMR_EVAL_SHARED_DB", os.path.join(CACHE_ROOT, "shared.sqlite3"))
+# 할당(lease) 유효 시간: 이 시간 동안 저장하지 않으면 다른 평가자에게 다시 배정됨
+LEASE_TTL_SEC = 15 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    digest  TEXT PRIMARY KEY,
+    name    TEXT NOT NULL,
+    n_rows  INTEGER NOT NULL,
+    columns TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    digest  TEXT NOT NULL,
+    idx     INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (digest, idx)
+);
+CREATE TABLE IF NOT EXISTS leases (
+    digest  TEXT NOT NULL,
+    idx     INTEGER NOT NULL,
+    session TEXT NOT NULL,
+    expires REAL NOT NULL,
+    PRIMARY KEY (digest, idx)
+);
+CREATE INDEX IF NOT EXISTS leases_session ON leases (digest, session);
+CREATE TABLE IF NOT EXISTS answers (
+    digest   TEXT NOT NULL,
+    idx      INTEGER NOT NULL,
+    payload  TEXT NOT NULL,
+    reviewer TEXT NOT NULL,
+    updated  REAL NOT NULL,
+    seq      INTEGER NOT NULL,
+    PRIMARY KEY (digest, idx)
+);
+CREATE INDEX IF NOT EXISTS answers_seq ON answers (digest, seq);
+"""
+
+
+class LeaseConflictError(RuntimeError):
+    """다른 평가자가 할당받아 작업 중인 행을 저장하려 할 때."""
+
+
+class SharedStore:
+    """여러 평가자 세션이 함께 쓰는 SQLite(WAL) 저장소.
+
+    - 데이터셋 행을 한 번만 저장하고 다른 세션은 digest 로 열기
+    - lease_next(): 아직 저장/할당되지 않은 행을 시간 제한 할당으로 배정
+    - save_answer(): 답변을 중앙에 저장하고 할당 해제
+    - changes_since(): 마지막 동기화 이후 바뀐 답변만 조회
+    """
+
+    def __init__(self, path: str = SHARED_DB_PATH, lease_ttl: float = LEASE_TTL_SEC):
+        self.path = path
+        self.lease_ttl = lease_ttl
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간 공유하지 않음 (Streamlit 세션별 스레드마다 1개)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 트랜잭션. BEGIN IMMEDIATE 로 쓰기 잠금을 먼저 잡아 할당 경합을 직렬화."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    # ---------------- 데이터셋 ----------------
+    def has_dataset(self, digest: str) -> bool:
+        row = self._conn().execute("SELECT 1 FROM datasets WHERE digest = ?", (digest,)).fetchone()
+        return row is not None
+
+    def register_dataset(self, digest: str, name: str, df: pd.DataFrame) -> None:
+        """데이터셋을 저장 (이미 있으면 아무것도 하지 않음)."""
+        if self.has_dataset(digest):
+            return
+        columns = [c for c in df.columns if c in REQUIRED_COLS or c in OPTIONAL_COLS]
+        datetime_cols = [c for c in columns if pd.api.types.is_datetime64_any_dtype(df[c])]
+        records = df[columns].astype(object).where(df[columns].notna(), None)
+        payloads = (
+            (digest, i, json.dumps(list(vals), ensure_ascii=False, default=str))
+            for i, vals in enumerate(records.itertuples(index=False, name=None))
+        )
+        with self._write() as conn:
+            if conn.execute("SELECT 1 FROM datasets WHERE digest = ?", (digest,)).fetchone():
+                return
+            conn.executemany("INSERT INTO rows (digest, idx, payload) VALUES (?, ?, ?)", payloads)
+            conn.execute(
+                "INSERT INTO datasets (digest, name, n_rows, columns, created) VALUES (?, ?, ?, ?, ?)",
+                (
+                    digest,
+                    name,
+                    len(df),
+                    json.dumps({"columns": columns, "datetime": datetime_cols}, ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+
+    def list_datasets(self) -> List[Tuple[str, str, int]]:
+        return self._conn().execute(
+            "SELECT digest, name, n_rows FROM datasets ORDER BY created DESC"
+        ).fetchall()
+
+    def load_frame(self, digest: str) -> pd.DataFrame:
+        conn = self._conn()
+        (columns_json,) = conn.execute(
+            "SELECT columns FROM datasets WHERE digest = ?", (digest,)
+        ).fetchone()
+        meta = json.loads(columns_json)
+        rows = conn.execute(
+            "SELECT payload FROM rows WHERE digest = ? ORDER BY idx", (digest,)
+        ).fetchall()
+        df = pd.DataFrame([json.loads(p) for (p,) in rows], columns=meta["columns"])
+        for c in meta["datetime"]:
+            df[c] = pd.to_datetime(df[c])
+        return df
+
+    # ---------------- 할당(lease) ----------------
+    def lease_next(self, digest: str, session: str) -> Optional[int]:
+        """이 세션에 배정된 행(없으면 새로 배정)의 번호. 남은 행이 없으면 None."""
+        now = time.time()
+        with self._write() as conn:
+            held = conn.execute(
+                "SELECT idx FROM leases WHERE digest = ? AND session = ? AND expires > ? "
+                "ORDER BY idx LIMIT 1",
+                (digest, session, now),
+            ).fetchone()
+            if held is None:
+                held = conn.execute(
+                    "SELECT r.idx FROM rows r "
+                    "WHERE r.digest = ? "
+                    "AND NOT EXISTS (SELECT 1 FROM answers a WHERE a.digest = r.digest AND a.idx = r.idx) "
+                    "AND NOT EXISTS (SELECT 1 FROM leases l WHERE l.digest = r.digest AND l.idx = r.idx "
+                    "                AND l.expires > ?) "
+                    "ORDER BY r.idx LIMIT 1",
+                    (digest, now),
+                ).fetchone()
+            if held is None:
+                return None
+            idx = int(held[0])
+            conn.execute(
+                "INSERT OR REPLACE INTO leases (digest, idx, session, expires) VALUES (?, ?, ?, ?)",
+                (digest, idx, session, now + self.lease_ttl),
+            )
+            return idx
+
+    def release(self, digest: str, idx: int, session: str) -> None:
+        with self._write() as conn:
+            conn.execute(
+                "DELETE FROM leases WHERE digest = ? AND idx = ? AND session = ?",
+                (digest, idx, session),
+            )
+
+    # ---------------- 답변 ----------------
+    def save_answer(self, digest: str, idx: int, answer: Dict[str, Any], session: str) -> None:
+        """답변 저장. 다른 세션이 유효한 할당을 갖고 있으면 LeaseConflictError."""
+        now = time.time()
+        payload = json.dumps(answer, ensure_ascii=False, separators=(",", ":"))
+        with self._write() as conn:
+            other = conn.execute(
+                "SELECT session FROM leases WHERE digest = ? AND idx = ? AND expires > ? AND session != ?",
+                (digest, idx, now, session),
+            ).fetchone()
+            if other is not None:
+                raise LeaseConflictError(f"{idx}번 행은 다른 평가자가 작업 중입니다.")
+            # 쓰기 잠금 안에서 순번을 매겨 changes_since 가 빠짐없이 따라갈 수 있게 함
+            (seq,) = conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) + 1 FROM answers WHERE digest = ?", (digest,)
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO answers (digest, idx, payload, reviewer, updated, seq) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (digest, idx, payload, session, now, seq),
+            )
+            conn.execute("DELETE FROM leases WHERE digest = ? AND idx = ?", (digest, idx))
+
+    def changes_since(self, digest: str, since: int) -> Tuple[Dict[int, Dict[str, Any]], int]:
+        """순번 since 이후 갱신된 답변과 다음 조회에 쓸 순번."""
+        rows = self._conn().execute(
+            "SELECT idx, payload, seq FROM answers WHERE digest = ? AND seq > ? ORDER BY seq",
+            (digest, since),
+        ).fetchall()
+        latest = since
+        changed: Dict[int, Dict[str, Any]] = {}
+        for idx, payload, seq in rows:
+            changed[int(idx)] = decode_answer(json.loads(payload))
+            latest = max(latest, int(seq))
+        return changed, latest
+
+    def counts(self, digest: str) -> Tuple[int, int]:
+        """(저장된 행 수, 현재 할당 중인 행 수)."""
+        conn = self._conn()
+        (done,) = conn.execute("SELECT COUNT(*) FROM answers WHERE digest = ?", (digest,)).fetchone()
+        (leased,) = conn.execute(
+            "SELECT COUNT(*) FROM leases WHERE digest = ? AND expires > ?", (digest, time.time())
+        ).fetchone()
+        return int(done), int(leased)
+
+
+_store: Optional[SharedStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> SharedStore:
+    """프로세스 전체에서 공유하는 SharedStore."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SharedStore()
+        return _store
@@ -0,0 +1,320 @@
+# utils/similarity.py
+import json
+import os
+import threading
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from constants import EMR_OTHERS_KEY, EMR_SECTIONS, EMR_TO_PRIMARY
+from utils import profiling
+from utils.cache import LRUCache, content_key
+from utils.ingest import OTHERS_COL
+from utils.text_utils import normalize_basic
+
+# (ROUGE-L F1, 토큰 F1, 정규화 편집거리). 양쪽 모두 비어 있으면 None
+Scores = Optional[Tuple[float, float, float]]
+
+METRIC_SUFFIXES: List[str] = ["ROUGE-L", "토큰F1", "편집거리"]
+SIMILARITY_COLUMNS: List[str] = [
+    f"{label}_{suffix}" for label, _ in EMR_SECTIONS for suffix in METRIC_SUFFIXES
+]
+
+# (정답, 생성) 내용 해시 → Scores
+SIMILARITY_CACHE_SIZE = 65536
+_score_cache = LRUCache(maxsize=SIMILARITY_CACHE_SIZE)
+profiling.register_cache("similarity", _score_cache)
+
+# 미계산 쌍이 이 개수 이상이면 일괄 계산을 프로세스 풀에서 병렬 처리
+PARALLEL_MIN_PAIRS = 2000
+CHUNK_SIZE = 500
+# 저장 시 백그라운드 계산에 쓰는 프로세스 수
+SIMILARITY_WORKERS = int(os.environ.get("EMR_EVAL_SIMILARITY_WORKERS", "1"))
+
+
+# ---------------- 지표 ----------------
+def _chars(text: str) -> str:
+    """문자 단위 비교용: 정규화 후 공백 제거."""
+    return "".join(normalize_basic(text).split())
+
+
+def _match_masks(a: str) -> Dict[str, int]:
+    """문자별로 a 에서 등장하는 위치 비트마스크."""
+    masks: Dict[str, int] = {}
+    bit = 1
+    for ch in a:
+        masks[ch] = masks.get(ch, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def lcs_length(a: str, b: str) -> int:
+    """최장 공통 부분열 길이 (비트 병렬, Allison-Dix/Hyyrö). O(len(b) × len(a)/워드)."""
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return 0
+    masks = _match_masks(a)
+    full = (1 << len(a)) - 1
+    v = full
+    for ch in b:
+        u = v & masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+    return len(a) - v.bit_count()
+
+
+def edit_distance(a: str, b: str) -> int:
+    """레벤슈타인 거리 (비트 병렬, Myers/Hyyrö)."""
+    if len(a) < len(b):
+        a, b = b, a
+    m = len(a)
+    if not b:
+        return m
+    masks = _match_masks(a)
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    for ch in b:
+        eq = masks.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score
+
+
+def rouge_l(gold: str, pred: str) -> float:
+    """문자 단위 ROUGE-L F1."""
+    if not gold or not pred:
+        return 0.0
+    lcs = lcs_length(gold, pred)
+    if lcs == 0:
+        return 0.0
+    precision, recall = lcs / len(pred), lcs / len(gold)
+    return 2 * precision * recall / (precision + recall)
+
+
+def token_f1(gold: str, pred: str) -> float:
+    """공백 기준 토큰 F1 (중복 토큰은 개수만큼 일치로 인정)."""
+    g, p = normalize_basic(gold).split(), normalize_basic(pred).split()
+    if not g or not p:
+        return 0.0
+    common = sum((Counter(g) & Counter(p)).values())
+    if common == 0:
+        return 0.0
+    precision, recall = common / len(p), common / len(g)
+    return 2 * precision * recall / (precision + recall)
+
+
+def normalized_edit_distance(gold: str, pred: str) -> float:
+    """편집거리 / 긴 쪽 길이 (0 = 동일, 1 = 전혀 다름)."""
+    longest = max(len(gold), len(pred))
+    return edit_distance(gold, pred) / longest if longest else 0.0
+
+
+def _score_uncached(gold: str, pred: str) -> Scores:
+    g, p = _chars(gold), _chars(pred)
+    if not g and not p:
+        return None
+    return (rouge_l(g, p), token_f1(gold, pred), normalized_edit_distance(g, p))
+
+
+def _score_chunk(pairs: List[Tuple[str, str]]) -> List[Scores]:
+    """(정답, 생성) 묶음 채점 (워커 프로세스용)."""
+    return [_score_uncached(g, p) for g, p in pairs]
+
+
+# ---------------- 섹션 대응 ----------------
+def reference_sections(primary: Dict[str, str], others: Sequence[Tuple[str, str]]) -> Dict[str, str]:
+    """parse_clova_sections 결과 → EMR 정답 섹션 키별 비교 대상 텍스트."""
+    refs: Dict[str, str] = {}
+    for key, labels in EMR_TO_PRIMARY.items():
+        parts = [primary.get(lb, "") for lb in labels]
+        if key == EMR_OTHERS_KEY:
+            parts += [content for _, content in others]
+        refs[key] = "\n".join(p for p in parts if p)
+    return refs
+
+
+def reference_columns(sections: pd.DataFrame, rows: np.ndarray) -> Dict[str, List[str]]:
+    """업로드 시 만든 섹션 테이블(ingest)의 rows 행 → EMR 정답 섹션 키별 비교 대상 텍스트 열."""
+    picked = sections.iloc[rows]
+    refs: Dict[str, List[str]] = {}
+    for key, labels in EMR_TO_PRIMARY.items():
+        cols = [picked[lb].tolist() for lb in labels]
+        if key == EMR_OTHERS_KEY:
+            cols.append(
+                ["\n".join(content for _, content in json.loads(raw)) if raw else "" for raw in picked[OTHERS_COL]]
+            )
+        refs[key] = ["\n".join(p for p in parts if p) for parts in zip(*cols)]
+    return refs
+
+
+# ---------------- 일괄 채점 ----------------
+def score_pairs(pairs: Sequence[Tuple[str, str]], workers: Optional[int] = None) -> List[Scores]:
+    """(정답, 생성) 목록 채점. 캐시에 없는 고유 쌍만 계산하고, 많으면 프로세스 풀 사용."""
+    keys = [content_key(g, p) for g, p in pairs]
+    results: Dict[str, Scores] = {}
+    todo: Dict[str, Tuple[str, str]] = {}
+    for key, pair in zip(keys, pairs):
+        if key in results or key in todo:
+            continue
+        if key in _score_cache:
+            results[key] = _score_cache.get(key)
+        else:
+            todo[key] = pair
+
+    profiling.count("similarity.pairs", len(pairs))
+    if todo:
+        profiling.count("similarity.scored", len(todo))
+        todo_keys = list(todo)
+        todo_pairs = [todo[k] for k in todo_keys]
+        n_workers = workers if workers is not None else (os.cpu_count() or 1)
+        if n_workers > 1 and len(todo_pairs) >= PARALLEL_MIN_PAIRS:
+            chunks = [todo_pairs[i:i + CHUNK_SIZE] for i in range(0, len(todo_pairs), CHUNK_SIZE)]
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                scored = [s for part in pool.map(_score_chunk, chunks) for s in part]
+        else:
+            scored = _score_chunk(todo_pairs)
+        for key, s in zip(todo_keys, scored):
+            _score_cache.put(key, s)
+            results[key] = s
+    return [results[k] for k in keys]
+
+
+@profiling.timed("similarity.frame")
+def similarity_frame(
+    gold: Dict[str, Sequence[str]], refs: Dict[str, Sequence[str]], workers: Optional[int] = None
+) -> pd.DataFrame:
+    """섹션 키별 정답/생성 텍스트 열 → SIMILARITY_COLUMNS 표 (비교할 내용이 없으면 NaN)."""
+    n = len(next(iter(gold.values()))) if gold else 0
+    pairs: List[Tuple[str, str]] = []
+    for _, key in EMR_SECTIONS:
+        pairs.extend(zip(map(str, gold[key]), map(str, refs[key])))
+    scored = score_pairs(pairs, workers)
+
+    missing = (np.nan,) * len(METRIC_SUFFIXES)
+    values = np.array([s if s is not None else missing for s in scored], dtype=float)
+    # (섹션, 행, 지표) → (행, 섹션 × 지표)
+    values = values.reshape(len(EMR_SECTIONS), n, len(METRIC_SUFFIXES)).transpose(1, 0, 2)
+    return pd.DataFrame(values.reshape(n, len(SIMILARITY_COLUMNS)), columns=SIMILARITY_COLUMNS)
+
+
+def clear_similarity_cache() -> None:
+    _score_cache.clear()
+
+
+# ---------------- 저장 시 백그라운드 채점 ----------------
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=max(1, SIMILARITY_WORKERS))
+        return _executor
+
+
+def _discard_executor(broken: ProcessPoolExecutor) -> None:
+    """워커가 죽어 망가진 풀은 버리고 다음 제출 때 새로 만듦."""
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit(pairs: List[Tuple[str, str]]) -> Tuple[ProcessPoolExecutor, Future]:
+    """(사용한 풀, Future). 풀이 이미 망가져 있으면 새 풀로 한 번 더 시도."""
+    executor = _get_executor()
+    try:
+        return executor, executor.submit(_score_chunk, pairs)
+    except BrokenExecutor:
+        _discard_executor(executor)
+        executor = _get_executor()
+        return executor, executor.submit(_score_chunk, pairs)
+
+
+class RowScorer:
+    """저장된 행의 섹션별 유사도를 백그라운드 프로세스에서 계산하고 결과를 보관.
+
+    submit() 은 바로 반환하며, 완료되면 결과를 행 번호별로 저장하고 내용 해시 캐시에도 넣어
+    이후 다운로드 시 일괄 채점이 다시 계산하지 않도록 함.
+    계산이 실패하거나 취소되면 계산 중 표시를 끝내고 error(idx) 로 사유를 남김.
+    """
+
+    def __init__(self) -> None:
+        self._results: Dict[int, Dict[str, Scores]] = {}
+        self._pending: Dict[int, Future] = {}
+        self._errors: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, idx: int, emr: Dict[str, str], refs: Dict[str, str]) -> None:
+        keys = [key for _, key in EMR_SECTIONS]
+        pairs = [(str(emr.get(key, "")), refs.get(key, "")) for key in keys]
+        hashes = [content_key(g, p) for g, p in pairs]
+        if all(h in _score_cache for h in hashes):
+            with self._lock:
+                self._pending.pop(idx, None)
+                self._errors.pop(idx, None)
+                self._results[idx] = {k: _score_cache.get(h) for k, h in zip(keys, hashes)}
+            return
+        try:
+            executor, future = _submit(pairs)
+        except Exception as e:  # 풀을 만들 수 없어도 저장은 계속되도록 실패만 기록
+            with self._lock:
+                self._pending.pop(idx, None)
+                self._errors[idx] = str(e) or type(e).__name__
+            return
+
+        def _done(f: Future) -> None:
+            error = "취소됨" if f.cancelled() else f.exception()
+            if error is None:
+                scored = f.result()
+                for h, s in zip(hashes, scored):
+                    _score_cache.put(h, s)
+            elif isinstance(error, BrokenExecutor):
+                _discard_executor(executor)
+            with self._lock:
+                # 같은 행을 다시 저장했다면 최신 제출분만 반영
+                if self._pending.get(idx) is not f:
+                    return
+                del self._pending[idx]
+                if error is None:
+                    self._results[idx] = dict(zip(keys, scored))
+                else:
+                    self._results.pop(idx, None)
+                    self._errors[idx] = str(error) or type(error).__name__
+
+        with self._lock:
+            self._pending[idx] = future
+            self._errors.pop(idx, None)
+        future.add_done_callback(_done)
+
+    def get(self, idx: int) -> Optional[Dict[str, Scores]]:
+        with self._lock:
+            if idx in self._pending:
+                return None
+            return self._results.get(idx)
+
+    def pending(self, idx: int) -> bool:
+        with self._lock:
+            return idx in self._pending
+
+    def error(self, idx: int) -> Optional[str]:
+        """마지막 계산이 실패했으면 사유, 아니면 None."""
+        with self._lock:
+            return self._errors.get(idx)
@@ -1,115 +1,155 @@
 # utils/text_utils.py
 import re
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 
 BULLET_CHARS_CLASS = r"\-–—•·∙◦\*●○◉"
 
+# ---------------- 모듈 로드 시 1회 컴파일 ----------------
+_SPEAKER_RE = re.compile(r"(참석자([1-5]))\s*[:：]?", flags=re.MULTILINE)
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
+_BULLET_AFTER_PUNCT_RE = re.compile(
+    fr"(?:(?<=^)|(?<=\n)|(?<=[.!?…\)]))\s*[{BULLET_CHARS_CLASS}]\s+(?=\S)"
+)
+_BULLET_INLINE_RE = re.compile(fr"\s[{BULLET_CHARS_CLASS}]\s")
+_BULLET_LINE_HEAD_RE = re.compile(fr"^(?:[{BULLET_CHARS_CLASS}])\s*", flags=re.MULTILINE)
+_BULLET_ITEM_RE = re.compile(r"(?:^|\n)-\s*(.+?)(?=(?:\n- )|$)", re.DOTALL)
+_BULLET_PREFIX_RE = re.compile(fr"^[{BULLET_CHARS_CLASS}]\s*")
+_SENTENCE_END = (".", "!", "?", "…", ")")
+
+_ROS_SPLIT_LINES_RE = re.compile(r"[;，、]+")
+_ROS_SPLIT_ITEMS_RE = re.compile(r"\s*,\s*")
+_ROS_ITEM_RE = re.compile(r"([A-Za-z가-힣/\s]+?)\s*:\s*([+-])$")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+
+_DASH_LINE_RE = re.compile(r"^-\s+")
+_DASH_PREFIX_RE = re.compile(r"^-\s*")
+
+
+def escape_html(s: str) -> str:
+    return (
+        s.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#39;")
+    )
+
+
 def fmt_dialogue(txt: str) -> str:
     """'참석자1~5' 기준으로 단락 분리 + 굵게 표시."""
     if not txt:
         return ""
-    pat = re.compile(r"(참석자([1-5]))\s*[:：]?", flags=re.MULTILINE)
-    txt = pat.sub(r"\n\n**\1**: ", txt)
+    txt = _SPEAKER_RE.sub(r"\n\n**\1**: ", txt)
     return txt.replace("\n", "  \n")
 
 def normalize_basic(s: str) -> str:
     if not s:
         return ""
+    # 고정 문자열 치환은 str.replace(C 루프)가 정규식보다 빠름
     s = s.replace("\\n", "\n").replace("/n", "\n")
     s = s.replace("\r\n", "\n").replace("\r", "\n")
     s = "\n".join(ln.strip() for ln in s.split("\n"))
-    s = re.sub(r"\n{3,}", "\n\n", s)
+    s = _MULTI_NEWLINE_RE.sub("\n\n", s)
     s = s.replace("\u200b", "").replace("\u00a0", " ")
     return s.strip()
 
 def apply_bullet_newline(text: str) -> str:
     """dash 등으로 이어진 내용을 불릿 단위로 정리."""
+    if not text:
+        return ""
+    return _bullet_newline(normalize_basic(text))
+
+def normalize_dash_bullets(text: str) -> str:
+    """줄단위로 이미 '-' 가 붙어 있는 경우 정리."""
+    if not text:
+        return ""
+    return _dash_bullets(normalize_basic(text))
+
+def format_ros(text: str) -> str:
+    """계통문진: '항목: +/-' 형식 정리."""
     if not text:
         return ""
     t = normalize_basic(text)
-    # 문장부호/시작 뒤에 오는 불릿 기호들을 표준화
-    t = re.sub(
-        fr"(?:(?<=^)|(?<=\n)|(?<=[.!?…\)]))\s*[{BULLET_CHARS_CLASS}]\s+(?=\S)",
-        "\n- ",
-        t,
+    lines = [ln.strip() for ln in _ROS_SPLIT_LINES_RE.sub("\n", t).split("\n") if ln.strip()]
+    parsed: List[str] = []
+    for ln in lines:
+        ln = _BULLET_PREFIX_RE.sub("", ln).strip()
+        for p in _ROS_SPLIT_ITEMS_RE.split(ln):
+            m = _ROS_ITEM_RE.match(p.strip())
+            if m:
+                name = _WHITESPACE_RUN_RE.sub(" ", m.group(1)).strip()
+                parsed.append(f"{name}: {m.group(2)}")
+    if parsed:
+        return "\n".join(parsed)
+    # 이미 정규화된 t 를 그대로 넘겨 재정규화하지 않음
+    return _dash_bullets(t)
+
+def list_items(text: str) -> Tuple[List[str], bool]:
+    """bullets_to_html_list 가 표시하는 항목들 (불릿 목록이면 True, 아니면 줄 단위로 False)."""
+    if not text:
+        return [], False
+    lines = [ln for ln in text.split("\n") if ln.strip()]
+    bullet_lines = [_DASH_PREFIX_RE.sub("", ln).strip() for ln in lines if _DASH_LINE_RE.match(ln)]
+    if bullet_lines:
+        return bullet_lines, True
+    return lines, False
+
+def _flag_attr(note: Optional[str]) -> str:
+    return f" class='ungrounded' title='{escape_html(note)}'" if note else ""
+
+def bullets_to_html_list(text: str, notes: Optional[Sequence[Optional[str]]] = None) -> str:
+    """'- '로 시작하는 줄들을 HTML <ul><li> 로 변환.
+    notes: list_items 순서대로 항목별 표시 문구. 값이 있는 항목은 근거 부족(ungrounded)으로 강조
+    """
+    if not text:
+        return "<div></div>"
+    items, is_list = list_items(text)
+    if notes is None:
+        notes = [None] * len(items)
+
+    if is_list:
+        body = "".join(f"<li{_flag_attr(n)}>{escape_html(item)}</li>" for item, n in zip(items, notes))
+        return f"<ul>{body}</ul>"
+    safe = "<br>".join(
+        f"<span{_flag_attr(n)}>{escape_html(ln)}</span>" if n else escape_html(ln) for ln, n in zip(items, notes)
     )
+    return f"<div>{safe}</div>"
+
+
+# ---------------- 정규화된 텍스트(t) 전용 내부 단계 ----------------
+def _bullet_newline(t: str) -> str:
+    # 문장부호/시작 뒤에 오는 불릿 기호들을 표준화
+    t = _BULLET_AFTER_PUNCT_RE.sub("\n- ", t)
     # 가운데 ' - ' 패턴도 불릿으로
-    t = re.sub(fr"\s[{BULLET_CHARS_CLASS}]\s", "\n- ", t)
+    t = _BULLET_INLINE_RE.sub("\n- ", t)
     # 줄 맨 앞 불릿 통일
-    t = re.sub(fr"^(?:[{BULLET_CHARS_CLASS}])\s*", "- ", t, flags=re.MULTILINE)
+    t = _BULLET_LINE_HEAD_RE.sub("- ", t)
 
-    bullet_pat = re.compile(r"(?:^|\n)-\s*(.+?)(?=(?:\n- )|$)", re.DOTALL)
-    items = [m.group(1).strip() for m in bullet_pat.finditer(t)]
+    items = [m.group(1).strip() for m in _BULLET_ITEM_RE.finditer(t)]
     if not items:
         return t.strip()
 
     out_lines: List[str] = []
     for item in items:
-        if not re.search(r"[.!?…)]$", item):
+        if not item.endswith(_SENTENCE_END):
             item += "."
         out_lines.append(f"- {item}")
     return "\n".join(out_lines)
 
-def normalize_dash_bullets(text: str) -> str:
-    """줄단위로 이미 '-' 가 붙어 있는 경우 정리."""
-    if not text:
-        return ""
-    t = normalize_basic(text)
+def _dash_bullets(t: str) -> str:
     lines = [ln for ln in t.split("\n") if ln.strip()]
     out: List[str] = []
     had_bullet = False
     for ln in lines:
-        ln2 = re.sub(fr"^[{BULLET_CHARS_CLASS}]\s*", "", ln).strip()
+        ln2 = _BULLET_PREFIX_RE.sub("", ln).strip()
         if ln2 != ln:
             had_bullet = True
-        if not re.search(r"[.!?…)]$", ln2):
+        if not ln2.endswith(_SENTENCE_END):
             ln2 += "."
         out.append(f"- {ln2}")
     if out:
         return "\n".join(out)
     if not had_bullet:
-        return apply_bullet_newline(text)
+        return _bullet_newline(t)
     return ""
-
-def format_ros(text: str) -> str:
-    """계통문진: '항목: +/-' 형식 정리."""
-    if not text:
-        return ""
-    t = normalize_basic(text)
-    t = re.sub(r"[;，、]+", "\n", t)
-    lines = [ln.strip() for ln in t.split("\n") if ln.strip()]
-    parsed: List[str] = []
-    for ln in lines:
-        ln = re.sub(fr"^[{BULLET_CHARS_CLASS}]\s*", "", ln).strip()
-        parts = re.split(r"\s*,\s*", ln)
-        for p in parts:
-            m = re.match(r"([A-Za-z가-힣/\s]+?)\s*:\s*([+-])$", p.strip())
-            if m:
-                name = re.sub(r"\s+", " ", m.group(1)).strip()
-                sign = m.group(2)
-                parsed.append(f"{name}: {sign}")
-    if parsed:
-        return "\n".join(parsed)
-    return normalize_dash_bullets(text)
-
-def bullets_to_html_list(text: str) -> str:
-    """'- '로 시작하는 줄들을 HTML <ul><li> 로 변환."""
-    if not text:
-        return "<div></div>"
-    lines = [ln for ln in text.split("\n") if ln.strip()]
-    bullet_lines = [re.sub(r"^-\s*", "", ln).strip() for ln in lines if re.match(r"^-\s+", ln)]
-
-    def esc(s: str) -> str:
-        return (
-            s.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&#39;")
-        )
-
-    if bullet_lines:
-        items = "".join(f"<li>{esc(item)}</li>" for item in bullet_lines)
-        return f"<ul>{items}</ul>"
-    safe = "<br>".join(esc(ln) for ln in lines)
-    return f"<div>{safe}</div>"
\ No newline at end of file
@@ -0,0 +1,161 @@
+# utils/upload_cache.py
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from constants import LABEL_PATTERN_STR
+from utils.ingest import SECTION_COLUMNS
+from utils.parser import PARSER_VERSION
+
+try:  # pyarrow 는 streamlit 의존성으로 함께 설치되지만, 없으면 캐시만 끔
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:
+    pa = None
+    pa_ipc = None
+
+CACHE_ROOT = os.environ.get("EMR_EVAL_CACHE_DIR", ".cache")
+UPLOAD_CACHE_DIR = os.path.join(CACHE_ROOT, "uploads")
+# 업로드 캐시 전체 크기 상한 (넘으면 오래 쓰지 않은 항목부터 삭제)
+UPLOAD_CACHE_MAX_BYTES = int(os.environ.get("EMR_EVAL_UPLOAD_CACHE_MB", "2048")) * 1024 * 1024
+# 캐시 파일 구성이 바뀌면 올림
+CACHE_FORMAT_VERSION = 1
+DIGEST_CHUNK_BYTES = 1024 * 1024
+
+_DATA_FILE = "data.arrow"
+_SECTIONS_FILE = "sections.arrow"
+
+
+def file_digest(file) -> str:
+    """업로드 파일 내용의 sha256 (1MB 단위 스트리밍, 읽은 뒤 처음으로 되돌림)."""
+    h = hashlib.sha256()
+    file.seek(0)
+    while True:
+        chunk = file.read(DIGEST_CHUNK_BYTES)
+        if not chunk:
+            break
+        h.update(chunk)
+    file.seek(0)
+    return h.hexdigest()
+
+
+def cache_enabled() -> bool:
+    return pa is not None
+
+
+def schema_tag() -> str:
+    """캐시 디렉터리 이름: 캐시 형식 + 파서 버전 + 섹션 컬럼/라벨 패턴 지문.
+
+    파서나 섹션 구성이 바뀌면 다른 디렉터리를 쓰므로 예전 파싱 결과를 읽지 않음.
+    """
+    schema = "\x00".join([LABEL_PATTERN_STR, *SECTION_COLUMNS])
+    fingerprint = hashlib.sha256(schema.encode("utf-8")).hexdigest()[:12]
+    return f"v{CACHE_FORMAT_VERSION}-p{PARSER_VERSION}-{fingerprint}"
+
+
+def _entry_dir(digest: str) -> str:
+    return os.path.join(UPLOAD_CACHE_DIR, schema_tag(), digest)
+
+
+def load_cached(digest: str) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """digest 에 해당하는 (원본 df, 섹션 테이블). 없거나 읽기 실패 시 None."""
+    if not cache_enabled():
+        return None
+    base = _entry_dir(digest)
+    data_path = os.path.join(base, _DATA_FILE)
+    sections_path = os.path.join(base, _SECTIONS_FILE)
+    if not (os.path.exists(data_path) and os.path.exists(sections_path)):
+        return None
+    try:
+        tables = _read_arrow(data_path), _read_arrow(sections_path)
+    except (pa.ArrowException, OSError):
+        return None
+    try:
+        # 마지막 사용 시각 (크기 상한 정리 시 오래 쓰지 않은 항목부터 삭제)
+        os.utime(base)
+    except OSError:
+        pass
+    return tables
+
+
+def store_cached(digest: str, df: pd.DataFrame, sections: pd.DataFrame) -> bool:
+    """파싱 결과를 Arrow IPC 파일로 저장. 저장하지 못하면 False (앱 동작에는 영향 없음)."""
+    if not cache_enabled():
+        return False
+    base = _entry_dir(digest)
+    try:
+        os.makedirs(base, exist_ok=True)
+        _write_arrow(os.path.join(base, _DATA_FILE), df)
+        _write_arrow(os.path.join(base, _SECTIONS_FILE), sections)
+    except (pa.ArrowException, OSError):
+        # 예: 한 컬럼에 숫자/문자가 섞여 Arrow 로 변환할 수 없는 경우
+        shutil.rmtree(base, ignore_errors=True)
+        return False
+    prune_cache(keep=digest)
+    return True
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def prune_cache(max_bytes: int = UPLOAD_CACHE_MAX_BYTES, keep: Optional[str] = None) -> int:
+    """다른 스키마의 캐시는 모두 삭제하고, 현재 스키마 캐시는 max_bytes 이하가 될 때까지
+    마지막 사용이 오래된 항목부터 삭제 (keep digest 는 남김). 삭제한 항목 수 반환."""
+    if not os.path.isdir(UPLOAD_CACHE_DIR):
+        return 0
+    removed = 0
+    current = schema_tag()
+    for name in os.listdir(UPLOAD_CACHE_DIR):
+        if name != current:
+            shutil.rmtree(os.path.join(UPLOAD_CACHE_DIR, name), ignore_errors=True)
+            removed += 1
+    root = os.path.join(UPLOAD_CACHE_DIR, current)
+    entries: List[Tuple[float, int, str]] = []
+    for name in os.listdir(root) if os.path.isdir(root) else []:
+        path = os.path.join(root, name)
+        try:
+            entries.append((os.path.getmtime(path), _dir_size(path), name))
+        except OSError:
+            continue
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        if name == keep:
+            continue
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def _read_arrow(path: str) -> pd.DataFrame:
+    with pa.memory_map(path, "r") as source:
+        return pa_ipc.open_file(source).read_all().to_pandas()
+
+
+def _write_arrow(path: str, df: pd.DataFrame) -> None:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        with pa.OSFile(tmp, "wb") as sink:
+            with pa_ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        # 쓰기 도중 중단돼도 깨진 캐시가 남지 않도록 원자적 교체
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)